@@ -16,8 +16,23 @@ import blf
 import bgl
 import gpu
 import math as m
+from contextlib import contextmanager
+import hashlib
+import json
+import time
+import numpy as np
+from bpy.app.handlers import persistent
+from mathutils import Matrix
+from mathutils.bvhtree import BVHTree
 from gpu_extras.batch import batch_for_shader
 from . import addon_updater_ops
+from . import bake_cache
+from . import uv_raster
+from . import preflight
+from . import bake_journal
+from . import cost_model
+from . import background_bake
+from . import mesh_merge
 
 class AssetifyUpdaterPanel(bpy.types.Panel):
     """Panel to demo popup notice and ignoring functionality"""
@@ -127,17 +142,66 @@ bake_progress = 0
 total_bake_items = 0
 draw_handler = None
 
+# Predicted time of the objects left in the running bake, for the progress overlay
+bake_eta = cost_model.EtaTracker()
+
+# File in Blender's config folder recording the timings of every bake, which calibrate the cost model
+TIMINGS_FILE = "bake_timings.jsonl"
+
 # Initialize the font
 font_id = 0  # default Blender font
 
-# Global list to track the duplicated objects
-duplicated_objects = []
+# Maps a shared-asset key to the converted game object that owns the shared data, and its transform
+shared_asset_owners = {}
+
+# Maps a topology/material bucket to the converted owners and their geometry, for transformed duplicates
+geometric_asset_owners = {}
+
+# Datablocks changed since the last conversion, as (id_type, name) keys, and objects that only moved
+dirty_ids = set()
+moved_ids = set()
+dirty_tracking_suspended = False
+
+# Content-addressed store of baked maps: pixel hash -> saved file path
+baked_texture_store = {}
+
+# Maps (asset name, map type) to the file holding its baked map, which may be shared, see asset_name
+baked_texture_paths = {}
+
+# Maps a baked map file to the name of the image datablock holding its current pixels
+baked_texture_images = {}
 
-# Global list to map original and game-ready collections
-collection_mapping = []
+# Atlas of every object baked into one in the current bake run, by object name
+atlas_members = {}
 
-# Global variable to track if assets are swapped
-assets_swapped = False
+# Material of every atlas built in the current bake run, by atlas name
+atlas_materials = {}
+
+# Originals left out of the current conversion by the preflight check, by session_uid
+preflight_skipped = set()
+
+# Problems found by the last preflight check, as (object name, severity, message)
+preflight_results = []
+
+# Evaluated geometry of originals with modifiers, read before their evaluation was suspended, by session_uid
+original_geometry = {}
+
+# Maps baked from the materials
+BAKE_MAP_ITEMS = [
+    ('BaseColor', "Base Color", "Diffuse color of the materials"),
+    ('Roughness', "Roughness", "Roughness of the materials"),
+    ('Metallic', "Metallic", "Metallic map, written as black"),
+    ('Normal', "Normal", "Tangent-space normal map"),
+    ('Alpha', "Alpha", "Alpha of the materials, baked as emission"),
+]
+
+# Maps computed from the mesh by the UV rasterizer, without Cycles
+RASTER_MAP_ITEMS = [
+    ('Curvature', "Curvature", "Convex edges bright, cavities dark, flat areas mid-grey"),
+    ('Position', "Position", "Object-space position across the bounding box, as RGB gradients"),
+    ('MaterialID', "Material ID", "A flat color per material slot"),
+    ('ObjectNormal', "Object Normal", "Object-space shading normals of the mesh"),
+]
 
 class AssetifyBakeSettings(bpy.types.PropertyGroup):
     bake_resolution: bpy.props.EnumProperty(
@@ -166,6 +230,96 @@ class AssetifyBakeSettings(bpy.types.PropertyGroup):
         default="//baked_textures",  # Blender default (relative to .blend file)
         subtype='DIR_PATH'  # This enables the directory selection UI
     )
+
+    use_bake_cache: bpy.props.BoolProperty(
+        name="Use Bake Cache",
+        description="Reuse maps baked earlier, on this or another machine, when the mesh, materials "
+                    "and bake settings are unchanged",
+        default=True
+    )
+
+    bake_cache_folder: bpy.props.StringProperty(
+        name="Bake Cache Folder",
+        description="Local or shared folder holding the bake cache",
+        default="//bake_cache",
+        subtype='DIR_PATH'
+    )
+
+    bake_cache_size: bpy.props.IntProperty(
+        name="Bake Cache Size (MB)",
+        description="Least recently used maps are removed once the cache grows past this size",
+        default=4096,
+        min=1
+    )
+
+    atlas_mode: bpy.props.EnumProperty(
+        name="Atlas",
+        description="Bake groups of objects into shared texture atlases with a single material",
+        items=[('OFF', "Off", "Every object gets its own textures and material"),
+               ('COLLECTION', "Per Collection", "Objects in the same collection share one atlas and one material")],
+        default='OFF'
+    )
+
+    atlas_resolution: bpy.props.EnumProperty(
+        name="Atlas Resolution",
+        description="Resolution of the texture atlases",
+        items=[('1024', "1024x1024", ""),
+               ('2048', "2048x2048", ""),
+               ('4096', "4096x4096", ""),
+               ('8192', "8192x8192", "")],
+        default='4096'
+    )
+
+    bake_in_background: bpy.props.BoolProperty(
+        name="Bake in Background",
+        description="Bake a snapshot of the file in a separate Blender process and apply the textures as they "
+                    "are done, so Blender stays usable while baking",
+        default=False
+    )
+
+    use_bake_journal: bpy.props.BoolProperty(
+        name="Resume Interrupted Bakes",
+        description="Keep a journal next to the bake folder, so a bake interrupted by a crash resumes "
+                    "without redoing finished maps",
+        default=True
+    )
+
+    retry_quarantined: bpy.props.BoolProperty(
+        name="Retry Failed Objects",
+        description="Bake objects again that failed in an earlier run, even though they haven't changed",
+        default=False
+    )
+
+    bake_maps: bpy.props.EnumProperty(
+        name="Baked Maps",
+        description="Maps baked from the materials of every game asset",
+        items=BAKE_MAP_ITEMS,
+        options={'ENUM_FLAG'},
+        default={item[0] for item in BAKE_MAP_ITEMS}
+    )
+
+    raster_maps: bpy.props.EnumProperty(
+        name="Mesh Maps",
+        description="Extra maps computed from the mesh alone by rasterizing its GameUV layout, "
+                    "without a Cycles bake",
+        items=RASTER_MAP_ITEMS,
+        options={'ENUM_FLAG'},
+        default=set()
+    )
+
+    reproject_image_textures: bpy.props.BoolProperty(
+        name="Reproject Image Textures",
+        description="Build base color, roughness and normal maps of materials that are just image textures "
+                    "on a Principled BSDF by resampling the images into the new UV layout, without Cycles",
+        default=True
+    )
+
+    rasterize_simple_normals: bpy.props.BoolProperty(
+        name="Rasterize Flat Normal Maps",
+        description="Write the normal map directly instead of baking it when no material adds "
+                    "normal detail, since the baked result would be flat",
+        default=True
+    )
     
     target_collection: bpy.props.PointerProperty(
         name="Target Collection",
@@ -173,8 +327,135 @@ class AssetifyBakeSettings(bpy.types.PropertyGroup):
         type=bpy.types.Collection
     )
 
+    preflight_mode: bpy.props.EnumProperty(
+        name="Preflight Check",
+        description="Validate the meshes of the target collection before converting them",
+        items=[('OFF', "Off", "Don't validate meshes before converting"),
+               ('WARN', "Warn", "Report problem objects and convert them anyway"),
+               ('SKIP', "Skip", "Report problem objects and leave objects with errors out of the conversion")],
+        default='WARN'
+    )
+
+    preflight_max_triangles: bpy.props.IntProperty(
+        name="Max Triangles",
+        description="Objects with more triangles than this are reported as errors by the preflight check",
+        default=500000,
+        min=1
+    )
+
+    pass_through_game_ready: bpy.props.BoolProperty(
+        name="Keep Game-Ready Objects",
+        description="Keep the UVs and image-textured material of objects that are already game-ready, "
+                    "and copy their textures to the bake folder instead of unwrapping and baking them",
+        default=True
+    )
+
+    merge_by_collection: bpy.props.BoolProperty(
+        name="Merge by Collection",
+        description="Merge the converted meshes of each game-ready collection into a single mesh, "
+                    "with one UV unwrap and one set of baked textures",
+        default=False
+    )
+
+    lod_count: bpy.props.IntProperty(
+        name="LOD Levels",
+        description="Number of decimated LODs (LOD1 and up) built for every game asset after converting and "
+                    "baking. They keep the materials and UV layout of LOD0 and use its baked textures. Each game asset "
+                    "becomes '<name>_LOD0' in an FBX LOD group empty named after it, next to its LODs",
+        default=0,
+        min=0,
+        max=7
+    )
+
+    lod_ratio: bpy.props.FloatProperty(
+        name="LOD Triangle Ratio",
+        description="Triangle count of each LOD relative to the previous one",
+        default=0.5,
+        min=0.01,
+        max=0.99,
+        subtype='FACTOR'
+    )
+
+    high_to_low: bpy.props.BoolProperty(
+        name="Bake High to Low",
+        description="Decimate converted meshes over the triangle budget, and bake their maps from the "
+                    "full-detail mesh onto the decimated one with Selected to Active and an automatic cage",
+        default=False
+    )
+
+    triangle_budget: bpy.props.IntProperty(
+        name="Triangle Budget",
+        description="Triangle count the converted meshes are decimated to for the high to low bake",
+        default=20000,
+        min=100
+    )
+
+    share_duplicate_assets: bpy.props.BoolProperty(
+        name="Share Duplicate Assets",
+        description="Convert and bake objects that share mesh data and materials only once, "
+                    "and let every duplicate reuse the result",
+        default=True
+    )
+
+    suspend_source_evaluation: bpy.props.BoolProperty(
+        name="Suspend Original Evaluation",
+        description="Exclude the target collection from the view layer while converting, so only the "
+                    "object being processed is evaluated. The original state is restored afterwards",
+        default=True
+    )
+
+    detect_transformed_duplicates: bpy.props.BoolProperty(
+        name="Detect Transformed Duplicates",
+        description="Find meshes that are identical up to rotation, translation and uniform scale, "
+                    "and turn them into instances of one converted asset",
+        default=True
+    )
+
+class AssetifyAssetPair(bpy.types.PropertyGroup):
+    """An original object and the game asset converted from it."""
+    original: bpy.props.PointerProperty(type=bpy.types.Object)
+    game_asset: bpy.props.PointerProperty(type=bpy.types.Object)
+
+    # Transform of the game asset relative to the original, as a flattened row-major 4x4 matrix
+    offset: bpy.props.FloatVectorProperty(size=16)
+
+    needs_bake: bpy.props.BoolProperty(default=True)
+
+    # The original already had clean UVs and an image-textured material, which are kept as they are
+    game_ready: bpy.props.BoolProperty(default=False)
+
+class AssetifyCollectionPair(bpy.types.PropertyGroup):
+    """An original collection and the game-ready collection created for it."""
+    original_collection: bpy.props.PointerProperty(type=bpy.types.Collection)
+    game_ready_collection: bpy.props.PointerProperty(type=bpy.types.Collection)
+    original_name: bpy.props.StringProperty()
+    game_ready_name: bpy.props.StringProperty()
+
+class AssetifyRegistry(bpy.types.PropertyGroup):
+    """Original/game-asset pairs of a scene, saved with the .blend file and restored by undo."""
+    assets: bpy.props.CollectionProperty(type=AssetifyAssetPair)
+
+    # The first entry is the target collection and the root game-ready collection
+    collections: bpy.props.CollectionProperty(type=AssetifyCollectionPair)
+
+    assets_swapped: bpy.props.BoolProperty(default=False)
+
+    # Settings of the last bake, a change means everything needs baking again
+    last_bake_resolution: bpy.props.StringProperty()
+    last_bake_samples: bpy.props.IntProperty()
+    last_raster_maps: bpy.props.StringProperty()
+    last_bake_maps: bpy.props.StringProperty()
+    last_atlas: bpy.props.StringProperty()
+
+    # Datablocks changed since the last conversion, saved as JSON so they survive a reload
+    dirty_state: bpy.props.StringProperty()
+
 def set_active_3d_view():
     """Ensures the 3D View is active to display the overlay."""
+    # Nothing to show without a window, e.g. in background mode
+    if bpy.context.screen is None:
+        return None
+
     for area in bpy.context.screen.areas:
         if area.type == 'VIEW_3D':
             for region in area.regions:
@@ -196,6 +477,11 @@ def draw_baking_progress():
 
     # Set the progress text
     progress_text = f"Baking Progress: {bake_progress}/{total_bake_items} Objects"
+
+    # Add the estimated time left, predicted by the cost model and corrected as objects finish
+    eta = bake_eta.remaining(time.time())
+    if eta is not None:
+        progress_text += f" - about {cost_model.format_duration(eta)} left"
     
     # Draw the text
     blf.position(font_id, x_pos, y_pos, 0)
@@ -223,8 +509,8 @@ def start_bake_progress_display():
     """Registers the draw handler to display baking progress."""
     global draw_handler
 
-    # Ensure that it's registered once and only in VIEW_3D
-    if draw_handler is None:
+    # Ensure that it's registered once and only in VIEW_3D, and never in background mode
+    if draw_handler is None and not bpy.app.background:
         # Register the drawing function to the SpaceView3D draw handler
         draw_handler = bpy.types.SpaceView3D.draw_handler_add(draw_baking_progress, (), 'WINDOW', 'POST_PIXEL')
         debug_print("Started bake progress display.")
@@ -238,6 +524,11 @@ def stop_bake_progress_display():
         draw_handler = None
         debug_print("Stopped bake progress display.")
 
+def redraw_progress():
+    """Redraws the windows so the progress overlay is up to date. Does nothing in background mode."""
+    if not bpy.app.background:
+        bpy.ops.wm.redraw_timer(type='DRAW_WIN_SWAP', iterations=1)
+
 def debug_print(message):
     """Helper function to print debug information."""
     print(f"[DEBUG]: {message}")
@@ -379,6 +670,11 @@ def add_realize_instances_node(geometry_node_modifier):
     previous_node_output = original_link.from_socket
     debug_print(f"Found link from {previous_node_output.node.name} to Group Output.")
 
+    # Converting again must not stack another Realize Instances node on the shared node group
+    if previous_node_output.node.bl_idname == "GeometryNodeRealizeInstances":
+        debug_print(f"Node tree {node_tree.name} already realizes instances.")
+        return
+
     # Remove the existing link
     node_tree.links.remove(original_link)
     debug_print("Removed the existing link to Group Output node.")
@@ -417,7 +713,7 @@ def realize_geometry_node_instances(obj):
             if modifier.type == 'NODES':  # Check if it's a Geometry Nodes modifier
                 debug_print(f"Found Geometry Nodes modifier: {modifier.name}")
                 add_realize_instances_node(modifier)
-    
+
     # If the object is a curve and should be converted to a mesh:
     if obj.type == 'CURVE':
         debug_print(f"Converting curve object {obj.name} to mesh.")
@@ -430,109 +726,865 @@ def realize_geometry_node_instances(obj):
         bpy.ops.object.convert(target='MESH')  # Convert mesh to a final mesh after realizing instances
         debug_print(f"Mesh object {obj.name} converted to final mesh.")
 
-    # After converting and processing geometry nodes, apply UV unwrap
-    smart_uv_project(obj)
+# Material names taken during a conversion, so unique names are computed without asking Blender
+reserved_material_names = None
+
+# Longest ID name Blender accepts, in bytes
+MAX_ID_NAME_LENGTH = 63
+
+def allocate_material_name(base_name, taken_names):
+    """
+    Returns base_name, or base_name with the lowest free '.001' style suffix, the way Blender would
+    name it, and reserves the name in taken_names.
+    """
+    base_name = base_name.encode()[:MAX_ID_NAME_LENGTH].decode(errors='ignore')
+    name = base_name
+    suffix = 0
+    while name in taken_names:
+        suffix += 1
+        suffix_text = f".{suffix:03d}"
+        name = base_name.encode()[:MAX_ID_NAME_LENGTH - len(suffix_text)].decode(errors='ignore') + suffix_text
+    taken_names.add(name)
+    return name
 
 def make_materials_unique(obj):
     """
-    Make materials unique by using Blender's 'Make Single User' operation, 
+    Make materials unique by giving every material slot its own copy of its material,
     ensuring the material assignments to mesh parts are preserved.
-    Afterward, rename the materials to be unique to the object.
+    Material.copy() can't take a name, so each copy first gets Blender's automatic '.001' name and is then
+    renamed once to '{obj.name}_Mat_{index}', with the final unique name computed up front instead of
+    being resolved by Blender through further renames.
     """
-    if not obj.data.materials:
+    if not any(slot.material for slot in obj.material_slots):
         debug_print(f"{obj.name} has no materials to make unique.")
         return
 
-    # Make a single user copy of the object's materials to ensure they're independent of other objects
-    bpy.context.view_layer.objects.active = obj  # Ensure the object is active
-    bpy.ops.object.make_single_user(object=True, obdata=True, material=True, animation=False)
+    taken_names = reserved_material_names
+    if taken_names is None:
+        taken_names = set(bpy.data.materials.keys())
 
-    # Rename materials to make them unique for this object
-    for index, mat in enumerate(obj.data.materials):
-        if mat:  # Ensure the material exists
-            old_name = mat.name
-            mat.name = f"{obj.name}_Mat_{index + 1}"  # Rename material with the object's name and index
-            debug_print(f"Renamed material '{old_name}' to '{mat.name}' for {obj.name}")
+    for index, slot in enumerate(obj.material_slots):
+        mat = slot.material
+        if mat is None:
+            continue
+        new_mat = mat.copy()
+        new_mat.name = allocate_material_name(f"{obj.name}_Mat_{index + 1}", taken_names)
+        slot.material = new_mat  # Follows the slot's link, object or data
+        debug_print(f"Copied material '{mat.name}' to '{new_mat.name}' for {obj.name}")
 
     debug_print(f"All materials for {obj.name} have been made unique and renamed.")
 
-def process_object(obj):
+def process_object(obj, game_ready=False, unwrap=True):
     """
     Processes the object: applies geometry nodes, converts curves to meshes, unwraps UVs,
-    makes materials unique, and renames materials.
+    and gives it its own uniquely named materials.
+    Game-ready objects keep their geometry and UVs and only get their own materials.
+    Objects that will be merged are unwrapped after merging instead.
     """
-    # Handle geometry nodes and UV project
-    realize_geometry_node_instances(obj)
+    if not game_ready:
+        # Handle geometry nodes and UV project
+        realize_geometry_node_instances(obj)
+        if unwrap:
+            smart_uv_project(obj)
 
     # Make the materials unique for the duplicated object
     make_materials_unique(obj)
 
-    # Rename materials to match object name
-    rename_materials(obj)
+# Nodes allowed in the material of a game-ready object
+_GAME_READY_NODES = {'OUTPUT_MATERIAL', 'BSDF_PRINCIPLED', 'TEX_IMAGE', 'NORMAL_MAP', 'UVMAP', 'TEX_COORD',
+                     'FRAME', 'REROUTE'}
 
-def rename_materials(obj):
+def texture_file_path(image):
+    """Returns the absolute path of the file behind an image, or None if it isn't a file on disk."""
+    if image is None or image.source != 'FILE' or image.packed_file or not image.filepath:
+        return None
+    path = bpy.path.abspath(image.filepath, library=image.library)
+    return path if os.path.isfile(path) else None
+
+def is_game_ready(obj):
     """
-    Renames all materials of the object to match the object's name with an increment number.
+    Classifies an original object as already game-ready: a plain mesh with UVs and a single material
+    that is just image textures on a Principled BSDF, all on one UV layer and backed by files on disk.
+    Such objects don't need to be unwrapped or baked.
     """
-    if not obj.data.materials:
-        debug_print(f"{obj.name} has no materials.")
+    if obj.type != 'MESH' or obj.modifiers or not obj.data.uv_layers or len(obj.material_slots) != 1:
+        return False
+    mat = obj.material_slots[0].material
+    if mat is None or not mat.use_nodes:
+        return False
+
+    default_uv_layer = next((layer.name for layer in obj.data.uv_layers if layer.active_render), None)
+    used_uv_layers = set()
+    has_principled = False
+    for node in mat.node_tree.nodes:
+        if node.type not in _GAME_READY_NODES or node.mute:
+            return False
+        if node.type == 'BSDF_PRINCIPLED':
+            has_principled = True
+        elif node.type == 'TEX_IMAGE':
+            if texture_file_path(node.image) is None or node.projection != 'FLAT':
+                return False
+        elif node.type == 'UVMAP':
+            used_uv_layers.add(node.uv_map or default_uv_layer)
+        elif node.type == 'NORMAL_MAP':
+            if node.space != 'TANGENT':
+                return False
+            used_uv_layers.add(node.uv_map or default_uv_layer)
+
+    # Every texture must be placed by the same existing UV layer
+    for node in mat.node_tree.nodes:
+        if node.type != 'TEX_IMAGE':
+            continue
+        vector_link = linked_source(node.inputs['Vector'])
+        if vector_link is None or vector_link.from_node.type == 'TEX_COORD':
+            if vector_link and vector_link.from_socket.name != 'UV':
+                return False
+            used_uv_layers.add(default_uv_layer)
+    if len(used_uv_layers) > 1 or any(obj.data.uv_layers.get(name or "") is None for name in used_uv_layers):
+        return False
+    return has_principled
+
+def _signature_value(value):
+    """Converts a modifier setting into a comparable string."""
+    if isinstance(value, bpy.types.ID):
+        return value.name_full
+    if hasattr(value, "to_list"):
+        return repr(value.to_list())
+    if hasattr(value, "__len__") and not isinstance(value, str):
+        try:
+            return repr(tuple(value))
+        except TypeError:
+            pass
+    return repr(value)
+
+def modifier_signature(obj):
+    """
+    Builds a hashable description of the object's modifier stack, including Geometry Nodes inputs,
+    so objects that share data but evaluate differently are never treated as the same asset.
+    """
+    signature = []
+    for modifier in obj.modifiers:
+        settings = [modifier.type]
+        for prop in modifier.bl_rna.properties:
+            if prop.is_readonly or prop.identifier in {'name', 'show_expanded', 'is_active'}:
+                continue
+            settings.append((prop.identifier, _signature_value(getattr(modifier, prop.identifier))))
+        # Geometry Nodes inputs are stored as ID properties on the modifier
+        for key in modifier.keys():
+            settings.append((key, _signature_value(modifier[key])))
+        signature.append(tuple(settings))
+    return tuple(signature)
+
+def shared_asset_key(obj):
+    """
+    Returns the key used to group objects that would convert to identical game assets:
+    the same mesh/curve datablock, the same material set and the same modifier stack.
+    """
+    materials = tuple(slot.material.name_full if slot.material else "" for slot in obj.material_slots)
+    return (obj.type, obj.data.name_full, materials, modifier_signature(obj))
+
+def mesh_geometry(mesh):
+    """
+    Returns the vertex positions (object space) and polygon topology of a mesh
+    as NumPy arrays, pulled in bulk with foreach_get.
+    """
+    coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", coords)
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    loop_vertices = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_vertices)
+
+    return coords.reshape(-1, 3).astype(np.float64), loop_totals, loop_vertices, len(mesh.edges)
+
+def evaluated_geometry(obj, depsgraph=None):
+    """Returns the geometry of an object with its modifiers applied, like mesh_geometry."""
+    if depsgraph is None:
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+    eval_obj = obj.evaluated_get(depsgraph)
+    mesh = eval_obj.to_mesh()
+    try:
+        return mesh_geometry(mesh)
+    finally:
+        eval_obj.to_mesh_clear()
+
+def capture_original_geometry(target_collection):
+    """
+    Reads the evaluated geometry of the originals with modifiers, so transformed duplicates are still
+    detected for them once their evaluation is suspended. Plain meshes are read from their data as needed.
+    """
+    settings = bpy.context.scene.mossify_bake_settings
+    original_geometry.clear()
+    if not (settings.share_duplicate_assets and settings.detect_transformed_duplicates):
         return
 
-    debug_print(f"Renaming materials for {obj.name}")
-    for index, material in enumerate(obj.data.materials):
-        new_material_name = f"{obj.name}_Mat_{index+1}"
-        material.name = new_material_name
-        debug_print(f"Renamed material to {new_material_name}")
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    for obj in target_collection.all_objects:
+        if obj.session_uid in original_geometry or not transformed_duplicate_candidate(obj) or not obj.modifiers:
+            continue
+        original_geometry[obj.session_uid] = evaluated_geometry(obj, depsgraph)
+
+def transformed_duplicate_candidate(obj):
+    """Checks whether the geometry of an original can be compared before it is converted."""
+    # Geometry Nodes output is only realized during conversion, so it can't be compared beforehand
+    return obj.type == 'MESH' and not any(modifier.type == 'NODES' for modifier in obj.modifiers)
+
+def geometric_fingerprint(coords, loop_totals, loop_vertices, edge_count):
+    """
+    Computes a fingerprint that is invariant to rotation, translation and uniform scale:
+    the topology counts and connectivity hash, plus the PCA spectrum of the normalised vertex cloud.
+    Returns (bucket_key, spectrum).
+    """
+    topology_hash = hashlib.sha1(loop_totals.tobytes() + loop_vertices.tobytes()).hexdigest()
+    bucket_key = (len(coords), edge_count, len(loop_totals), len(loop_vertices), topology_hash)
 
-def duplicate_objects_in_collection(collection, new_collection, mapping_info):
+    if len(coords) == 0:
+        return bucket_key, np.zeros(3)
+
+    centered = coords - coords.mean(axis=0)
+    radius = np.sqrt((centered ** 2).sum(axis=1).mean())
+    if radius == 0.0:
+        return bucket_key, np.zeros(3)
+
+    # Eigenvalues of the covariance of the unit-radius cloud describe its shape independent of pose
+    normalized = centered / radius
+    spectrum = np.linalg.eigvalsh(normalized.T @ normalized / len(normalized))
+    return bucket_key, spectrum
+
+def similarity_transform(source, target, tolerance=1e-4):
+    """
+    Solves target = s * R @ source + t for index-aligned vertex clouds (Umeyama's method).
+    Returns a 4x4 Matrix, or None if the clouds differ or are only related by a reflection.
+    """
+    source_mean = source.mean(axis=0)
+    target_mean = target.mean(axis=0)
+    source_centered = source - source_mean
+    target_centered = target - target_mean
+
+    source_variance = (source_centered ** 2).sum(axis=1).mean()
+    if source_variance == 0.0:
+        return None
+
+    covariance = target_centered.T @ source_centered / len(source)
+    u, singular_values, vt = np.linalg.svd(covariance)
+    if np.linalg.det(u) * np.linalg.det(vt) < 0.0:
+        debug_print("Geometry only matches as a mirror image, not instancing it.")
+        return None
+
+    rotation = u @ vt
+    scale = singular_values.sum() / source_variance
+    translation = target_mean - scale * rotation @ source_mean
+
+    # Verify the fit, relative to the size of the target
+    residual = target - (scale * source @ rotation.T + translation)
+    target_radius = np.sqrt((target_centered ** 2).sum(axis=1).mean())
+    if np.abs(residual).max() > tolerance * max(target_radius, 1e-12):
+        return None
+
+    matrix = np.identity(4)
+    matrix[:3, :3] = scale * rotation
+    matrix[:3, 3] = translation
+    return Matrix(matrix.tolist())
+
+def find_transformed_duplicate(obj):
+    """
+    Looks for an already converted asset whose geometry matches the object up to rotation,
+    translation and uniform scale. Returns (owner, transform, geometry_entry); owner and transform
+    are None if there is no match, and geometry_entry can be registered once the object is converted.
     """
-    Recursively duplicates all objects inside a collection and its subcollections,
+    if not transformed_duplicate_candidate(obj):
+        return None, None, None
+
+    # Modifier results are read before the originals' evaluation is suspended, or evaluated now
+    if not obj.modifiers:
+        geometry = mesh_geometry(obj.data)
+    elif obj.session_uid in original_geometry:
+        geometry = original_geometry[obj.session_uid]
+    elif not bpy.context.scene.mossify_bake_settings.suspend_source_evaluation:
+        geometry = evaluated_geometry(obj)
+    else:
+        return None, None, None
+    coords, loop_totals, loop_vertices, edge_count = geometry
+    if len(coords) == 0:
+        return None, None, None
+
+    bucket_key, spectrum = geometric_fingerprint(coords, loop_totals, loop_vertices, edge_count)
+    materials = tuple(slot.material.name_full if slot.material else "" for slot in obj.material_slots)
+    bucket_key = bucket_key + (materials,)
+
+    for owner, owner_coords, owner_spectrum in geometric_asset_owners.get(bucket_key, []):
+        if not np.allclose(spectrum, owner_spectrum, atol=1e-5):
+            continue
+        transform = similarity_transform(owner_coords, coords)
+        if transform is not None:
+            return owner, transform, None
+
+    return None, None, (bucket_key, coords, spectrum)
+
+def register_geometric_owner(geometry_entry, owner):
+    """Registers a converted game asset as the instance source for later transformed duplicates."""
+    bucket_key, coords, spectrum = geometry_entry
+    geometric_asset_owners.setdefault(bucket_key, []).append((owner, coords, spectrum))
+
+def link_shared_game_asset(obj, owner, new_collection, transform=None):
+    """
+    Creates the game asset for a duplicate by reusing the converted data of the group owner,
+    skipping conversion, UV unwrapping and material processing.
+    The optional transform maps the owner's object space onto the duplicate's object space.
+    """
+    if obj.type == 'MESH':
+        new_obj = obj.copy()
+        new_obj.modifiers.clear()  # Modifiers are already applied to the owner's data
+        new_obj.data = owner.data
+    else:
+        # Curves can't take mesh data, so build a new mesh object at the same transform
+        new_obj = bpy.data.objects.new(obj.name, owner.data)
+        new_obj.matrix_world = obj.matrix_world
+    new_obj.name = obj.name + "_gameasset"
+    new_collection.objects.link(new_obj)
+    if transform is not None:
+        new_obj.matrix_world = obj.matrix_world @ transform
+    debug_print(f"Linked {new_obj.name} to the shared game asset data of {owner.name}")
+    return new_obj
+
+def convert_object(obj, new_collection, settings):
+    """
+    Creates the game asset for one original object in new_collection: either links the converted data
+    of an identical asset, or duplicates the object and processes it (geometry, UV, materials).
+    Returns the new game asset, or None if the object failed the preflight check.
+    """
+    if obj.session_uid in preflight_skipped:
+        debug_print(f"Skipping {obj.name}, it failed the preflight check.")
+        return None
+
+    game_ready = settings.pass_through_game_ready and is_game_ready(obj)
+    share_key = shared_asset_key(obj) if settings.share_duplicate_assets else None
+    owner, transform = shared_asset_owners.get(share_key, (None, None))
+    if owner:
+        new_obj = link_shared_game_asset(obj, owner, new_collection, transform)
+        register_game_asset(obj, new_obj, game_ready)
+        return new_obj
+
+    # Realized copies have their own data, so compare the geometry itself
+    geometry_entry = None
+    if settings.share_duplicate_assets and settings.detect_transformed_duplicates:
+        owner, transform, geometry_entry = find_transformed_duplicate(obj)
+        if owner:
+            new_obj = link_shared_game_asset(obj, owner, new_collection, transform)
+            register_game_asset(obj, new_obj, game_ready)
+            if share_key:
+                shared_asset_owners[share_key] = (owner, transform)
+            return new_obj
+
+    new_obj = obj.copy()
+    new_obj.data = obj.data.copy()
+    new_obj.name = obj.name + "_gameasset"
+    new_collection.objects.link(new_obj)
+    debug_print(f"Duplicated object: {new_obj.name}")
+
+    # Track the duplicated objects
+    register_game_asset(obj, new_obj, game_ready)
+
+    # Set as active object and process it (geometry, UV, materials)
+    bpy.context.view_layer.objects.active = new_obj
+    new_obj.select_set(True)
+    process_object(new_obj, game_ready, unwrap=not settings.merge_by_collection)
+    new_obj.select_set(False)
+
+    if share_key:
+        shared_asset_owners[share_key] = (new_obj, None)
+    if geometry_entry:
+        register_geometric_owner(geometry_entry, new_obj)
+    return new_obj
+
+def link_if_missing(collection, obj=None, child=None):
+    """Links an object or a child collection into a collection unless it is already there."""
+    if obj is not None and collection.objects.get(obj.name) != obj:
+        collection.objects.link(obj)
+    if child is not None and collection.children.get(child.name) != child:
+        collection.children.link(child)
+
+def duplicate_objects_in_collection(collection, new_collection, collection_pair=None):
+    """
+    Duplicates all objects inside a collection and its subcollections,
     links them to a new collection, supports mesh and curve objects, applies modifiers,
     geometry nodes, UV unwrapping, and renames materials.
+    Objects sharing data, materials and modifiers are converted once and share the result.
+    The hierarchy is walked iteratively, and every collection and object is converted only once:
+    a collection linked under several parents, or an object in several collections, gets a single
+    game-ready counterpart that is linked into every matching game-ready parent.
+    """
+    settings = bpy.context.scene.mossify_bake_settings
+    registry = get_registry()
+
+    # Game-ready collections by session_uid of their original, including earlier conversions
+    game_collections = {pair.original_collection.session_uid: pair.game_ready_collection
+                        for pair in registry.collections
+                        if pair.original_collection is not None and pair.game_ready_collection is not None}
+    game_collections[collection.session_uid] = new_collection
+
+    stack = [(collection, new_collection)]
+    while stack:
+        original_collection, game_collection = stack.pop()
+
+        for obj in original_collection.objects:
+            if obj.type not in {'MESH', 'CURVE'}:
+                continue
+            pair = find_asset_pair(registry, obj)
+            if pair and pair.game_asset:
+                # Already converted through another collection
+                link_if_missing(game_collection, obj=pair.game_asset)
+                continue
+            convert_object(obj, game_collection, settings)
+
+        # Reversed so subcollections are processed in their original order
+        for subcollection in reversed(original_collection.children):
+            existing = game_collections.get(subcollection.session_uid)
+            if existing:
+                link_if_missing(game_collection, child=existing)
+                continue
+
+            new_subcollection_name = subcollection.name + "_gameasset"
+            new_subcollection = bpy.data.collections.new(new_subcollection_name)
+            game_collection.children.link(new_subcollection)
+            debug_print(f"Duplicated subcollection: {new_subcollection.name}")
+
+            # Store mapping information for subcollections
+            add_collection_pair(subcollection, new_subcollection)
+            game_collections[subcollection.session_uid] = new_subcollection
+            stack.append((subcollection, new_subcollection))
+
+# === Persistent Asset Registry ===
+
+# Runtime lookup tables for the registry of each scene, rebuilt after undo, redo and file load
+_registry_index = {}
+
+def get_registry(scene=None):
+    """Returns the Assetify registry of the scene (the active scene by default)."""
+    return (scene or bpy.context.scene).assetify_registry
+
+def invalidate_registry_index():
+    """Drops the lookup tables, they are rebuilt on the next lookup."""
+    _registry_index.clear()
+
+def registry_index(registry):
+    """Returns the lookup tables of a registry: session_uid of originals and game assets to pair indices."""
+    key = registry.id_data.session_uid
+    index = _registry_index.get(key)
+    if index is None:
+        index = {'original': {}, 'game_asset': {}}
+        for i, pair in enumerate(registry.assets):
+            if pair.original:
+                index['original'][pair.original.session_uid] = i
+            if pair.game_asset:
+                index['game_asset'].setdefault(pair.game_asset.session_uid, []).append(i)
+        _registry_index[key] = index
+    return index
+
+def find_asset_pair(registry, original):
+    """Returns the registry pair of an original object, or None if it has no game asset."""
+    for attempt in range(2):
+        i = registry_index(registry)['original'].get(original.session_uid)
+        if i is not None and i < len(registry.assets) and registry.assets[i].original == original:
+            return registry.assets[i]
+        # The table may be stale after the registry was edited elsewhere, rebuild it once
+        invalidate_registry_index()
+    return None
+
+def find_pairs_of_game_asset(registry, game_asset):
+    """Returns the registry pairs whose game asset is the given object."""
+    for attempt in range(2):
+        indices = registry_index(registry)['game_asset'].get(game_asset.session_uid, [])
+        pairs = [registry.assets[i] for i in indices
+                 if i < len(registry.assets) and registry.assets[i].game_asset == game_asset]
+        if len(pairs) == len(indices):
+            return pairs
+        invalidate_registry_index()
+    return []
+
+def game_assets(registry):
+    """Returns every game asset of the registry once, in conversion order."""
+    assets = []
+    seen = set()
+    for pair in registry.assets:
+        if pair.game_asset and pair.game_asset.session_uid not in seen:
+            seen.add(pair.game_asset.session_uid)
+            assets.append(pair.game_asset)
+    return assets
+
+def add_collection_pair(original_collection, game_ready_collection):
+    """Records an original collection and the game-ready collection created for it."""
+    collection_pair = get_registry().collections.add()
+    collection_pair.original_collection = original_collection
+    collection_pair.game_ready_collection = game_ready_collection
+    collection_pair.original_name = original_collection.name
+    collection_pair.game_ready_name = game_ready_collection.name
+    return collection_pair
+
+def pair_offset(pair):
+    """Returns the stored transform of a game asset relative to its original."""
+    offset = pair.offset
+    return Matrix([offset[row * 4:row * 4 + 4] for row in range(4)])
+
+def register_game_asset(original, game_asset, game_ready=False, additional=False):
+    """
+    Records a new game asset for an original object and queues it for baking.
+    An additional game asset is recorded in a pair of its own, next to the one the original already has,
+    e.g. when the original is part of the merged objects of several collections.
+    """
+    registry = get_registry()
+    pair = find_asset_pair(registry, original)
+    index = registry_index(registry)
+    if pair is None or additional:
+        new_pair = registry.assets.add()
+        new_pair.original = original
+        pair_index = len(registry.assets) - 1
+        if pair is None:
+            index['original'][original.session_uid] = pair_index
+        pair = new_pair
+    else:
+        pair_index = index['original'][original.session_uid]
+
+    pair.game_asset = game_asset
+    offset = original.matrix_world.inverted_safe() @ game_asset.matrix_world
+    pair.offset = [value for row in offset for value in row]
+    pair.needs_bake = True
+    pair.game_ready = game_ready
+    index['game_asset'].setdefault(game_asset.session_uid, []).append(pair_index)
+
+# === Dirty Tracking and Incremental Conversion ===
+
+def remove_game_asset(game_asset):
+    """Deletes a game asset together with its mesh and materials once nothing else uses them."""
+    data = game_asset.data
+    materials = [mat for mat in data.materials if mat] if data else []
+    debug_print(f"Removing game asset {game_asset.name}")
+    registry_index(get_registry())['game_asset'].pop(game_asset.session_uid, None)
+    bpy.data.objects.remove(game_asset)
+
+    if isinstance(data, bpy.types.Mesh) and data.users == 0:
+        bpy.data.meshes.remove(data)
+    for mat in materials:
+        if mat.users == 0:
+            # The name is free again, so the reconverted object gets the same material names
+            if reserved_material_names is not None:
+                reserved_material_names.discard(mat.name)
+            bpy.data.materials.remove(mat)
+
+@persistent
+def track_dirty_ids(scene, depsgraph):
+    """Depsgraph handler recording which datablocks changed since the last conversion."""
+    if dirty_tracking_suspended:
+        return
+
+    for update in depsgraph.updates:
+        id_data = update.id.original
+        key = (id_data.id_type, id_data.name_full)
+        if isinstance(id_data, bpy.types.Object) and not update.is_updated_geometry:
+            # Only the transform changed, which doesn't need a reconversion
+            if update.is_updated_transform:
+                moved_ids.add(key)
+            continue
+        dirty_ids.add(key)
+
+@persistent
+def store_dirty_ids(*args):
+    """Saves the dirty state into every registry so edits made before a reload are still reprocessed."""
+    state = json.dumps({'dirty': sorted(dirty_ids), 'moved': sorted(moved_ids)})
+    for scene in bpy.data.scenes:
+        if scene.assetify_registry.assets:
+            scene.assetify_registry.dirty_state = state
+
+@persistent
+def restore_registry_state(*args):
+    """Resets the lookup tables after a file load and restores the saved dirty state."""
+    invalidate_registry_index()
+    dirty_ids.clear()
+    moved_ids.clear()
+    for scene in bpy.data.scenes:
+        if scene.assetify_registry.dirty_state:
+            state = json.loads(scene.assetify_registry.dirty_state)
+            dirty_ids.update(tuple(key) for key in state['dirty'])
+            moved_ids.update(tuple(key) for key in state['moved'])
+
+@persistent
+def reset_registry_index(*args):
+    """Undo and redo replace the registry data, so the lookup tables must be rebuilt."""
+    invalidate_registry_index()
+
+def flush_untracked_updates():
+    """Evaluates pending changes made by Assetify itself so the dirty tracker never records them."""
+    global dirty_tracking_suspended
+    dirty_tracking_suspended = True
+    try:
+        bpy.context.view_layer.update()
+    finally:
+        dirty_tracking_suspended = False
+
+def original_dependencies(obj):
+    """Returns the keys of every datablock whose changes affect the game asset of an original object."""
+    dependencies = {('OBJECT', obj.name_full), (obj.data.id_type, obj.data.name_full)}
+
+    node_trees = [modifier.node_group for modifier in obj.modifiers
+                  if modifier.type == 'NODES' and modifier.node_group]
+    for slot in obj.material_slots:
+        if slot.material:
+            dependencies.add(('MATERIAL', slot.material.name_full))
+            if slot.material.node_tree:
+                node_trees.append(slot.material.node_tree)
+
+    # Follow node groups nested inside the trees
+    while node_trees:
+        node_tree = node_trees.pop()
+        key = ('NODETREE', node_tree.name_full)
+        if key in dependencies:
+            continue
+        dependencies.add(key)
+        for node in node_tree.nodes:
+            group_tree = getattr(node, "node_tree", None)
+            if group_tree:
+                node_trees.append(group_tree)
+
+    return dependencies
+
+def can_update_incrementally(target_collection):
+    """Checks whether the game-ready collection of a previous conversion of the target can be updated in place."""
+    registry = get_registry()
+    if not registry.collections or not registry.assets:
+        return False
+
+    # A merged mesh stands for a whole collection, so it is always rebuilt
+    if bpy.context.scene.mossify_bake_settings.merge_by_collection:
+        return False
+    root = registry.collections[0]
+    return root.game_ready_collection is not None and root.original_collection == target_collection
+
+def update_game_ready_collection(target_collection):
+    """
+    Brings the existing game-ready collection up to date with the originals: converts new objects,
+    reconverts objects whose geometry, data, materials or node groups changed, moves objects that were
+    only transformed, and removes game assets whose original is gone. Untouched assets are kept as they are.
     """
-    global duplicated_objects
-    for obj in collection.objects:
-        if obj.type in {'MESH', 'CURVE'}:
-            new_obj = obj.copy()
-            new_obj.data = obj.data.copy()
-            new_obj.name = obj.name + "_gameasset"
-            new_collection.objects.link(new_obj)
-            debug_print(f"Duplicated object: {new_obj.name}")
-            
-            # Track the duplicated objects
-            duplicated_objects.append(new_obj)
-            
-            # Set as active object and process it (geometry, UV, materials)
-            bpy.context.view_layer.objects.active = new_obj
-            new_obj.select_set(True)
-            process_object(new_obj)
-            new_obj.select_set(False)
-
-    # Recursively process subcollections
-    for subcollection in collection.children:
-        new_subcollection_name = subcollection.name + "_gameasset"
-        new_subcollection = bpy.data.collections.new(new_subcollection_name)
-        new_collection.children.link(new_subcollection)
-        debug_print(f"Duplicated subcollection: {new_subcollection.name}")
-
-        # Store mapping information for subcollections
-        sub_mapping_info = {
-            'original_collection': subcollection,
-            'game_ready_collection': new_subcollection,
-            'original_name': subcollection.name,
-            'game_ready_name': new_subcollection_name
-        }
-        collection_mapping.append(sub_mapping_info)
-
-        duplicate_objects_in_collection(subcollection, new_subcollection, sub_mapping_info)
+    settings = bpy.context.scene.mossify_bake_settings
+    registry = get_registry()
+    shared_asset_owners.clear()
+    geometric_asset_owners.clear()
+
+    reconverted = 0
+    seen_originals = set()
+
+    # Forget collections that were deleted
+    for i in reversed(range(len(registry.collections))):
+        collection_pair = registry.collections[i]
+        if collection_pair.original_collection is None or collection_pair.game_ready_collection is None:
+            registry.collections.remove(i)
+
+    game_collections = {pair.original_collection.session_uid: pair.game_ready_collection
+                        for pair in registry.collections}
+    collection_pairs = [(pair.original_collection, pair.game_ready_collection) for pair in registry.collections]
+    new_subcollections = []
+
+    for original_collection, game_ready_collection in collection_pairs:
+        for obj in original_collection.objects:
+            if obj.type not in {'MESH', 'CURVE'}:
+                continue
+
+            # Objects in several collections are only processed on their first visit
+            if obj.session_uid in seen_originals:
+                pair = find_asset_pair(registry, obj)
+                if pair and pair.game_asset:
+                    link_if_missing(game_ready_collection, obj=pair.game_asset)
+                continue
+            seen_originals.add(obj.session_uid)
+
+            pair = find_asset_pair(registry, obj)
+            game_asset = pair.game_asset if pair else None
+
+            if game_asset is not None and game_asset.users_collection:
+                if not original_dependencies(obj) & dirty_ids:
+                    if ('OBJECT', obj.name_full) in moved_ids:
+                        game_asset.matrix_world = obj.matrix_world @ pair_offset(pair)
+                        debug_print(f"Moved {game_asset.name} to follow {obj.name}")
+                    continue
+            if game_asset is not None:
+                remove_game_asset(game_asset)
+
+            convert_object(obj, game_ready_collection, settings)
+            reconverted += 1
+
+        for subcollection in original_collection.children:
+            existing = game_collections.get(subcollection.session_uid)
+            if existing:
+                link_if_missing(game_ready_collection, child=existing)
+            else:
+                new_subcollections.append((subcollection, game_ready_collection))
+
+    # Subcollections added since the last conversion are converted in full, after every existing
+    # original is up to date so shared objects link to their current game asset
+    for subcollection, game_ready_collection in new_subcollections:
+        existing = game_collections.get(subcollection.session_uid)
+        if existing:
+            # Added under several parents
+            link_if_missing(game_ready_collection, child=existing)
+            continue
+        new_subcollection = bpy.data.collections.new(subcollection.name + "_gameasset")
+        game_ready_collection.children.link(new_subcollection)
+        add_collection_pair(subcollection, new_subcollection)
+        game_collections[subcollection.session_uid] = new_subcollection
+
+        count_before = len(registry.assets)
+        duplicate_objects_in_collection(subcollection, new_subcollection)
+        reconverted += len(registry.assets) - count_before
+        seen_originals.update(obj.session_uid for obj in subcollection.all_objects)
+        game_collections.update((pair.original_collection.session_uid, pair.game_ready_collection)
+                                for pair in registry.collections)
+
+    # Originals that were deleted or moved out of the target collection
+    orphaned_assets = []
+    for i in reversed(range(len(registry.assets))):
+        pair = registry.assets[i]
+        if pair.original is not None and pair.original.session_uid in seen_originals:
+            continue
+        if pair.game_asset is not None:
+            orphaned_assets.append(pair.game_asset)
+        registry.assets.remove(i)
+    invalidate_registry_index()
+
+    # Only delete game assets no remaining original still uses
+    for game_asset in orphaned_assets:
+        if not find_pairs_of_game_asset(registry, game_asset):
+            remove_game_asset(game_asset)
+
+    debug_print(f"Incremental conversion reprocessed {reconverted} objects.")
+    return {'FINISHED'}
+
+def find_layer_collection(layer_collection, collection):
+    """Finds the layer collection of a collection in a view layer, or None if it isn't in the view layer."""
+    stack = [layer_collection]
+    while stack:
+        current = stack.pop()
+        if current.collection == collection:
+            return current
+        stack.extend(current.children)
+    return None
+
+@contextmanager
+def suspended_source_evaluation(collection):
+    """
+    Excludes the source collection from the view layer while the body runs, so the depsgraph
+    updates triggered by every conversion operator don't re-evaluate the modifiers of the originals.
+    Only the game asset being processed, which lives in another collection, is evaluated.
+    The exclusion state is restored afterwards, including that of nested collections. Excluding a
+    collection drops the view layer state of its objects, so their hiding and selection are restored too.
+    """
+    view_layer = bpy.context.view_layer
+    layer_collection = find_layer_collection(view_layer.layer_collection, collection)
+    if layer_collection is None or layer_collection.exclude:
+        yield
+        return
+
+    states = [(obj, obj.hide_get(), obj.select_get()) for obj in collection.all_objects
+              if view_layer.objects.get(obj.name) == obj]
+    layer_collection.exclude = True
+    debug_print(f"Excluded {collection.name} from the view layer during conversion.")
+    try:
+        yield
+    finally:
+        # The layer collection may have been rebuilt while the body ran
+        layer_collection = find_layer_collection(view_layer.layer_collection, collection)
+        if layer_collection is not None:
+            layer_collection.exclude = False
+        for obj, hidden, selected in states:
+            if view_layer.objects.get(obj.name) == obj:
+                obj.hide_set(hidden)
+                obj.select_set(selected)
+        debug_print(f"Restored {collection.name} in the view layer.")
+
+# === Preflight Validation ===
+
+def preflight_object(obj, depsgraph, max_triangles):
+    """
+    Validates the evaluated geometry and the materials of one original object.
+    Returns its problems as (severity, message) tuples.
+    """
+    issues = []
+    if not any(slot.material for slot in obj.material_slots):
+        issues.append(('ERROR', "has no materials to bake"))
+
+    evaluated = obj.evaluated_get(depsgraph)
+    mesh = evaluated.to_mesh()
+    try:
+        if mesh is None:
+            return issues + [('ERROR', "has no geometry")]
+
+        vertex_count, polygon_count, loop_count = len(mesh.vertices), len(mesh.polygons), len(mesh.loops)
+        positions = np.empty(vertex_count * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", positions)
+        loop_starts = np.empty(polygon_count, dtype=np.int32)
+        mesh.polygons.foreach_get("loop_start", loop_starts)
+        loop_totals = np.empty(polygon_count, dtype=np.int32)
+        mesh.polygons.foreach_get("loop_total", loop_totals)
+        polygon_areas = np.empty(polygon_count, dtype=np.float32)
+        mesh.polygons.foreach_get("area", polygon_areas)
+        loop_edges = np.empty(loop_count, dtype=np.int32)
+        mesh.loops.foreach_get("edge_index", loop_edges)
+
+        uvs = None
+        uv_layer = next((layer for layer in mesh.uv_layers if layer.active_render), None)
+        if uv_layer is not None:
+            uvs = np.empty(loop_count * 2, dtype=np.float32)
+            uv_layer.data.foreach_get("uv", uvs)
+
+        stats = preflight.mesh_stats(positions, loop_starts, loop_totals, loop_edges, len(mesh.edges),
+                                     polygon_areas, uvs)
+    finally:
+        evaluated.to_mesh_clear()
+
+    return issues + preflight.mesh_issues(stats, max_triangles)
+
+def run_preflight(target_collection):
+    """
+    Validates every original object of the target collection that is about to be converted, before
+    any expensive work starts. In 'SKIP' mode, objects with errors are left out of the conversion.
+    Returns the problems found as (object name, severity, message) tuples.
+    """
+    settings = bpy.context.scene.mossify_bake_settings
+    preflight_skipped.clear()
+    preflight_results.clear()
+    if settings.preflight_mode == 'OFF':
+        return preflight_results
+
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    registry = get_registry()
+    incremental = can_update_incrementally(target_collection)
+    checked = set()
+    for obj in target_collection.all_objects:
+        if obj.type not in {'MESH', 'CURVE'} or obj.session_uid in checked:
+            continue
+        checked.add(obj.session_uid)
+
+        # An incremental update only reprocesses originals that changed
+        if incremental:
+            pair = find_asset_pair(registry, obj)
+            if pair and pair.game_asset and not original_dependencies(obj) & dirty_ids:
+                continue
+
+        issues = preflight_object(obj, depsgraph, settings.preflight_max_triangles)
+        for severity, message in issues:
+            preflight_results.append((obj.name, severity, message))
+            debug_print(f"Preflight {severity.lower()}: {obj.name} {message}")
+        if settings.preflight_mode == 'SKIP' and any(severity == 'ERROR' for severity, _message in issues):
+            preflight_skipped.add(obj.session_uid)
+
+    debug_print(f"Preflight checked {len(checked)} objects, {len(preflight_skipped)} will be skipped.")
+    return preflight_results
 
 def duplicate_mossify_collection():
     """
     Finds the user-selected collection, duplicates it along with all its objects and subcollections, and renames it.
+    If the collection was converted before, only the objects that changed since then are reprocessed.
     """
-    global duplicated_objects, collection_mapping
-    duplicated_objects.clear()  # Clear the list before duplicating objects
-    collection_mapping.clear()  # Clear the mapping before duplicating collections
+    global dirty_tracking_suspended
 
     # Get the collection selected by the user
     target_collection = bpy.context.scene.mossify_bake_settings.target_collection
@@ -541,6 +1593,61 @@ def duplicate_mossify_collection():
         debug_print("No target collection selected.")
         return {'CANCELLED'}
 
+    settings = bpy.context.scene.mossify_bake_settings
+
+    # Validate the originals and read the geometry of their modifiers while they are still evaluated
+    run_preflight(target_collection)
+    if settings.suspend_source_evaluation:
+        capture_original_geometry(target_collection)
+
+    dirty_tracking_suspended = True
+    try:
+        if settings.suspend_source_evaluation:
+            with suspended_source_evaluation(target_collection):
+                result = convert_target_collection(target_collection)
+        else:
+            result = convert_target_collection(target_collection)
+    finally:
+        dirty_tracking_suspended = False
+        preflight_skipped.clear()
+        original_geometry.clear()
+
+    # Heavy meshes are decimated for the high to low bake, and the LODs follow the converted meshes
+    if result == {'FINISHED'}:
+        prepare_high_to_low()
+        update_lods()
+
+    # Changes made by the conversion itself must not mark anything dirty
+    flush_untracked_updates()
+    dirty_ids.clear()
+    moved_ids.clear()
+    get_registry().dirty_state = ""
+    return result
+
+def convert_target_collection(target_collection):
+    """Updates the game-ready collection of the target in place if possible, or converts it from scratch."""
+    global reserved_material_names
+
+    # Collect the material names once, every new material name is then computed locally
+    reserved_material_names = set(bpy.data.materials.keys())
+    try:
+        if can_update_incrementally(target_collection):
+            return update_game_ready_collection(target_collection)
+        return convert_collection_from_scratch(target_collection)
+    finally:
+        reserved_material_names = None
+
+def convert_collection_from_scratch(target_collection):
+    """Duplicates the target collection into a new game-ready collection and converts every object."""
+    registry = get_registry()
+    registry.assets.clear()  # Clear the registry before duplicating objects
+    registry.collections.clear()  # Clear the mapping before duplicating collections
+    registry.assets_swapped = False
+    registry.last_bake_resolution = ""
+    invalidate_registry_index()
+    shared_asset_owners.clear()  # Shared data from a previous conversion must not be reused
+    geometric_asset_owners.clear()
+
     # Proceed with duplicating the selected collection
     new_collection_name = "Game-Ready Asset Collection"
     new_collection = bpy.data.collections.new(new_collection_name)
@@ -548,128 +1655,598 @@ def duplicate_mossify_collection():
     debug_print(f"Created new collection: {new_collection.name}")
 
     # Store mapping information
-    mapping_info = {
-        'original_collection': target_collection,
-        'game_ready_collection': new_collection,
-        'original_name': target_collection.name,
-        'game_ready_name': new_collection.name
-    }
-    collection_mapping.append(mapping_info)
+    collection_pair = add_collection_pair(target_collection, new_collection)
+
+    duplicate_objects_in_collection(target_collection, new_collection, collection_pair)
 
-    duplicate_objects_in_collection(target_collection, new_collection, mapping_info)
+    if bpy.context.scene.mossify_bake_settings.merge_by_collection:
+        merge_collection_objects([pair.game_ready_collection for pair in registry.collections])
+
+        # The shared owners were merged away
+        shared_asset_owners.clear()
+        geometric_asset_owners.clear()
     return {'FINISHED'}
 
-def swap_objects_between_collections(collection_a, collection_b, swap_state):
+# === Merge by Collection ===
+
+def mesh_part(obj, mesh, materials, uv_names, color_layers):
     """
-    Swaps objects and subcollections between two collections.
-    Based on the swap state, moves objects with "_gameasset" or "_originalasset" and renames subcollections.
+    Reads an object's mesh into flat arrays for mesh_merge, in world space. Material indices are
+    remapped onto the merged material list, which is extended with the object's materials.
+    UV layers the mesh lacks are taken from its render UV layer, missing colors are white.
     """
-    # Move game assets (objects with "_gameasset" in their name) from collection_b to collection_a
-    if swap_state:
-        for obj in collection_b.objects[:]:
-            if "_gameasset" in obj.name:
-                collection_a.objects.link(obj)
-                collection_b.objects.unlink(obj)
-
-        # Move original assets (objects without "_gameasset" in their name) from collection_a to collection_b
-        for obj in collection_a.objects[:]:
-            if "_gameasset" not in obj.name:
-                collection_b.objects.link(obj)
-                collection_a.objects.unlink(obj)
+    vertex_count, loop_count, polygon_count = len(mesh.vertices), len(mesh.loops), len(mesh.polygons)
+
+    positions = np.empty(vertex_count * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", positions)
+    normals = np.empty(loop_count * 3, dtype=np.float32)
+    mesh.corner_normals.foreach_get("vector", normals)
+    loop_vertices = np.empty(loop_count, dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_vertices)
+    loop_starts = np.empty(polygon_count, dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", loop_starts)
+    loop_totals = np.empty(polygon_count, dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    material_indices = np.empty(polygon_count, dtype=np.int32)
+    mesh.polygons.foreach_get("material_index", material_indices)
+    smooth = np.empty(polygon_count, dtype=bool)
+    mesh.polygons.foreach_get("use_smooth", smooth)
+
+    # Slots of the object onto the merged materials
+    slot_materials = [slot.material for slot in obj.material_slots] or [None]
+    remap = []
+    for mat in slot_materials:
+        if mat not in materials:
+            materials.append(mat)
+        remap.append(materials.index(mat))
+    material_indices = np.asarray(remap)[np.clip(material_indices, 0, len(remap) - 1)]
+
+    uvs = {}
+    render_layer = next((layer for layer in mesh.uv_layers if layer.active_render), None)
+    for name in uv_names:
+        layer = mesh.uv_layers.get(name) or render_layer
+        data = np.zeros(loop_count * 2, dtype=np.float32)
+        if layer:
+            layer.data.foreach_get("uv", data)
+        uvs[name] = data.reshape(-1, 2)
+
+    point_colors, corner_colors = {}, {}
+    for name, (domain, _data_type) in color_layers.items():
+        size = vertex_count if domain == 'POINT' else loop_count
+        data = np.ones(size * 4, dtype=np.float32)
+        attribute = mesh.color_attributes.get(name)
+        if attribute and attribute.domain == domain:
+            attribute.data.foreach_get("color", data)
+        (point_colors if domain == 'POINT' else corner_colors)[name] = data.reshape(-1, 4)
+
+    part = {
+        'positions': positions.reshape(-1, 3), 'normals': normals.reshape(-1, 3), 'loop_vertices': loop_vertices,
+        'loop_starts': loop_starts, 'loop_totals': loop_totals, 'material_indices': material_indices,
+        'smooth': smooth, 'uvs': uvs, 'point_colors': point_colors, 'corner_colors': corner_colors,
+    }
+    return mesh_merge.transform_part(part, np.array(obj.matrix_world))
 
-    else:
-        # Moving original assets back to the original collection
-        for obj in collection_b.objects[:]:
-            if "_gameasset" not in obj.name:
-                collection_a.objects.link(obj)
-                collection_b.objects.unlink(obj)
-
-        # Moving game assets back to the game-ready collection
-        for obj in collection_a.objects[:]:
-            if "_gameasset" in obj.name:
-                collection_b.objects.link(obj)
-                collection_a.objects.unlink(obj)
-
-    # Handle subcollections recursively
-    subcollections_a = {col.name: col for col in collection_a.children}
-    subcollections_b = {col.name: col for col in collection_b.children}
-
-    # For each subcollection, ensure proper renaming and swapping occurs
-    for subcol_name in subcollections_a.keys() | subcollections_b.keys():
-        subcol_a = subcollections_a.get(subcol_name)
-        subcol_b = subcollections_b.get(subcol_name)
-
-        # Rename the subcollections based on the swap state
-        if swap_state:
-            # Rename "_gameasset" to "_originalasset" in subcollections
-            if subcol_b and "_gameasset" in subcol_b.name:
-                new_name = subcol_b.name.replace("_gameasset", "_originalasset")
-                subcol_b.name = new_name
-                bpy.context.view_layer.update()  # Force context update after renaming
-                debug_print(f"Renamed subcollection {subcol_b.name} to {new_name}")
-            # Rename "_originalasset" back to "_gameasset" in subcollections
-            if subcol_a and "_originalasset" in subcol_a.name:
-                new_name = subcol_a.name.replace("_originalasset", "_gameasset")
-                subcol_a.name = new_name
-                bpy.context.view_layer.update()  # Force context update after renaming
-                debug_print(f"Renamed subcollection {subcol_a.name} to {new_name}")
+def merge_meshes(objects, name):
+    """
+    Builds one mesh in world space from the evaluated meshes of the objects, with array concatenation
+    instead of bpy.ops.object.join. UV layers, color attributes, materials, smooth shading and
+    the exact corner normals are kept.
+    """
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    evaluated = [obj.evaluated_get(depsgraph) for obj in objects]
+
+    # The render UV layer of the first object stays first, so it remains the render layer
+    uv_names = []
+    color_layers = {}
+    for obj in evaluated:
+        for layer in sorted(obj.data.uv_layers, key=lambda layer: not layer.active_render):
+            if layer.name not in uv_names:
+                uv_names.append(layer.name)
+        for attribute in obj.data.color_attributes:
+            if attribute.domain in {'POINT', 'CORNER'}:
+                color_layers.setdefault(attribute.name, (attribute.domain, attribute.data_type))
+
+    materials = []
+    parts = []
+    for obj in evaluated:
+        mesh = obj.to_mesh()
+        try:
+            parts.append(mesh_part(obj, mesh, materials, uv_names, color_layers))
+        finally:
+            obj.to_mesh_clear()
+    merged = mesh_merge.concatenate(parts)
+
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(merged['positions']))
+    mesh.vertices.foreach_set("co", merged['positions'].astype(np.float32).ravel())
+    mesh.loops.add(len(merged['loop_vertices']))
+    mesh.loops.foreach_set("vertex_index", merged['loop_vertices'].astype(np.int32))
+    mesh.polygons.add(len(merged['loop_starts']))
+    mesh.polygons.foreach_set("loop_start", merged['loop_starts'].astype(np.int32))
+    mesh.polygons.foreach_set("material_index", merged['material_indices'].astype(np.int32))
+    mesh.polygons.foreach_set("use_smooth", merged['smooth'])
+
+    for mat in materials:
+        mesh.materials.append(mat)
+    for uv_name in uv_names:
+        mesh.uv_layers.new(name=uv_name).data.foreach_set("uv", merged['uvs'][uv_name].ravel())
+    for color_name, (domain, data_type) in color_layers.items():
+        colors = merged['point_colors' if domain == 'POINT' else 'corner_colors'][color_name]
+        mesh.color_attributes.new(color_name, data_type, domain).data.foreach_set("color", colors.ravel())
+
+    mesh.update(calc_edges=True)
+    mesh.normals_split_custom_set(merged['normals'])
+    return mesh
+
+def merge_collection_objects(game_collections):
+    """
+    Replaces the converted meshes directly in each game-ready collection by one merged object per collection,
+    which then gets its single UV unwrap. An object linked into several collections is merged into each of
+    them, and is only deleted once no collection holds it anymore. Game-ready objects keep their own meshes.
+    Returns the merged objects.
+    """
+    registry = get_registry()
+
+    # Every collection is merged before any part is deleted
+    merges = []
+    unmerged = {}
+    originals = {}
+    for game_collection in game_collections:
+        parts = [obj for obj in game_collection.objects
+                 if obj.type == 'MESH' and not any(pair.game_ready for pair in find_pairs_of_game_asset(registry, obj))]
+        if len(parts) < 2:
+            unmerged.update((obj.session_uid, obj) for obj in parts)
+            continue
+        name = f"{game_collection.name}_merged"
+        merged = bpy.data.objects.new(name, merge_meshes(parts, name))
+        game_collection.objects.link(merged)
+        for obj in parts:
+            game_collection.objects.unlink(obj)
+            originals.setdefault(obj.session_uid, (obj, [pair.original for pair in find_pairs_of_game_asset(registry, obj)]))
+        merges.append((merged, [obj.session_uid for obj in parts]))
+
+    # Parts are deleted once no other collection holds them
+    for uid, (obj, _originals) in originals.items():
+        if obj.users_collection:
+            unmerged[uid] = obj
         else:
-            # Rename back: rename "_originalasset" to "_gameasset" and vice versa
-            if subcol_b and "_originalasset" in subcol_b.name:
-                new_name = subcol_b.name.replace("_originalasset", "_gameasset")
-                subcol_b.name = new_name
-                bpy.context.view_layer.update()  # Force context update after renaming
-                debug_print(f"Renamed subcollection {subcol_b.name} to {new_name}")
-            if subcol_a and "_gameasset" in subcol_a.name:
-                new_name = subcol_a.name.replace("_gameasset", "_originalasset")
-                subcol_a.name = new_name
-                bpy.context.view_layer.update()  # Force context update after renaming
-                debug_print(f"Renamed subcollection {subcol_a.name} to {new_name}")
-
-        # Recursive call to ensure all subcollections are swapped and renamed properly
-        if subcol_a and subcol_b:
-            swap_objects_between_collections(subcol_a, subcol_b, swap_state)
+            remove_game_asset(obj)
+
+    # Originals are represented by the merged objects of their collections, and by their own game asset
+    # where that stays. The first merged object replaces a deleted game asset, the others get pairs of their own
+    replaced = set()
+    for merged, part_uids in merges:
+        for uid in part_uids:
+            for original in originals[uid][1]:
+                additional = uid in unmerged or original.session_uid in replaced
+                register_game_asset(original, merged, additional=additional)
+                replaced.add(original.session_uid)
+
+    # Objects that weren't merged still need the unwrap they skipped
+    for obj in list(unmerged.values()) + [merged for merged, _part_uids in merges]:
+        bpy.context.view_layer.objects.active = obj
+        obj.select_set(True)
+        smart_uv_project(obj)
+        obj.select_set(False)
+    for merged, part_uids in merges:
+        debug_print(f"Merged {len(part_uids)} objects into {merged.name}")
+    return [merged for merged, _part_uids in merges]
+
+# === Level of Detail ===
+
+# Custom property of LOD objects and LOD group empties, pointing at the game asset they were built for
+LOD_SOURCE_PROPERTY = "assetify_lod_source"
+
+# Custom property of a game asset renamed to '<name>_LOD0', holding its name from before
+LOD_BASE_NAME_PROPERTY = "assetify_lod_base_name"
+
+def asset_name(obj):
+    """
+    Returns the name baked maps and bake journal records of a game asset are keyed on: its name
+    without the '_LOD0' it gets while it has LODs, so turning LODs on or off doesn't orphan them.
+    """
+    return obj.get(LOD_BASE_NAME_PROPERTY, obj.name)
+
+def lod_ratios(settings):
+    """Returns the triangle ratio of LOD1..LODn relative to LOD0."""
+    return [settings.lod_ratio ** level for level in range(1, settings.lod_count + 1)]
+
+def remove_lods(objects):
+    """
+    Deletes the LODs and LOD groups of the given objects, and those whose game asset was deleted, with their
+    unused meshes. The game assets go back to their place in the hierarchy.
+    """
+    source_uids = {obj.session_uid for obj in objects}
+    doomed = []
+    for lod in [obj for obj in bpy.data.objects if LOD_SOURCE_PROPERTY in obj.keys()]:
+        source = lod[LOD_SOURCE_PROPERTY]
+        if source is not None and source.session_uid not in source_uids:
+            continue
+        if lod.type == 'EMPTY' and source is not None:
+            source.parent = lod.parent
+            source.matrix_parent_inverse = lod.matrix_parent_inverse
+        doomed.append(lod)
+
+    for lod in doomed:
+        mesh = lod.data
+        bpy.data.objects.remove(lod)
+        if mesh is not None and mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
+
+def lod_group(obj, collection):
+    """
+    Creates the LOD group of a game asset: an empty that the FBX exporter writes as an FbxLODGroup,
+    which Unreal imports as one mesh with LODs. The game asset becomes its child '<name>_LOD0',
+    and the group takes the game asset's place in the hierarchy, so nothing moves.
+    """
+    base_name = asset_name(obj)
+    group = bpy.data.objects.new(base_name, None)
+    group["fbx_type"] = "LodGroup"
+    group[LOD_SOURCE_PROPERTY] = obj
+    collection.objects.link(group)
+    group.parent = obj.parent
+    group.matrix_parent_inverse = obj.matrix_parent_inverse
+
+    obj.parent = group
+    obj.matrix_parent_inverse = Matrix.Identity(4)
+    if LOD_BASE_NAME_PROPERTY not in obj.keys():
+        obj[LOD_BASE_NAME_PROPERTY] = base_name
+        obj.name = f"{base_name}_LOD0"
+    return group, base_name
+
+def restore_lod_base_name(obj):
+    """Gives a game asset without LODs back the name it had before it became LOD0."""
+    if LOD_BASE_NAME_PROPERTY in obj.keys():
+        obj.name = obj[LOD_BASE_NAME_PROPERTY]
+        del obj[LOD_BASE_NAME_PROPERTY]
+
+def generate_lods(objects):
+    """
+    Builds the LOD chains of mesh objects in one batched pass: every object gets a Decimate modifier,
+    and each level is a single depsgraph evaluation of all of them followed by new_from_object.
+    The LOD meshes keep the materials and UV layout of LOD0, so they use its baked textures as they are.
+    Objects sharing a mesh share its LOD meshes. Existing LODs of the objects are replaced.
+    Each object and its LODs, named '<name>_LOD0' to '<name>_LOD<n>', go into a LOD group, see lod_group.
+    Returns the number of LOD objects created.
+    """
+    settings = bpy.context.scene.mossify_bake_settings
+    objects = [obj for obj in objects if obj.type == 'MESH']
+    remove_lods(objects)
+    ratios = lod_ratios(settings)
+    if not ratios:
+        for obj in objects:
+            restore_lod_base_name(obj)
+    if not objects or not ratios:
+        return 0
+
+    # One object is evaluated per mesh
+    sources = {}
+    for obj in objects:
+        sources.setdefault(obj.data, obj)
+
+    decimators = []
+    lod_meshes = {}
+    try:
+        for obj in sources.values():
+            decimator = obj.modifiers.new(name="Assetify LOD", type='DECIMATE')
+            decimator.decimate_type = 'COLLAPSE'
+            decimator.use_collapse_triangulate = True
+            decimators.append((obj, decimator))
+
+        for level, ratio in enumerate(ratios, start=1):
+            for _obj, decimator in decimators:
+                decimator.ratio = ratio
+            flush_untracked_updates()
+            depsgraph = bpy.context.evaluated_depsgraph_get()
+            for data, obj in sources.items():
+                mesh = bpy.data.meshes.new_from_object(obj.evaluated_get(depsgraph),
+                                                       preserve_all_data_layers=True, depsgraph=depsgraph)
+                mesh.name = f"{data.name}_LOD{level}"
+                mesh.pop(HIGH_POLY_PROPERTY, None)  # LODs are never baked
+                lod_meshes[(data, level)] = mesh
+    finally:
+        for obj, decimator in decimators:
+            obj.modifiers.remove(decimator)
+        flush_untracked_updates()
+
+    for obj in objects:
+        collection = obj.users_collection[0] if obj.users_collection else bpy.context.scene.collection
+        group, base_name = lod_group(obj, collection)
+        for level in range(1, len(ratios) + 1):
+            lod = bpy.data.objects.new(f"{base_name}_LOD{level}", lod_meshes[(obj.data, level)])
+            lod[LOD_SOURCE_PROPERTY] = obj
+            collection.objects.link(lod)
+
+            # The LOD sits exactly on its LOD0, they share the group as parent
+            lod.parent = group
+            lod.matrix_basis = obj.matrix_basis
+
+    flush_untracked_updates()
+    debug_print(f"Generated {len(ratios)} LODs for {len(objects)} objects")
+    return len(objects) * len(ratios)
+
+def update_lods(names=None):
+    """
+    Rebuilds the LODs of the named game assets and of every game asset sharing their meshes,
+    by default of all game assets, e.g. after they were converted or got their baked material.
+    """
+    assets = [obj for obj in game_assets(get_registry()) if obj.type == 'MESH']
+    if names is not None:
+        names = set(names)
+        changed_data = {obj.data for obj in assets if obj.name in names}
+        assets = [obj for obj in assets if obj.data in changed_data]
+    return generate_lods(assets)
+
+# === High to Low Bake ===
+
+# Custom property of a decimated game mesh, pointing at the full-detail object its maps are baked from
+HIGH_POLY_PROPERTY = "assetify_high_poly"
+
+# Custom property of the full-detail objects: the cage extrusion reaching them from the game mesh, in object space
+CAGE_EXTRUSION_PROPERTY = "assetify_cage_extrusion"
+
+# Collection of the full-detail objects, only included in the view layer while one of them is baked from
+HIGH_POLY_COLLECTION = "Assetify High Poly"
+
+# Full-detail vertices measured to find the cage extrusion
+CAGE_SAMPLE_COUNT = 100000
+
+# Extra cage extrusion on top of the largest distance measured, relative to it
+CAGE_MARGIN = 0.1
+
+# Smallest cage extrusion, so rays start off the surface even where both meshes coincide
+MIN_CAGE_EXTRUSION = 0.001
+
+def high_poly_source(obj):
+    """Returns the full-detail object the maps of a decimated game asset are baked from, or None."""
+    if obj.type != 'MESH':
+        return None
+    return obj.data.get(HIGH_POLY_PROPERTY)
+
+def cage_extrusion(high_mesh, low_mesh):
+    """
+    Finds how far the cage has to be pushed out for the rays from the game mesh to reach the full-detail
+    surface: the largest distance of a full-detail vertex to the game mesh, looked up in a BVH tree of
+    the game mesh for a sample of the vertices, plus a margin. Both meshes are in the same object space.
+    """
+    low_positions = np.empty(len(low_mesh.vertices) * 3, dtype=np.float32)
+    low_mesh.vertices.foreach_get("co", low_positions)
+    loop_vertices = np.empty(len(low_mesh.loops), dtype=np.int32)
+    low_mesh.loops.foreach_get("vertex_index", loop_vertices)
+    loop_starts = np.empty(len(low_mesh.polygons), dtype=np.int32)
+    low_mesh.polygons.foreach_get("loop_start", loop_starts)
+    polygons = [polygon.tolist() for polygon in np.split(loop_vertices, loop_starts[1:])]
+    tree = BVHTree.FromPolygons(low_positions.reshape(-1, 3).tolist(), polygons)
+
+    high_positions = np.empty(len(high_mesh.vertices) * 3, dtype=np.float32)
+    high_mesh.vertices.foreach_get("co", high_positions)
+    high_positions = high_positions.reshape(-1, 3)
+    step = max(len(high_positions) // CAGE_SAMPLE_COUNT, 1)
+
+    largest = 0.0
+    for position in high_positions[::step].tolist():
+        distance = tree.find_nearest(position)[3]
+        if distance is not None and distance > largest:
+            largest = distance
+    return max(largest * (1.0 + CAGE_MARGIN), MIN_CAGE_EXTRUSION)
+
+def high_poly_collection():
+    """
+    Returns the collection of the full-detail sources, linked to the scene outside the game-ready
+    collections and excluded from the view layer, so they are neither exported nor evaluated.
+    """
+    collection = bpy.data.collections.get(HIGH_POLY_COLLECTION)
+    if collection is None:
+        collection = bpy.data.collections.new(HIGH_POLY_COLLECTION)
+    link_if_missing(bpy.context.scene.collection, child=collection)
+    layer_collection = find_layer_collection(bpy.context.view_layer.layer_collection, collection)
+    if layer_collection is not None:
+        layer_collection.exclude = True
+    return collection
+
+def prepare_high_to_low():
+    """
+    Decimates the game meshes over the triangle budget for the high to low bake, in one batched pass
+    like generate_lods. The full-detail mesh moves to a hidden '<object>_high' object in the high poly
+    collection, outside the game-ready collections so it is never exported with them, with copies of the materials so it keeps the original shading once the game asset got its
+    baked material. The decimated mesh gets a GameUV unwrap of its own.
+    Objects baked into an atlas keep their full detail, see atlas_groups.
+    Full-detail objects whose game mesh no longer exists are deleted. Returns the number of decimated meshes.
+    """
+    registry = get_registry()
+    settings = bpy.context.scene.mossify_bake_settings
+
+    used = set()
+    for mesh in bpy.data.meshes:
+        high_poly = mesh.get(HIGH_POLY_PROPERTY)
+        if high_poly is not None:
+            used.add(high_poly.session_uid)
+    for obj in [obj for obj in bpy.data.objects if CAGE_EXTRUSION_PROPERTY in obj.keys()]:
+        if obj.session_uid not in used:
+            remove_game_asset(obj)
+
+    if not settings.high_to_low:
+        return 0
+
+    # Atlas members are baked from their own meshes, so they keep their full detail
+    candidates = [obj for obj in game_assets(registry) if obj.type == 'MESH'
+                  and not any(pair.game_ready for pair in find_pairs_of_game_asset(registry, obj))]
+    atlased = {obj.data for members in atlas_groups(candidates).values() for obj in members}
+
+    # One object is decimated per mesh, the other objects sharing it get the result too
+    sources = {}
+    for obj in candidates:
+        if obj.data in sources or obj.data in atlased or high_poly_source(obj) is not None:
+            continue
+        triangles = mesh_triangle_count(obj.data)
+        if triangles > settings.triangle_budget:
+            sources[obj.data] = (obj, triangles)
+    if not sources:
+        return 0
+
+    decimators = []
+    low_meshes = {}
+    try:
+        for obj, triangles in sources.values():
+            decimator = obj.modifiers.new(name="Assetify High to Low", type='DECIMATE')
+            decimator.decimate_type = 'COLLAPSE'
+            decimator.use_collapse_triangulate = True
+            decimator.ratio = settings.triangle_budget / triangles
+            decimators.append((obj, decimator))
+
+        flush_untracked_updates()
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        for data, (obj, _triangles) in sources.items():
+            low_meshes[data] = bpy.data.meshes.new_from_object(obj.evaluated_get(depsgraph),
+                                                               preserve_all_data_layers=True, depsgraph=depsgraph)
+    finally:
+        for obj, decimator in decimators:
+            obj.modifiers.remove(decimator)
+
+    for data, (obj, _triangles) in sources.items():
+        low_mesh = low_meshes[data]
+        name = data.name
+        data.user_remap(low_mesh)
+        data.name = f"{name}_high"
+        low_mesh.name = name
+
+        high_poly = bpy.data.objects.new(f"{obj.name}_high", data)
+        high_poly[CAGE_EXTRUSION_PROPERTY] = cage_extrusion(data, low_mesh)
+        for index, mat in enumerate(data.materials):
+            if mat:
+                data.materials[index] = mat.copy()
+        high_poly_collection().objects.link(high_poly)
+        high_poly.matrix_world = obj.matrix_world
+        high_poly.hide_viewport = True
+        high_poly.hide_render = True
+        low_mesh[HIGH_POLY_PROPERTY] = high_poly
+
+        # The decimated mesh gets a layout of its own
+        obj.select_set(True)
+        smart_uv_project(obj)
+        obj.select_set(False)
+        debug_print(f"Decimated {obj.name} to {mesh_triangle_count(low_mesh)} triangles, "
+                    f"cage extrusion {high_poly[CAGE_EXTRUSION_PROPERTY]:.4f}")
+
+    flush_untracked_updates()
+    return len(sources)
+
+@contextmanager
+def high_poly_bake(obj):
+    """
+    While active, Cycles bakes of the object are Selected to Active bakes from its full-detail source,
+    with the cage extrusion found for them. Does nothing for objects without a full-detail source.
+    The object must be selected and active.
+    """
+    high_poly = high_poly_source(obj)
+    if high_poly is None:
+        yield
+        return
+
+    bake = bpy.context.scene.render.bake
+    previous = (bake.use_selected_to_active, bake.use_cage, bake.cage_extrusion, bake.max_ray_distance)
+    extrusion = high_poly[CAGE_EXTRUSION_PROPERTY] * max(abs(value) for value in obj.matrix_world.to_scale())
+
+    # The source is moved onto whichever object sharing the mesh is being baked. Its collection joins
+    # the view layer for the bake, with the other sources in it still disabled
+    collection = high_poly_collection()
+    layer_collection = find_layer_collection(bpy.context.view_layer.layer_collection, collection)
+    if layer_collection is not None:
+        layer_collection.exclude = False
+    high_poly.matrix_world = obj.matrix_world
+    high_poly.hide_viewport = False
+    high_poly.hide_render = False
+    flush_untracked_updates()
+    high_poly.select_set(True)
+
+    # Rays start on the extruded surface and reach as far inside the game mesh as outside it
+    bake.use_selected_to_active = True
+    bake.use_cage = False
+    bake.cage_extrusion = extrusion
+    bake.max_ray_distance = extrusion * 2.0
+    try:
+        yield
+    finally:
+        bake.use_selected_to_active, bake.use_cage, bake.cage_extrusion, bake.max_ray_distance = previous
+        high_poly.select_set(False)
+        high_poly.hide_viewport = True
+        high_poly.hide_render = True
+        layer_collection = find_layer_collection(bpy.context.view_layer.layer_collection, collection)
+        if layer_collection is not None:
+            layer_collection.exclude = True
+
+def collection_parents(collection):
+    """Returns the collections, including scene root collections, that directly contain the given collection."""
+    parents = [parent for parent in bpy.data.collections if parent.children.get(collection.name) == collection]
+    for scene in bpy.data.scenes:
+        if scene.collection.children.get(collection.name) == collection:
+            parents.append(scene.collection)
+    return parents
+
+def exchange_collection_links(collection_a, collection_b):
+    """Swaps the places of two collections by relinking them under each other's parents, moving their whole subtrees."""
+    parents_a = collection_parents(collection_a)
+    parents_b = collection_parents(collection_b)
+
+    for parent in parents_a:
+        parent.children.unlink(collection_a)
+    for parent in parents_b:
+        parent.children.unlink(collection_b)
+
+    for parent in parents_a:
+        parent.children.link(collection_b)
+    for parent in parents_b:
+        parent.children.link(collection_a)
 
 def swap_collections():
     """
-    Swaps the assets between the original and game-ready collections, and renames the collections.
-    1. Renames "Game-Ready Moss Collection" to "Original Moss Collection".
-    2. Renames subcollections from "_gameasset" to "_originalasset" (and back).
-    Moves game assets into the original subcollections and original assets into the game-ready subcollections.
+    Swaps the original and game-ready collection trees.
+    1. The game-ready root takes the place of the original root in the hierarchy, and the original
+       root takes the place of the game-ready root. Subtrees move along with their root.
+    2. Game-ready collections take the names of their originals, and the originals are renamed to
+       "Original Asset Collection" (root) and "<name>_originalasset" (subcollections). Swapping back restores the names.
+    No object is moved, so the cost doesn't grow with the number of objects.
     """
-    global collection_mapping, assets_swapped
+    registry = get_registry()
 
-    if not collection_mapping:
+    if not registry.collections:
         debug_print("No collections have been duplicated yet.")
         return
 
-    # Swap assets between collections based on the current swap state
-    for mapping_info in collection_mapping:
-        original_collection = mapping_info['original_collection']
-        game_ready_collection = mapping_info['game_ready_collection']
-
-        if not original_collection or not game_ready_collection:
-            continue
+    pairs = [pair for pair in registry.collections
+             if pair.original_collection is not None and pair.game_ready_collection is not None]
+    if not pairs or pairs[0] != registry.collections[0]:
+        debug_print("The original or game-ready root collection no longer exists.")
+        return
 
-        # Rename the root collection and swap the assets based on the swap state
-        if not assets_swapped:
-            # First swap: rename "Game-Ready Moss Collection" to "Original Moss Collection"
-            if "Game-Ready Asset Collection" in game_ready_collection.name:
-                game_ready_collection.name = "Original Asset Collection"
-        else:
-            # Swap back: rename "Original Moss Collection" to "Game-Ready Moss Collection"
-            if "Original Asset Collection" in game_ready_collection.name:
-                game_ready_collection.name = "Game-Ready Asset Collection"
+    if not registry.assets_swapped:
+        # Remember the current names so swapping back restores them
+        for pair in pairs:
+            pair.original_name = pair.original_collection.name
+            pair.game_ready_name = pair.game_ready_collection.name
 
-        # Swap the objects and rename subcollections based on the current swap state
-        swap_objects_between_collections(original_collection, game_ready_collection, not assets_swapped)
+        # Free the original names first so the game-ready collections can take them without a suffix
+        for index, pair in enumerate(pairs):
+            if index == 0:
+                pair.original_collection.name = "Original Asset Collection"
+            else:
+                pair.original_collection.name = pair.original_name + "_originalasset"
+        for pair in pairs:
+            pair.game_ready_collection.name = pair.original_name
+    else:
+        for pair in pairs:
+            pair.game_ready_collection.name = pair.game_ready_name
+        for pair in pairs:
+            pair.original_collection.name = pair.original_name
 
-        debug_print(f"Swapped assets between {original_collection.name} and {game_ready_collection.name}")
+    root = pairs[0]
+    exchange_collection_links(root.original_collection, root.game_ready_collection)
+    debug_print(f"Swapped {root.original_collection.name} and {root.game_ready_collection.name}")
 
     # Toggle the swapped state after each swap
-    assets_swapped = not assets_swapped
+    registry.assets_swapped = not registry.assets_swapped
 
-    # Force a viewport update
+    # A single viewport update for the whole swap
     bpy.context.view_layer.update()
 
 # === Baking Functionality for Unreal Engine ===
@@ -677,10 +2254,223 @@ def swap_collections():
 def create_bake_image(obj, map_type, resolution):
     """Create a new blank image to use for baking."""
     width = height = int(resolution)
-    image_name = f"{obj.name}_{map_type}"
+    image_name = f"{asset_name(obj)}_{map_type}"
     image = bpy.data.images.new(image_name, width=width, height=height)
     return image
 
+def pixel_hash(image):
+    """Hashes the pixel content and size of an image."""
+    width, height = image.size
+    pixels = np.empty(width * height * image.channels, dtype=np.float32)
+    image.pixels.foreach_get(pixels)
+    digest = hashlib.sha256(pixels.tobytes())
+    digest.update(f"{width}x{height}x{image.channels}".encode())
+    return digest.hexdigest()
+
+def save_baked_image(image, obj, map_type, save_dir, cache=None, cache_key=None, from_cache=False):
+    """
+    Saves a baked map as '{asset_name(obj)}_{map_type}.png', unless a map with identical pixels was already
+    written during this bake, in which case the existing file is shared and the new image is discarded.
+    Newly written maps are added to the bake cache when a cache key is given.
+    Images restored from the cache are already on disk and are only deduplicated.
+    Returns the path of the file holding the map.
+    """
+    target_path = os.path.join(save_dir, f"{asset_name(obj)}_{map_type}.png")
+    content_hash = pixel_hash(image)
+    stored_path = baked_texture_store.get(content_hash)
+    if stored_path:
+        bpy.data.images.remove(image)
+        if from_cache and os.path.normpath(target_path) != os.path.normpath(stored_path):
+            os.remove(target_path)
+        baked_texture_paths[(asset_name(obj), map_type)] = stored_path
+        debug_print(f"{map_type} of {obj.name} is identical to {os.path.basename(stored_path)}, sharing it.")
+        return stored_path
+
+    if not from_cache:
+        # The old file may be a hardlink into the bake cache, so never write through it
+        if os.path.exists(target_path):
+            os.remove(target_path)
+        image.filepath_raw = target_path
+        image.file_format = 'PNG'
+        image.save()
+        if cache and cache_key:
+            cache.store(cache_key, target_path)
+
+    baked_texture_store[content_hash] = target_path
+    baked_texture_paths[(asset_name(obj), map_type)] = target_path
+    baked_texture_images[target_path] = image.name
+    return target_path
+
+def load_baked_image(texture_path):
+    """Returns the image datablock holding a baked map file, loading the file at most once per bake."""
+    image = bpy.data.images.get(baked_texture_images.get(texture_path, ""))
+    if image is None:
+        image = bpy.data.images.load(texture_path)
+        baked_texture_images[texture_path] = image.name
+    return image
+
+def active_bake_cache():
+    """Returns the bake cache configured in the bake settings, or None if caching is disabled."""
+    settings = bpy.context.scene.mossify_bake_settings
+    if not settings.use_bake_cache or not settings.bake_cache_folder:
+        return None
+    return bake_cache.BakeCache(bpy.path.abspath(settings.bake_cache_folder), settings.bake_cache_size)
+
+# Node properties that don't change what a node computes
+_UNHASHED_NODE_PROPERTIES = {
+    'name', 'label', 'location', 'location_absolute', 'width', 'height', 'width_hidden', 'select',
+    'hide', 'show_options', 'show_preview', 'show_texture', 'color', 'use_custom_color', 'parent',
+    'warning_propagation',
+}
+
+def _hash_array(digest, collection, attribute, count, dtype):
+    """Feeds a property of every item in a bpy collection into the digest, pulled with foreach_get."""
+    values = np.empty(count, dtype=dtype)
+    collection.foreach_get(attribute, values)
+    digest.update(values.tobytes())
+
+def _hash_image(digest, image):
+    """Feeds the content of an image used by a material into the digest."""
+    if image is None:
+        digest.update(b"no-image")
+        return
+
+    image_path = bpy.path.abspath(image.filepath, library=image.library)
+    if image.packed_file:
+        digest.update(hashlib.sha256(image.packed_file.data).digest())
+    elif image.source in {'FILE', 'SEQUENCE', 'MOVIE'} and os.path.isfile(image_path):
+        # File content rather than path, so the key is the same on every machine
+        digest.update(bake_cache.hash_file(image_path).encode())
+    else:
+        digest.update(pixel_hash(image).encode())
+    digest.update(image.colorspace_settings.name.encode())
+
+def _hash_node_tree(digest, node_tree, visited):
+    """Feeds the nodes, settings and links of a node tree and its node groups into the digest."""
+    if node_tree.name_full in visited:
+        return
+    visited.add(node_tree.name_full)
+
+    for node in sorted(node_tree.nodes, key=lambda node: node.name):
+        # Skip the image nodes added as bake targets
+        if node.name.startswith("Bake_"):
+            continue
+        digest.update(f"{node.bl_idname}:{node.name}".encode())
+
+        for prop in node.bl_rna.properties:
+            if prop.is_readonly or prop.identifier in _UNHASHED_NODE_PROPERTIES:
+                continue
+            value = getattr(node, prop.identifier)
+            if isinstance(value, bpy.types.Image):
+                _hash_image(digest, value)
+            elif isinstance(value, bpy.types.NodeTree):
+                _hash_node_tree(digest, value, visited)
+            else:
+                digest.update(f"{prop.identifier}={_signature_value(value)}".encode())
+
+        color_ramp = getattr(node, "color_ramp", None)
+        if color_ramp:
+            for element in color_ramp.elements:
+                digest.update(f"{element.position}:{tuple(element.color)}".encode())
+
+        for socket in node.inputs:
+            if hasattr(socket, "default_value") and not socket.is_linked:
+                digest.update(f"{socket.identifier}={_signature_value(socket.default_value)}".encode())
+
+    links = sorted(f"{link.from_node.name}.{link.from_socket.identifier}>{link.to_node.name}.{link.to_socket.identifier}"
+                   for link in node_tree.links if not link.is_muted)
+    digest.update("|".join(links).encode())
+
+def _hash_mesh(digest, mesh):
+    """Feeds positions, topology, UV layers and shading flags of a mesh into the digest."""
+    _hash_array(digest, mesh.vertices, "co", len(mesh.vertices) * 3, np.float32)
+    _hash_array(digest, mesh.polygons, "loop_total", len(mesh.polygons), np.int32)
+    _hash_array(digest, mesh.polygons, "material_index", len(mesh.polygons), np.int32)
+    _hash_array(digest, mesh.loops, "vertex_index", len(mesh.loops), np.int32)
+
+    # Every UV layer, since materials may sample textures through the original UVs
+    for uv_layer in mesh.uv_layers:
+        digest.update(uv_layer.name.encode())
+        _hash_array(digest, uv_layer.data, "uv", len(uv_layer.data) * 2, np.float32)
+
+    for attribute_name in ("sharp_face", "sharp_edge"):
+        attribute = mesh.attributes.get(attribute_name)
+        if attribute:
+            _hash_array(digest, attribute.data, "value", len(attribute.data), bool)
+
+    if mesh.has_custom_normals:
+        _hash_array(digest, mesh.corner_normals, "vector", len(mesh.loops) * 3, np.float32)
+
+def bake_cache_key(obj, map_type, bake_type, resolution):
+    """
+    Computes the cache key of one baked map: a hash of the converted mesh, the material node trees
+    including the content of their images, and the bake settings.
+    """
+    scene = bpy.context.scene
+    digest = hashlib.sha256()
+    digest.update(repr((bl_info["version"], map_type, bake_type, resolution, scene.cycles.samples,
+                        scene.cycles.use_denoising, scene.cycles.denoiser)).encode())
+
+    _hash_mesh(digest, obj.data)
+    _hash_materials(digest, obj)
+    _hash_high_poly(digest, obj)
+    return digest.hexdigest()
+
+def _hash_materials(digest, obj):
+    """Feeds the node trees of every material of the object into the digest."""
+    visited = set()
+    for mat in obj.data.materials:
+        if mat and mat.use_nodes:
+            _hash_node_tree(digest, mat.node_tree, visited)
+        else:
+            digest.update(b"no-nodes")
+
+def _hash_high_poly(digest, obj):
+    """Feeds the full-detail source of a high to low bake and its cage into the digest, if the object has one."""
+    high_poly = high_poly_source(obj)
+    if high_poly is not None:
+        digest.update(repr(high_poly[CAGE_EXTRUSION_PROPERTY]).encode())
+        _hash_mesh(digest, high_poly.data)
+        _hash_materials(digest, high_poly)
+
+def bake_job_key(obj, resolution):
+    """
+    Computes the journal key of an object's bake: a hash of the mesh, the materials and every setting
+    that changes the baked maps, so journal records of an older state are never reused.
+    """
+    scene = bpy.context.scene
+    settings = scene.mossify_bake_settings
+    digest = hashlib.sha256()
+    digest.update(repr((bl_info["version"], resolution, scene.cycles.samples, sorted(settings.raster_maps),
+                        settings.rasterize_simple_normals, settings.reproject_image_textures)).encode())
+    _hash_mesh(digest, obj.data)
+    _hash_materials(digest, obj)
+    _hash_high_poly(digest, obj)
+    return digest.hexdigest()
+
+def restore_journaled_map(journal, obj, map_type, job_key):
+    """Reuses a map finished by an earlier, interrupted bake. Returns False if the map has to be baked."""
+    if journal is None:
+        return False
+    output = journal.done_output(asset_name(obj), map_type, job_key)
+    if output is None:
+        return False
+    if output:
+        baked_texture_paths[(asset_name(obj), map_type)] = output
+    debug_print(f"{map_type} of {obj.name} was finished by an earlier bake, reusing it.")
+    return True
+
+def restore_cached_map(cache, cache_key, obj, map_type, save_dir):
+    """Places a cached map in the bake folder instead of baking it. Returns False on a cache miss."""
+    target_path = os.path.join(save_dir, f"{asset_name(obj)}_{map_type}.png")
+    if not cache.fetch(cache_key, target_path):
+        return False
+
+    image = bpy.data.images.load(target_path)
+    saved_path = save_baked_image(image, obj, map_type, save_dir, from_cache=True)
+    debug_print(f"Restored {map_type} for {obj.name} from the bake cache as {saved_path}")
+    return True
+
 def assign_image_to_material(obj, image, map_type):
     """Assign a bake image to the active material's shader node for baking."""
     if not obj.data.materials:
@@ -696,8 +2486,287 @@ def assign_image_to_material(obj, image, map_type):
         image_node.name = f"Bake_{map_type}"
         node_tree.nodes.active = image_node  # Set this node as the active node for baking
 
+# Principled BSDF input behind each map the reprojection fast path can build
+REPROJECTED_MAP_INPUTS = {
+    'BaseColor': 'Base Color',
+    'Roughness': 'Roughness',
+    'Normal': 'Normal',
+}
+
+# Principled BSDF inputs that change the diffuse color pass when used
+_DIFFUSE_WEIGHT_INPUTS = ('Metallic', 'Transmission Weight', 'Subsurface Weight', 'Coat Weight', 'Sheen Weight')
+
+# Image color spaces whose pixels are already linear
+_LINEAR_COLORSPACES = {'Non-Color', 'Raw', 'Linear', 'Linear Rec.709'}
+
+# Rec.709 luminance weights, used by Cycles to turn a color into a float
+_LUMINANCE = np.array([0.2126, 0.7152, 0.0722], dtype=np.float32)
+
+def linked_source(socket):
+    """Returns the active link feeding an input socket, or None if the input uses its own value."""
+    for link in socket.links:
+        if link.is_valid and not link.is_muted:
+            return link
+    return None
+
+def image_texture_source(link, default_uv_layer):
+    """
+    Describes the Image Texture node feeding a link, if its image can be resampled directly:
+    a flat projection, repeat or extend wrapping, a known color space, and plain UV coordinates.
+    Returns None otherwise.
+    """
+    node = link.from_node
+    if node.type != 'TEX_IMAGE' or node.mute or link.from_socket.name not in ('Color', 'Alpha'):
+        return None
+
+    image = node.image
+    if image is None or image.source not in {'FILE', 'GENERATED'}:
+        return None
+    if node.projection != 'FLAT' or node.extension not in {'REPEAT', 'EXTEND'}:
+        return None
+    if image.colorspace_settings.name != 'sRGB' and image.colorspace_settings.name not in _LINEAR_COLORSPACES:
+        return None
+
+    uv_layer = default_uv_layer
+    vector_link = linked_source(node.inputs['Vector'])
+    if vector_link:
+        coordinates = vector_link.from_node
+        if coordinates.mute or coordinates.from_instancer:
+            return None
+        if coordinates.type == 'UVMAP':
+            uv_layer = coordinates.uv_map or default_uv_layer
+        elif not (coordinates.type == 'TEX_COORD' and vector_link.from_socket.name == 'UV'):
+            return None
+
+    return {
+        'image': image,
+        'output': link.from_socket.name,
+        'uv_layer': uv_layer,
+        'interpolation': node.interpolation,
+        'extension': node.extension,
+    }
+
+def reprojection_source(mat, map_type, default_uv_layer):
+    """
+    Recognizes materials whose map is an Image Texture, or a constant, feeding a Principled BSDF
+    that feeds the output directly. Returns {'constant': rgba} or an image_texture_source description,
+    with the 'tangent_layer' of the Normal Map node for normal maps, or None when Cycles is needed.
+    """
+    if mat is None or not mat.use_nodes:
+        return None
+
+    outputs = [node for node in mat.node_tree.nodes
+               if node.type == 'OUTPUT_MATERIAL' and node.is_active_output and node.target in {'ALL', 'CYCLES'}]
+    if len(outputs) != 1 or linked_source(outputs[0].inputs['Displacement']):
+        return None
+    surface_link = linked_source(outputs[0].inputs['Surface'])
+    if surface_link is None or surface_link.from_node.type != 'BSDF_PRINCIPLED' or surface_link.from_node.mute:
+        return None
+    principled = surface_link.from_node
+
+    if map_type == 'BaseColor':
+        for input_name in _DIFFUSE_WEIGHT_INPUTS:
+            socket = principled.inputs.get(input_name)
+            if socket is not None and (linked_source(socket) or socket.default_value != 0.0):
+                return None
+
+    socket = principled.inputs[REPROJECTED_MAP_INPUTS[map_type]]
+    link = linked_source(socket)
+    if link is None:
+        if map_type == 'Normal':
+            return {'constant': (0.5, 0.5, 1.0, 1.0)}
+        if map_type == 'BaseColor':
+            return {'constant': tuple(socket.default_value)}
+        return {'constant': (socket.default_value,) * 3 + (1.0,)}
+
+    if map_type != 'Normal':
+        return image_texture_source(link, default_uv_layer)
+
+    # Normals must come from a tangent-space Normal Map node at full strength
+    normal_map = link.from_node
+    if normal_map.type != 'NORMAL_MAP' or normal_map.mute or normal_map.space != 'TANGENT':
+        return None
+    strength = normal_map.inputs['Strength']
+    if linked_source(strength) or abs(strength.default_value - 1.0) > 1e-6:
+        return None
+    color_link = linked_source(normal_map.inputs['Color'])
+    if color_link is None:
+        return {'constant': (0.5, 0.5, 1.0, 1.0)}
+
+    source = image_texture_source(color_link, default_uv_layer)
+    if source:
+        source['tangent_layer'] = normal_map.uv_map or default_uv_layer
+    return source
+
+def linear_image_pixels(image, cache):
+    """
+    Returns the pixels of an image as a (height, width, 4) array in scene linear, read once per image.
+    Returns None if the image has no pixels, e.g. a missing file.
+    """
+    if image.name not in cache:
+        width, height = image.size
+        if width == 0 or height == 0:
+            cache[image.name] = None
+            return None
+
+        channels = image.channels
+        pixels = np.empty(width * height * channels, dtype=np.float32)
+        image.pixels.foreach_get(pixels)
+        pixels = pixels.reshape(height, width, channels)
+
+        # Expand grey and RGB images to RGBA
+        if channels < 3:
+            pixels = np.concatenate([np.repeat(pixels[..., :1], 3, axis=2),
+                                     pixels[..., 1:2] if channels == 2 else np.ones_like(pixels[..., :1])], axis=2)
+        elif channels == 3:
+            pixels = np.concatenate([pixels, np.ones_like(pixels[..., :1])], axis=2)
+
+        # Byte images hold their encoded values, float images are already linear
+        if not image.is_float and image.colorspace_settings.name == 'sRGB':
+            pixels[..., :3] = uv_raster.srgb_to_linear(pixels[..., :3])
+        cache[image.name] = pixels
+    return cache[image.name]
+
+def loop_uvs(mesh, layer_name, cache):
+    """Returns the UV coordinates of every loop on a UV layer, read once per layer."""
+    if layer_name not in cache:
+        uvs = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+        mesh.uv_layers[layer_name].data.foreach_get("uv", uvs)
+        cache[layer_name] = uvs.reshape(-1, 2)
+    return cache[layer_name]
+
+def loop_tangents(mesh, layer_name, cache):
+    """
+    Returns the tangents and bitangent signs of every loop for a UV layer, read once per layer.
+    Returns None when Blender can't compute tangents for the mesh, e.g. because it has n-gons.
+    """
+    if layer_name not in cache:
+        try:
+            mesh.calc_tangents(uvmap=layer_name)
+        except RuntimeError:
+            cache[layer_name] = None
+            return None
+        tangents = np.empty(len(mesh.loops) * 3, dtype=np.float32)
+        mesh.loops.foreach_get("tangent", tangents)
+        signs = np.empty(len(mesh.loops), dtype=np.float32)
+        mesh.loops.foreach_get("bitangent_sign", signs)
+        mesh.free_tangents()
+        cache[layer_name] = (tangents.reshape(-1, 3), signs)
+    return cache[layer_name]
+
+def reproject_and_save(obj, map_type, resolution, save_dir):
+    """
+    Builds a map of an object whose materials are image textures on a Principled BSDF by resampling
+    the source images from their UV layers into 'GameUV', with normals converted between the tangent
+    frames of both layouts. Cycles is never started.
+    Returns False, without writing anything, when any material on the mesh needs a real bake.
+    """
+    mesh = obj.data
+    target_layer = mesh.uv_layers.get("GameUV") or mesh.uv_layers.active
+    if target_layer is None or not obj.material_slots:
+        return False
+    default_uv_layer = next((layer.name for layer in mesh.uv_layers if layer.active_render), target_layer.name)
+
+    tri_loops, tri_uvs = raster_triangles(mesh)
+    if len(tri_loops) == 0:
+        return False
+    material_indices = np.empty(len(mesh.loop_triangles), dtype=np.int32)
+    mesh.loop_triangles.foreach_get("material_index", material_indices)
+    material_indices = np.minimum(material_indices, len(obj.material_slots) - 1)
+
+    # Every material used by the mesh must follow the pattern, before any pixel work is done
+    sources = {}
+    textures = {}
+    for slot_index in np.unique(material_indices).tolist():
+        source = reprojection_source(obj.material_slots[slot_index].material, map_type, default_uv_layer)
+        if source and 'image' in source:
+            if (mesh.uv_layers.get(source['uv_layer']) is None or
+                    linear_image_pixels(source['image'], textures) is None):
+                source = None
+            elif map_type == 'Normal' and mesh.uv_layers.get(source['tangent_layer']) is None:
+                source = None
+        if source is None:
+            debug_print(f"{map_type} of {obj.name} can't be reprojected, baking it with Cycles.")
+            return False
+        sources[slot_index] = source
+
+    width = height = int(resolution)
+    tri_ids, weights = uv_raster.rasterize_barycentric(tri_uvs, width, height)
+    covered = tri_ids >= 0
+    pixel_tris = tri_ids[covered]
+    pixel_weights = weights[covered]
+    pixel_slots = material_indices[pixel_tris]
+
+    colors = np.zeros((len(pixel_tris), 4), dtype=np.float32)
+    uv_cache = {}
+    tangent_cache = {}
+    corner_normals = None
+    for slot_index, source in sources.items():
+        selected = pixel_slots == slot_index
+        if not selected.any():
+            continue
+
+        if 'constant' in source:
+            colors[selected] = source['constant']
+            continue
+
+        tris = pixel_tris[selected]
+        tri_weights = pixel_weights[selected]
+        source_uvs = uv_raster.interpolate(loop_uvs(mesh, source['uv_layer'], uv_cache)[tri_loops], tris, tri_weights)
+        sample = uv_raster.sample_texture(textures[source['image'].name], source_uvs,
+                                          source['interpolation'], source['extension'])
+
+        if source['output'] == 'Alpha':
+            sample[:, :3] = sample[:, 3:4]
+        elif map_type == 'Roughness':
+            sample[:, :3] = (sample[:, :3] @ _LUMINANCE)[:, None]
+
+        if map_type == 'Normal':
+            source_frames = loop_tangents(mesh, source['tangent_layer'], tangent_cache)
+            target_frames = loop_tangents(mesh, target_layer.name, tangent_cache)
+            if source_frames is None or target_frames is None:
+                debug_print(f"No tangents for {obj.name}, baking {map_type} with Cycles.")
+                return False
+            if corner_normals is None:
+                corner_normals = np.empty(len(mesh.loops) * 3, dtype=np.float32)
+                mesh.corner_normals.foreach_get("vector", corner_normals)
+                corner_normals = corner_normals.reshape(-1, 3)[tri_loops]
+
+            first_corners = tri_loops[tris, 0]
+            sample[:, :3] = uv_raster.retarget_normals(
+                sample, uv_raster.interpolate(corner_normals, tris, tri_weights),
+                uv_raster.interpolate(source_frames[0][tri_loops], tris, tri_weights), source_frames[1][first_corners],
+                uv_raster.interpolate(target_frames[0][tri_loops], tris, tri_weights), target_frames[1][first_corners])
+        colors[selected] = sample
+
+    image = create_bake_image(obj, map_type, resolution)
+
+    # Bakes write colors encoded for the target image, normals are stored as they are
+    if map_type != 'Normal' and image.colorspace_settings.name == 'sRGB':
+        colors[:, :3] = uv_raster.linear_to_srgb(colors[:, :3])
+    colors[:, 3] = 1.0
+
+    pixels = np.zeros((height, width, 4), dtype=np.float32)
+    pixels[..., 3] = 1.0
+    pixels[covered] = colors
+    uv_raster.dilate(pixels, covered, bpy.context.scene.render.bake.margin)
+    image.pixels.foreach_set(pixels.ravel())
+
+    saved_path = save_baked_image(image, obj, map_type, save_dir)
+    debug_print(f"Reprojected {map_type} for {obj.name} and saved as {saved_path}")
+    return True
+
 def bake_and_save(obj, bake_type, map_type, resolution, save_dir):
-    """Bake the specified map and save it as an image in the given directory."""
+    """
+    Bake the specified map and save it as an image in the given directory.
+    Returns how the map was made: 'REPROJECT', 'FILL', 'CACHED', or the Cycles bake type used.
+    """
+    # Image-textured materials are resampled into the new UV layout instead of path-traced,
+    # unless the detail comes from a full-detail source
+    if (map_type in REPROJECTED_MAP_INPUTS and bpy.context.scene.mossify_bake_settings.reproject_image_textures
+            and high_poly_source(obj) is None and reproject_and_save(obj, map_type, resolution, save_dir)):
+        return 'REPROJECT'
+
     # Ensure Cycles render engine is active
     ensure_cycles_render_engine()
 
@@ -710,7 +2779,7 @@ def bake_and_save(obj, bake_type, map_type, resolution, save_dir):
     if map_type == "Metallic":
         # Create a black image for the metallic map
         width = height = int(resolution)
-        image_name = f"{obj.name}_{map_type}"
+        image_name = f"{asset_name(obj)}_{map_type}"
         image = bpy.data.images.new(image_name, width=width, height=height, alpha=True)
 
         # Fill the image with black pixels
@@ -719,13 +2788,19 @@ def bake_and_save(obj, bake_type, map_type, resolution, save_dir):
         image.pixels = pixels
 
         # Save the image
-        image.filepath_raw = os.path.join(save_dir, f"{obj.name}_{map_type}.png")
-        image.file_format = 'PNG'
-        image.save()
+        saved_path = save_baked_image(image, obj, map_type, save_dir)
 
-        debug_print(f"Created black image for {map_type} of {obj.name} and saved as {image.filepath_raw}")
-        return
+        debug_print(f"Created black image for {map_type} of {obj.name} and saved as {saved_path}")
+        return 'FILL'
     else:
+        # Reuse an earlier bake of the same mesh, materials and settings if there is one
+        cache = active_bake_cache()
+        cache_key = None
+        if cache:
+            cache_key = bake_cache_key(obj, map_type, bake_type, resolution)
+            if restore_cached_map(cache, cache_key, obj, map_type, save_dir):
+                return 'CACHED'
+
         # Proceed with the regular baking process for other map types
         # Create a new image for the bake
         image = create_bake_image(obj, map_type, resolution)
@@ -766,24 +2841,38 @@ def bake_and_save(obj, bake_type, map_type, resolution, save_dir):
         bpy.context.scene.render.bake.use_pass_color = prev_use_pass_color
 
         # Save the image
-        image.filepath_raw = os.path.join(save_dir, f"{obj.name}_{map_type}.png")
-        image.file_format = 'PNG'
-        image.save()
+        saved_path = save_baked_image(image, obj, map_type, save_dir, cache, cache_key)
 
-        debug_print(f"Baked {map_type} for {obj.name} and saved as {image.filepath_raw}")
+        debug_print(f"Baked {map_type} for {obj.name} and saved as {saved_path}")
+        return bake_type_used
                     
 def bake_alpha_map(obj, resolution, save_dir):
-    """Bake the alpha channel as an emission map and restore the original shader setup after baking."""
+    """
+    Bake the alpha channel as an emission map and restore the original shader setup after baking.
+    Returns 'CACHED' if an earlier bake was reused, 'EMIT' otherwise.
+    """
     
     # Ensure Cycles render engine is active
     ensure_cycles_render_engine()
 
+    # Reuse an earlier bake of the same mesh, materials and settings if there is one
+    cache = active_bake_cache()
+    cache_key = None
+    if cache:
+        cache_key = bake_cache_key(obj, "Alpha", 'EMIT', resolution)
+        if restore_cached_map(cache, cache_key, obj, "Alpha", save_dir):
+            return 'CACHED'
+
     # Create an image to bake the alpha
     image = create_bake_image(obj, "Alpha", resolution)
     
+    # A high to low bake shades the full-detail source, so its materials emit the alpha
+    high_poly = high_poly_source(obj)
+    shading_materials = list((high_poly or obj).data.materials)
+
     # Store the materials and their original links to restore later
     materials_original_links = {}
-    for mat in obj.data.materials:
+    for mat in shading_materials:
         if not mat.use_nodes:
             continue
 
@@ -829,22 +2918,25 @@ def bake_alpha_map(obj, resolution, save_dir):
         node_tree.links.new(emission_node.outputs['Emission'], material_output_node.inputs['Surface'])
 
         # Assign the image to the active material for baking
-        image_node = node_tree.nodes.new('ShaderNodeTexImage')
-        image_node.image = image
-        node_tree.nodes.active = image_node  # Set this node as active for baking
+        if high_poly is None:
+            image_node = node_tree.nodes.new('ShaderNodeTexImage')
+            image_node.image = image
+            node_tree.nodes.active = image_node  # Set this node as active for baking
+
+    # The image is baked into the game mesh's own materials
+    if high_poly is not None:
+        assign_image_to_material(obj, image, "Alpha")
 
     # Perform the bake with emission type
     bpy.context.scene.cycles.bake_type = 'EMIT'
     bpy.ops.object.bake(type='EMIT')
 
     # Save the image
-    image.filepath_raw = os.path.join(save_dir, f"{obj.name}_Alpha.png")
-    image.file_format = 'PNG'
-    image.save()
-    debug_print(f"Baked Alpha for {obj.name} and saved as {image.filepath_raw}")
+    saved_path = save_baked_image(image, obj, "Alpha", save_dir, cache, cache_key)
+    debug_print(f"Baked Alpha for {obj.name} and saved as {saved_path}")
 
     # Clean up: Remove the emission nodes and restore the original material setup
-    for mat in obj.data.materials:
+    for mat in shading_materials:
         if not mat.use_nodes:
             continue
 
@@ -866,19 +2958,137 @@ def bake_alpha_map(obj, resolution, save_dir):
         for from_socket, to_socket in original_links:
             node_tree.links.new(from_socket, to_socket)
         debug_print(f"Restored original shader connections for material {mat.name}")
+    return 'EMIT'
+
+# Shader nodes that perturb the shading normal
+_NORMAL_DETAIL_NODES = {'NORMAL_MAP', 'BUMP', 'DISPLACEMENT', 'VECTOR_DISPLACEMENT'}
 
-def bake_all_maps_for_object(obj, resolution, save_dir):
+def node_tree_adds_normal_detail(node_tree, visited):
+    """Checks whether a node tree, or a node group inside it, changes the shading normal."""
+    if node_tree in visited:
+        return False
+    visited.add(node_tree)
+
+    for node in node_tree.nodes:
+        if node.mute:
+            continue
+        if node.type in _NORMAL_DETAIL_NODES:
+            return True
+        if node.type == 'GROUP' and node.node_tree and node_tree_adds_normal_detail(node.node_tree, visited):
+            return True
+        for socket_name in ('Normal', 'Displacement'):
+            socket = node.inputs.get(socket_name)
+            if socket is not None and socket.is_linked:
+                return True
+    return False
+
+def has_flat_normal_map(obj):
     """
-    Bake all the necessary maps (diffuse, roughness, metallic, normal, alpha) for the object,
-    then apply them to the object by setting up a Principled BSDF shader.
-    Once all maps are baked and applied, simplify materials and UV maps.
+    Checks whether the baked normal map of the object would be flat: no material adds normal detail,
+    and the bake writes plain tangent-space normals.
     """
-    global bake_progress
+    bake = bpy.context.scene.render.bake
+    if bake.normal_space != 'TANGENT' or (bake.normal_r, bake.normal_g, bake.normal_b) != ('POS_X', 'POS_Y', 'POS_Z'):
+        return False
 
-    # Ensure the object is active and selected
-    bpy.context.view_layer.objects.active = obj
-    obj.select_set(True)
+    # The geometry of a full-detail source ends up in the normal map
+    if high_poly_source(obj) is not None:
+        return False
+
+    visited = set()
+    for mat in obj.data.materials:
+        if mat and mat.use_nodes and node_tree_adds_normal_detail(mat.node_tree, visited):
+            return False
+    return True
+
+def raster_triangles(mesh):
+    """
+    Returns the corner loops (T, 3) of the mesh's triangles and their UV corners (T, 3, 2) on the 'GameUV'
+    layer, or the active UV layer when there is none. The UV corners are None if the mesh has no UVs.
+    """
+    mesh.calc_loop_triangles()
+    tri_loops = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get("loops", tri_loops)
+    tri_loops = tri_loops.reshape(-1, 3)
+
+    uv_layer = mesh.uv_layers.get("GameUV") or mesh.uv_layers.active
+    if uv_layer is None:
+        return tri_loops, None
+
+    uvs = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+    uv_layer.data.foreach_get("uv", uvs)
+    return tri_loops, uvs.reshape(-1, 2)[tri_loops]
+
+def raster_corner_values(mesh, map_type, tri_loops):
+    """Returns the RGBA value of a rasterized map at each triangle corner, as a (T, 3, 4) array."""
+    if map_type == 'Normal':
+        # Without normal detail the tangent-space normal is the surface normal itself
+        return np.broadcast_to(np.array([0.5, 0.5, 1.0, 1.0], dtype=np.float32), tri_loops.shape + (4,))
+
+    if map_type == 'MaterialID':
+        material_indices = np.empty(len(mesh.loop_triangles), dtype=np.int32)
+        mesh.loop_triangles.foreach_get("material_index", material_indices)
+        colors = uv_raster.id_colors(max(len(mesh.materials), 1))
+        tri_colors = colors[np.minimum(material_indices, len(colors) - 1)]
+        tri_colors = np.concatenate([tri_colors, np.ones((len(tri_colors), 1), dtype=np.float32)], axis=1)
+        return np.repeat(tri_colors[:, None, :], 3, axis=1)
+
+    if map_type == 'ObjectNormal':
+        normals = np.empty(len(mesh.loops) * 3, dtype=np.float32)
+        mesh.corner_normals.foreach_get("vector", normals)
+        corner_values = normals.reshape(-1, 3) * 0.5 + 0.5
+    else:
+        positions = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", positions)
+        positions = positions.reshape(-1, 3)
+        loop_vertices = np.empty(len(mesh.loops), dtype=np.int32)
+        mesh.loops.foreach_get("vertex_index", loop_vertices)
+
+        if map_type == 'Position':
+            low = positions.min(axis=0)
+            extent = np.maximum(positions.max(axis=0) - low, 1e-8)
+            vertex_values = (positions - low) / extent
+        else:  # Curvature
+            vertex_normals = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+            mesh.vertex_normals.foreach_get("vector", vertex_normals)
+            edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+            mesh.edges.foreach_get("vertices", edges)
+            curvature = uv_raster.vertex_curvature(positions, vertex_normals.reshape(-1, 3), edges)
+            vertex_values = np.repeat(curvature[:, None], 3, axis=1)
+        corner_values = vertex_values[loop_vertices]
+
+    corner_values = np.concatenate([corner_values, np.ones((len(corner_values), 1))], axis=1).astype(np.float32)
+    return corner_values[tri_loops]
+
+def rasterize_and_save(obj, map_type, resolution, save_dir):
+    """
+    Compute a map from the mesh alone by rasterizing its UV layout, padded like a Cycles bake,
+    and save it like a baked map. No render engine is involved.
+    Returns 'RASTER', or None if the object has no UV map to rasterize.
+    """
+    mesh = obj.data
+    tri_loops, tri_uvs = raster_triangles(mesh)
+    if tri_uvs is None:
+        debug_print(f"{obj.name} has no UV map, skipping {map_type}.")
+        return None
 
+    width = height = int(resolution)
+    values = raster_corner_values(mesh, map_type, tri_loops)
+    pixels, mask = uv_raster.rasterize(tri_uvs, values, width, height)
+    uv_raster.dilate(pixels, mask, bpy.context.scene.render.bake.margin)
+
+    image = create_bake_image(obj, map_type, resolution)
+    image.pixels.foreach_set(pixels.ravel())
+
+    saved_path = save_baked_image(image, obj, map_type, save_dir)
+    debug_print(f"Rasterized {map_type} for {obj.name} and saved as {saved_path}")
+    return 'RASTER'
+
+def maps_for_object(obj):
+    """
+    Returns the maps to produce for the object with the current settings, and how each is made:
+    a Cycles bake type, 'RASTER' for maps computed from the mesh, or 'EMIT' for the alpha map.
+    """
     # Define the map types and corresponding bake types
     maps_to_bake = {
         'BaseColor': 'DIFFUSE',
@@ -887,94 +3097,456 @@ def bake_all_maps_for_object(obj, resolution, save_dir):
         'Normal': 'NORMAL',
     }
 
-    # Bake each map type
-    for map_type, bake_type in maps_to_bake.items():
-        bake_and_save(obj, bake_type, map_type, resolution, save_dir)
+    # Maps that only depend on the mesh are rasterized instead of baked
+    settings = bpy.context.scene.mossify_bake_settings
+    if settings.rasterize_simple_normals and has_flat_normal_map(obj):
+        maps_to_bake['Normal'] = 'RASTER'
+    for map_type, _name, _description in RASTER_MAP_ITEMS:
+        if map_type in settings.raster_maps:
+            maps_to_bake[map_type] = 'RASTER'
 
-    # Bake the alpha map as emission
-    bake_alpha_map(obj, resolution, save_dir)
+    # The alpha map is baked as emission
+    maps_to_bake['Alpha'] = 'EMIT'
 
-    # Apply the baked textures to the object's material
-    apply_baked_textures(obj, save_dir)
+    # Only the selected map set is baked
+    return {map_type: bake_type for map_type, bake_type in maps_to_bake.items()
+            if map_type in settings.bake_maps or map_type in settings.raster_maps}
 
-    # Simplify materials and UV maps after baking and applying textures
-    simplify_materials_and_uv_maps(obj)
+def bake_map(obj, map_type, bake_type, resolution, save_dir):
+    """
+    Produces one map of the object, as returned by maps_for_object, and saves it in save_dir.
+    Returns how the map was made, the bake method timed for the cost model, or 'CACHED' or None.
+    """
+    if bake_type == 'RASTER':
+        return rasterize_and_save(obj, map_type, resolution, save_dir)
+    with high_poly_bake(obj):
+        if map_type == 'Alpha':
+            return bake_alpha_map(obj, resolution, save_dir)
+        return bake_and_save(obj, bake_type, map_type, resolution, save_dir)
+
+def bake_timings_path():
+    """Returns the file recording the timings of bakes on this machine."""
+    return os.path.join(bpy.utils.user_resource('CONFIG', path="assetify", create=True), TIMINGS_FILE)
+
+def record_bake_timings(timings):
+    """Adds timings to the ones calibrating the cost model. A timings file that can't be written is not an error."""
+    try:
+        cost_model.record_timings(bake_timings_path(), timings)
+    except OSError as e:
+        debug_print(f"Could not record bake timings: {e}")
+
+def bake_cost_model():
+    """Returns the cost model, calibrated with the timings recorded on this machine."""
+    return cost_model.CostModel.fit(cost_model.load_timings(bake_timings_path()))
+
+def shader_node_count(obj):
+    """Counts the shader nodes of the object's materials, including the nodes inside node groups."""
+    node_trees = [slot.material.node_tree for slot in obj.material_slots
+                  if slot.material and slot.material.use_nodes and slot.material.node_tree]
+    visited = set()
+    count = 0
+    while node_trees:
+        node_tree = node_trees.pop()
+        if node_tree in visited:
+            continue
+        visited.add(node_tree)
+        count += len(node_tree.nodes)
+        node_trees.extend(node.node_tree for node in node_tree.nodes if node.type == 'GROUP' and node.node_tree)
+    return count
+
+def mesh_triangle_count(mesh):
+    """Counts the triangles of a mesh from its polygon sizes."""
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    return int(np.maximum(loop_totals - 2, 0).sum())
+
+def bake_job_inputs(obj, map_type, bake_type, resolution):
+    """Returns what the cost model needs to predict the time of producing one map of the object."""
+    # The metallic map is filled rather than baked
+    method = 'FILL' if map_type == 'Metallic' and bake_type != 'RASTER' else bake_type
+    return {
+        'map': map_type,
+        'method': method,
+        # A high to low bake traces the full-detail source
+        'triangles': mesh_triangle_count((high_poly_source(obj) or obj).data),
+        'resolution': int(resolution),
+        'samples': bpy.context.scene.mossify_bake_settings.bake_samples,
+        'nodes': shader_node_count(obj),
+    }
+
+def predict_object_seconds(model, obj, resolution):
+    """Predicts the time of baking every map of the object."""
+    return sum(model.predict(bake_job_inputs(obj, map_type, bake_type, resolution))
+               for map_type, bake_type in maps_for_object(obj).items())
+
+def atlas_job_inputs(members, resolution):
+    """
+    Returns the cost model inputs of baking an atlas, one per map: the atlas is baked as one object
+    holding the triangles and materials of all its members. A map is only rasterized if it is for every member.
+    """
+    maps = {}
+    for obj in members:
+        for map_type, bake_type in maps_for_object(obj).items():
+            if maps.get(map_type) in (None, 'RASTER'):
+                maps[map_type] = bake_type
+
+    jobs = []
+    for map_type, bake_type in maps.items():
+        member_jobs = [bake_job_inputs(obj, map_type, bake_type, resolution) for obj in members]
+        jobs.append(dict(member_jobs[0], triangles=sum(job['triangles'] for job in member_jobs),
+                         nodes=sum(job['nodes'] for job in member_jobs)))
+    return jobs
+
+def plan_atlas_names(plan):
+    """Returns the atlas of every atlas object of a bake plan, by object name."""
+    return {obj.name: name for name, members in plan['atlases'].items() for obj in members}
+
+def predict_bake_seconds(model, plan, objects):
+    """
+    Predicts the bake time of each object, by name. The objects of an atlas are finished together,
+    so they share the predicted time of the atlas bake at the atlas resolution.
+    """
+    settings = bpy.context.scene.mossify_bake_settings
+    atlas_names = plan_atlas_names(plan)
+    atlas_seconds = {}
+    predictions = {}
+    for obj in objects:
+        name = atlas_names.get(obj.name)
+        if name is None:
+            predictions[obj.name] = predict_object_seconds(model, obj, settings.bake_resolution)
+            continue
+        if name not in atlas_seconds:
+            members = plan['atlases'][name]
+            atlas_seconds[name] = (sum(model.predict(job) for job in atlas_job_inputs(members, settings.atlas_resolution))
+                                   / len(members))
+        predictions[obj.name] = atlas_seconds[name]
+    return predictions
+
+def bake_all_maps_for_object(obj, resolution, save_dir, journal=None, job_key=None):
+    """
+    Bake all the necessary maps (diffuse, roughness, metallic, normal, alpha) for the object,
+    then apply them to the object by setting up a Principled BSDF shader.
+    Once all maps are baked and applied, simplify materials and UV maps.
+    With a journal, every map is recorded as it finishes and maps finished by an earlier bake are reused.
+    """
+    global bake_progress
+
+    # Ensure the object is active and selected
+    bpy.context.view_layer.objects.active = obj
+    obj.select_set(True)
+
+    bake_object_maps(obj, resolution, save_dir, journal, job_key)
+    finish_baked_object(obj, save_dir)
 
     # Update the progress after baking this object
     bake_progress += 1
 
     # Force UI to refresh (to update the overlay)
-    bpy.ops.wm.redraw_timer(type='DRAW_WIN_SWAP', iterations=1)
+    redraw_progress()
 
     # Deselect the object after baking
     obj.select_set(False)
 
-def apply_baked_textures(obj, save_dir):
+def bake_object_maps(obj, resolution, save_dir, journal=None, job_key=None):
+    """Bakes every map of the selected, active object into save_dir, without applying them."""
+    # Bake each map type, timing the maps that were really produced for the cost model
+    timings = []
+    for map_type, bake_type in maps_for_object(obj).items():
+        if restore_journaled_map(journal, obj, map_type, job_key):
+            continue
+        if journal:
+            journal.record(asset_name(obj), map_type, 'pending', job_key)
+
+        start_time = time.perf_counter()
+        method = bake_map(obj, map_type, bake_type, resolution, save_dir)
+        if method not in (None, 'CACHED'):
+            timings.append(dict(bake_job_inputs(obj, map_type, bake_type, resolution), method=method,
+                                seconds=round(time.perf_counter() - start_time, 3)))
+
+        if journal:
+            journal.record(asset_name(obj), map_type, 'done', job_key,
+                           baked_texture_paths.get((asset_name(obj), map_type)))
+
+    record_bake_timings(timings)
+
+def finish_baked_object(obj, save_dir):
+    """Applies the baked maps of the object to its material, then simplifies its materials and UV maps."""
+    # Apply the baked textures to the object's material
+    apply_baked_textures(obj, save_dir)
+
+    # Simplify materials and UV maps after baking and applying textures
+    simplify_materials_and_uv_maps(obj)
+
+def atlas_groups(objects):
     """
-    Apply the baked textures to the object's material by setting up a Principled BSDF shader.
-    The textures (BaseColor, Roughness, Normal, etc.) are loaded from the save directory.
-    This function does not remove material slots or rename UV maps, which are handled after the application.
+    Groups the objects to bake into atlases as set by the atlas mode: objects in the same collection
+    share an atlas. Returns the atlases of more than one object, by name, with their objects in order.
+    Objects decimated for the high to low bake are left out: an atlas is baked from the shading of its
+    own meshes, which would lose the detail of their full-detail sources, so they are baked on their own.
     """
-    # Ensure the object has a material, or create a new one
-    if not obj.data.materials:
-        new_material = bpy.data.materials.new(name=f"{obj.name}_Material")
-        obj.data.materials.append(new_material)
-    else:
-        new_material = obj.data.materials[0]  # Assuming we use the first material for simplicity
+    groups = {}
+    if bpy.context.scene.mossify_bake_settings.atlas_mode == 'OFF':
+        return groups
+    for obj in objects:
+        if obj.type == 'MESH' and obj.users_collection and high_poly_source(obj) is None:
+            groups.setdefault(obj.users_collection[0].name, []).append(obj)
+    return {name: members for name, members in groups.items() if len(members) > 1}
+
+def atlas_key(name, members, resolution):
+    """Identifies an atlas layout: its name, resolution and objects."""
+    return hashlib.sha256(repr((name, resolution, sorted(asset_name(obj) for obj in members))).encode()).hexdigest()
+
+def atlas_job_key(members, resolution):
+    """Computes the journal key of an atlas bake from the keys of its objects."""
+    return hashlib.sha256("".join(bake_job_key(obj, resolution) for obj in members).encode()).hexdigest()
+
+def pack_atlas_uvs(name, members, resolution):
+    """
+    Packs the 'GameUV' islands of the atlas objects together into one UV space, at a common texel
+    density and with twice the bake margin between islands. Objects already packed as this atlas
+    are left alone, so packing twice gives the same layout.
+    """
+    key = atlas_key(name, members, resolution)
+    if all(obj.data.get("assetify_atlas") == key for obj in members):
+        return
+
+    for other in bpy.context.selected_objects:
+        other.select_set(False)
+    for obj in members:
+        obj.select_set(True)
+        game_uv = obj.data.uv_layers.get("GameUV")
+        if game_uv:
+            obj.data.uv_layers.active = game_uv
+    bpy.context.view_layer.objects.active = members[0]
 
-    # Enable 'Use Nodes' if not already enabled
-    if not new_material.use_nodes:
-        new_material.use_nodes = True
+    # Multi-object edit mode packs the islands of all the objects together
+    bpy.ops.object.mode_set(mode='EDIT')
+    bpy.ops.mesh.select_all(action='SELECT')
+    bpy.ops.uv.select_all(action='SELECT')
+    bpy.ops.uv.average_islands_scale()
+    margin = 2 * bpy.context.scene.render.bake.margin / int(resolution)
+    bpy.ops.uv.pack_islands(rotate=True, margin_method='FRACTION', margin=margin)
+    bpy.ops.object.mode_set(mode='OBJECT')
+
+    for obj in members:
+        obj.data["assetify_atlas"] = key
+        obj.select_set(False)
+    debug_print(f"Packed the UVs of {len(members)} objects into atlas {name}")
+
+def pack_atlases(plan):
+    """Packs the UVs of every atlas of a bake plan, see pack_atlas_uvs."""
+    resolution = bpy.context.scene.mossify_bake_settings.atlas_resolution
+    for name, members in plan['atlases'].items():
+        pack_atlas_uvs(name, members, resolution)
+
+def atlas_proxy(name, members):
+    """
+    Joins copies of the atlas objects into one temporary object, so the whole atlas is baked with
+    one bake per map. The copies keep their materials and their places in the world.
+    """
+    copies = []
+    for obj in members:
+        copy = obj.copy()
+        copy.data = obj.data.copy()
+        bpy.context.scene.collection.objects.link(copy)
+        copies.append(copy)
+
+    for other in bpy.context.selected_objects:
+        other.select_set(False)
+    for copy in copies:
+        copy.select_set(True)
+    proxy = copies[0]
+    bpy.context.view_layer.objects.active = proxy
+
+    joined_meshes = [copy.data for copy in copies[1:]]
+    with bpy.context.temp_override(active_object=proxy, selected_editable_objects=copies):
+        bpy.ops.object.join()
+    for mesh in joined_meshes:
+        if mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
+
+    # The proxy is baked under its own name, not under the LOD0 name of the first copy
+    proxy.pop(LOD_BASE_NAME_PROPERTY, None)
+    proxy.name = f"{name}_Atlas"
+    return proxy
+
+def bake_atlas(name, members, resolution, save_dir, journal=None, job_key=None):
+    """
+    Bakes the objects of an atlas into shared maps, one bake per map for the whole atlas, and gives
+    them all one material using those maps. Their UVs must already be packed, see pack_atlas_uvs.
+    """
+    global bake_progress
+
+    proxy = atlas_proxy(name, members)
+    proxy_name = proxy.name
+    try:
+        bake_object_maps(proxy, resolution, save_dir, journal, job_key)
+    finally:
+        proxy_mesh = proxy.data
+        bpy.data.objects.remove(proxy)
+        if proxy_mesh.users == 0:
+            bpy.data.meshes.remove(proxy_mesh)
+
+    # Every object of the atlas uses the atlas maps
+    atlas_maps = {map_type: path for (owner, map_type), path in baked_texture_paths.items() if owner == proxy_name}
+    for obj in members:
+        for map_type, path in atlas_maps.items():
+            baked_texture_paths[(asset_name(obj), map_type)] = path
+        finish_atlas_object(obj, name, save_dir)
+        bake_progress += 1
+    redraw_progress()
+
+def finish_atlas_object(obj, name, save_dir):
+    """
+    Gives an object of an atlas the atlas material, which the first object to finish builds from
+    the atlas maps, then simplifies its materials and UV maps.
+    """
+    mat = bpy.data.materials.get(atlas_materials.get(name, ""))
+    build = mat is None
+    if build:
+        mat = bpy.data.materials.new(name=f"{name}_Atlas")
+        atlas_materials[name] = mat.name
+
+    if obj.data.materials:
+        obj.data.materials[0] = mat
+    else:
+        obj.data.materials.append(mat)
+    if build:
+        apply_baked_textures(obj, save_dir)
+    simplify_materials_and_uv_maps(obj)
 
-    # Get the node tree of the material
-    node_tree = new_material.node_tree
+def pass_through_textures(obj, save_dir):
+    """
+    Copies the texture files of a game-ready object into the bake folder, as hardlinks when possible,
+    and points its material at the copies. Its UVs and material setup are kept, nothing is baked.
+    """
+    global bake_progress
 
-    # Clear existing nodes
-    node_tree.nodes.clear()
+    for slot in obj.material_slots:
+        if slot.material is None or not slot.material.use_nodes:
+            continue
+        for node in slot.material.node_tree.nodes:
+            if node.type != 'TEX_IMAGE':
+                continue
+            source_path = texture_file_path(node.image)
+            if source_path is None:
+                continue
+
+            target_path = os.path.join(save_dir, f"{asset_name(obj)}_{os.path.basename(source_path)}")
+            if os.path.normpath(source_path) != os.path.normpath(target_path):
+                bake_cache.link_or_copy(source_path, target_path)
+
+            image = load_baked_image(target_path)
+            image.colorspace_settings.name = node.image.colorspace_settings.name
+            image.alpha_mode = node.image.alpha_mode
+            node.image = image
+            debug_print(f"Passed {os.path.basename(source_path)} of {obj.name} through as {target_path}")
+
+    # Update the progress after handling this object
+    bake_progress += 1
 
-    # Create new Principled BSDF node
-    bsdf_node = node_tree.nodes.new(type='ShaderNodeBsdfPrincipled')
+    # Force UI to refresh (to update the overlay)
+    redraw_progress()
+
+# Prebuilt material every baked material is copied from. The Principled BSDF and the Normal Map node sit
+# at the top level, wired into the Material Output, where the FBX exporter looks for them.
+BAKED_MATERIAL_TEMPLATE = "Assetify Baked PBR"
+BAKED_MATERIAL_TEMPLATE_VERSION = 1
+
+# Baked maps and the Principled BSDF input each one feeds, through an image node named 'Baked_<map>'
+BAKED_MATERIAL_INPUTS = [
+    ('BaseColor', 'Base Color'),
+    ('Roughness', 'Roughness'),
+    ('Metallic', 'Metallic'),
+    ('Normal', 'Normal'),
+    ('Alpha', 'Alpha'),
+]
+
+def baked_material_template():
+    """
+    Returns the material every baked material is copied from, building it on first use. It has the
+    Principled BSDF, the Normal Map node and an image node without image for every baked map, all wired.
+    An outdated template is replaced and deleted, and what used it is remapped to the new one.
+    """
+    template = bpy.data.materials.get(BAKED_MATERIAL_TEMPLATE)
+    if template is not None and template.get("assetify_template_version") == BAKED_MATERIAL_TEMPLATE_VERSION:
+        return template
+    outdated = template
+    if outdated is not None:
+        outdated.name = f"{BAKED_MATERIAL_TEMPLATE}_old"
+
+    template = bpy.data.materials.new(BAKED_MATERIAL_TEMPLATE)
+    template["assetify_template_version"] = BAKED_MATERIAL_TEMPLATE_VERSION
+    template.use_fake_user = True  # Kept in the file, though no object uses it
+    template.use_nodes = True
+    nodes = template.node_tree.nodes
+    links = template.node_tree.links
+    nodes.clear()
+
+    output_node = nodes.new('ShaderNodeOutputMaterial')
+    output_node.location = (300, 0)
+    bsdf_node = nodes.new('ShaderNodeBsdfPrincipled')
     bsdf_node.location = (0, 0)
+    links.new(bsdf_node.outputs['BSDF'], output_node.inputs['Surface'])
 
-    # Create a Material Output node
-    output_node = node_tree.nodes.new(type='ShaderNodeOutputMaterial')
-    output_node.location = (400, 0)
+    normal_map_node = nodes.new('ShaderNodeNormalMap')
+    normal_map_node.name = "Baked_Normal_Map"
+    normal_map_node.location = (-250, -900)
+    links.new(normal_map_node.outputs['Normal'], bsdf_node.inputs['Normal'])
 
-    # Connect the BSDF node to the Material Output node
-    node_tree.links.new(bsdf_node.outputs['BSDF'], output_node.inputs['Surface'])
+    for index, (map_type, input_name) in enumerate(BAKED_MATERIAL_INPUTS):
+        tex_image_node = nodes.new('ShaderNodeTexImage')
+        tex_image_node.name = f"Baked_{map_type}"
+        tex_image_node.label = map_type
+        tex_image_node.location = (-600, index * -300)
+        target = normal_map_node.inputs['Color'] if map_type == 'Normal' else bsdf_node.inputs[input_name]
+        links.new(tex_image_node.outputs['Color'], target)
 
-    # Load and connect the baked textures
-    texture_types = {
-        'BaseColor': 'base_color',
-        'Roughness': 'roughness',
-        'Normal': 'normal',
-        'Metallic': 'metallic',
-        'Alpha': 'alpha'
-    }
+    if outdated is not None:
+        outdated.user_remap(template)
+        bpy.data.materials.remove(outdated)
 
-    # Load and assign each texture
-    for map_type, socket_name in texture_types.items():
-        texture_path = os.path.join(save_dir, f"{obj.name}_{map_type}.png")
+    debug_print(f"Built the '{BAKED_MATERIAL_TEMPLATE}' material template")
+    return template
+
+def apply_baked_textures(obj, save_dir):
+    """
+    Apply the baked textures to the object's material by replacing it with a copy of the baked material
+    template, in which only the image nodes get their images. The copy takes over the name and every user
+    of the replaced material. The textures (BaseColor, Roughness, Normal, etc.) are loaded from the save directory.
+    This function does not remove material slots or rename UV maps, which are handled after the application.
+    """
+    baked_material = baked_material_template().copy()
+    baked_material.use_fake_user = False
+    del baked_material["assetify_template_version"]
+
+    # Replace the first material, or give the object one
+    material = obj.data.materials[0] if obj.data.materials else None
+    if material is None:
+        baked_material.name = f"{obj.name}_Material"
+        if obj.data.materials:
+            obj.data.materials[0] = baked_material
+        else:
+            obj.data.materials.append(baked_material)
+    else:
+        material_name = material.name
+        material.user_remap(baked_material)
+        bpy.data.materials.remove(material)
+        baked_material.name = material_name
+
+    # Bind each baked texture to its image node, missing maps leave the BSDF input at its default
+    nodes = baked_material.node_tree.nodes
+    for map_type, _input_name in BAKED_MATERIAL_INPUTS:
+        # Maps with identical content share one file and one image datablock
+        texture_path = baked_texture_paths.get((asset_name(obj), map_type),
+                                               os.path.join(save_dir, f"{asset_name(obj)}_{map_type}.png"))
+        tex_image_node = nodes[f"Baked_{map_type}"]
         if os.path.exists(texture_path):
-            # Create Image Texture node
-            tex_image_node = node_tree.nodes.new('ShaderNodeTexImage')
-            tex_image_node.image = bpy.data.images.load(texture_path)
-            tex_image_node.location = (-400, len(texture_types) * -150)
-
-            # Connect the texture to the appropriate BSDF input
-            if map_type == 'BaseColor':
-                node_tree.links.new(tex_image_node.outputs['Color'], bsdf_node.inputs['Base Color'])
-            elif map_type == 'Roughness':
-                node_tree.links.new(tex_image_node.outputs['Color'], bsdf_node.inputs['Roughness'])
-            elif map_type == 'Normal':
-                normal_map_node = node_tree.nodes.new('ShaderNodeNormalMap')
-                normal_map_node.location = (-200, -150)
-                node_tree.links.new(tex_image_node.outputs['Color'], normal_map_node.inputs['Color'])
-                node_tree.links.new(normal_map_node.outputs['Normal'], bsdf_node.inputs['Normal'])
-            elif map_type == 'Metallic':
-                node_tree.links.new(tex_image_node.outputs['Color'], bsdf_node.inputs['Metallic'])
-            elif map_type == 'Alpha':
-                node_tree.links.new(tex_image_node.outputs['Color'], bsdf_node.inputs['Alpha'])
+            tex_image_node.image = load_baked_image(texture_path)
+            continue
+        nodes.remove(tex_image_node)
+        if map_type == 'Normal':
+            nodes.remove(nodes["Baked_Normal_Map"])
 
 def simplify_materials_and_uv_maps(obj):
     """
@@ -1027,50 +3599,330 @@ class OBJECT_OT_bake_textures_for_unreal(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
     
     def execute(self, context):
-        global bake_progress, total_bake_items
+        save_dir = bpy.path.abspath(context.scene.mossify_bake_settings.bake_folder)
+        if context.scene.mossify_bake_settings.bake_in_background:
+            return background_bake.start(context.scene, save_dir, self.report)
+
+        result = bake_game_assets(context.scene, save_dir, self.report)
+        if result['status'] == 'NO_ASSETS':
+            return {'CANCELLED'}
+        return {'FINISHED'}
+
+def bake_game_assets(scene, save_dir, report=None, on_object=None):
+    """
+    Bakes every game asset of the scene that needs it into save_dir, with the scene's bake settings.
+    Works without a window, so it serves both the bake operator and headless batch runs.
+    Messages go to report(level, message), like Operator.report.
+    on_object(obj, status) is called as each object is done, with 'baked', 'passed_through' or 'quarantined'.
+    Returns a summary: the status ('NO_ASSETS', 'UP_TO_DATE' or 'FINISHED') and the names of
+    the baked, passed through and quarantined objects.
+    """
+    global bake_progress, total_bake_items
+
+    if report is None:
+        def report(_level, message):
+            debug_print(message)
+
+    summary = {'status': 'FINISHED', 'save_dir': save_dir, 'baked': [], 'passed_through': [], 'quarantined': []}
+
+    plan = plan_bake(scene)
+    summary['status'] = plan['status']
+    if plan['status'] == 'NO_ASSETS':
+        report({'ERROR'}, "No objects to bake. Ensure objects are created first.")
+        return summary
+    if plan['status'] == 'UP_TO_DATE':
+        report({'INFO'}, "All game assets are already baked.")
+        return summary
+
+    bake_settings = scene.mossify_bake_settings
+    bake_resolution = bake_settings.bake_resolution
+    bake_targets = plan['targets']
+    pass_through_data = plan['pass_through_data']
+    pairs_by_data = plan['pairs_by_data']
+    registry = get_registry(scene)
+
+    # Set up the progress display, with the predicted time of every object to bake
+    bake_progress = 0
+    total_bake_items = len([obj for obj in bake_targets if obj.type == 'MESH'])
+    model = bake_cost_model()
+    bake_eta.start(predict_bake_seconds(model, plan, [obj for obj in bake_targets
+                                                     if obj.type == 'MESH' and obj.data not in pass_through_data]),
+                   time.time())
+    set_active_3d_view()
+    start_bake_progress_display()
+
+    # Define the directory where you want to save the baked textures
+    if not os.path.exists(save_dir):
+        os.makedirs(save_dir)
+
+    # The journal lets a crashed bake resume without redoing finished maps
+    journal = None
+    if bake_settings.use_bake_journal:
+        journal = bake_journal.BakeJournal(bake_journal.journal_path(save_dir))
+
+    # Objects that failed are quarantined, the rest of the batch still gets baked
+    quarantined = summary['quarantined']
+
+    # Atlas objects get their UVs packed together before anything is baked, and are baked together
+    # when the loop reaches the first of them
+    pack_atlases(plan)
+    atlases = plan['atlases']
+
+    # Bake all the necessary maps for each duplicated object
+    try:
+        for obj in bake_targets:
+            if obj.type != 'MESH':
+                report({'WARNING'}, f"Skipping non-mesh object: {obj.name}")
+                continue
+
+            atlas_name = atlas_members.get(obj.name)
+            members = atlases[atlas_name] if atlas_name else [obj]
+            if obj != members[0]:
+                continue
+            resolution = bake_settings.atlas_resolution if atlas_name else bake_resolution
+
+            job_key = None
+            if journal:
+                job_key = atlas_job_key(members, resolution) if atlas_name else bake_job_key(obj, resolution)
+            if journal and not bake_settings.retry_quarantined and journal.is_quarantined(asset_name(obj), job_key):
+                report({'WARNING'}, f"Skipping {atlas_name or obj.name}, it failed to bake in an earlier run")
+                for member in members:
+                    quarantined.append(member.name)
+                    bake_eta.skip(member.name)
+                    bake_progress += 1
+                    if on_object:
+                        on_object(member, 'quarantined')
+                continue
+
+            report({'INFO'}, f"Baking textures for {atlas_name or obj.name}")
+            try:
+                if obj.data in pass_through_data:
+                    pass_through_textures(obj, save_dir)
+                    summary['passed_through'].append(obj.name)
+                elif atlas_name:
+                    bake_atlas(atlas_name, members, resolution, save_dir, journal, job_key)
+                    summary['baked'].extend(member.name for member in members)
+                else:
+                    bake_all_maps_for_object(obj, resolution, save_dir, journal, job_key)
+                    summary['baked'].append(obj.name)
+                report({'INFO'}, f"Textures baked and saved for {atlas_name or obj.name}")
+                if journal:
+                    journal.record(asset_name(obj), bake_journal.OBJECT_JOB, 'done', job_key)
+
+                # Every object sharing these meshes got the baked material too
+                for member in members:
+                    bake_eta.finish(member.name)
+                    mark_baked(registry, pairs_by_data, member)
+                    if on_object:
+                        on_object(member, 'passed_through' if member.data in pass_through_data else 'baked')
+            except Exception as e:
+                report({'ERROR'}, f"Failed to bake textures for {atlas_name or obj.name}: {str(e)}")
+                if journal:
+                    journal.record(asset_name(obj), bake_journal.OBJECT_JOB, 'failed', job_key, error=str(e))
+                for member in members:
+                    quarantined.append(member.name)
+                    bake_eta.skip(member.name)
+                    member.select_set(False)
+                    bake_progress += 1
+                    if on_object:
+                        on_object(member, 'quarantined')
+    finally:
+        if journal:
+            journal.close()
+
+        # Stop the progress display once baking is done
+        bake_eta.start({}, time.time())
+        stop_bake_progress_display()
+
+    # The LODs are rebuilt from the baked meshes, so they get their material and final UV layout
+    if summary['baked']:
+        update_lods(summary['baked'])
 
-        # Ensure the 3D View is active for the overlay
-        set_active_3d_view()
+    if quarantined:
+        report({'WARNING'}, f"{len(quarantined)} objects failed to bake and were quarantined: {', '.join(quarantined)}")
+    return summary
 
-        # Get bake settings from the context
-        bake_settings = context.scene.mossify_bake_settings
-        bake_resolution = bake_settings.bake_resolution
-        bake_samples = bake_settings.bake_samples
+def plan_bake(scene, dry_run=False):
+    """
+    Works out what a bake of the scene has to do, and applies the sample setting.
+    Returns the status ('NO_ASSETS', 'UP_TO_DATE' or 'PLANNED'), the objects to bake (one per mesh),
+    the meshes of game-ready objects, the registry pair indices of every mesh, and the atlases to bake.
+    Baked maps are only deduplicated within one bake run, so this also starts a new run.
+    A dry run only works out the plan, and leaves the scene and the registry as they are.
+    """
+    plan = {'status': 'PLANNED', 'targets': [], 'pass_through_data': set(), 'pairs_by_data': {}, 'atlases': {}}
+
+    # Get bake settings from the scene
+    bake_settings = scene.mossify_bake_settings
+    bake_resolution = bake_settings.bake_resolution
+    bake_samples = bake_settings.bake_samples
+
+    # Apply the bake sample settings
+    if not dry_run:
+        scene.cycles.samples = bake_samples
+
+    registry = get_registry(scene)
+    if not registry.assets:
+        plan['status'] = 'NO_ASSETS'
+        return plan
+
+    # Baked maps are only deduplicated within one bake run
+    if not dry_run:
+        baked_texture_store.clear()
+        baked_texture_paths.clear()
+        baked_texture_images.clear()
+        atlas_members.clear()
+        atlas_materials.clear()
+
+    # Only objects converted since the last bake need baking, unless the bake settings changed
+    raster_maps = ",".join(sorted(bake_settings.raster_maps))
+    bake_maps = ",".join(sorted(bake_settings.bake_maps))
+    atlas = f"{bake_settings.atlas_mode}:{bake_settings.atlas_resolution}"
+    settings_changed = ((registry.last_bake_resolution, registry.last_bake_samples, registry.last_raster_maps,
+                         registry.last_bake_maps, registry.last_atlas) !=
+                        (bake_resolution, bake_samples, raster_maps, bake_maps, atlas))
+    if settings_changed and not dry_run:
+        for pair in registry.assets:
+            pair.needs_bake = True
+        registry.last_bake_resolution = bake_resolution
+        registry.last_bake_samples = bake_samples
+        registry.last_raster_maps = raster_maps
+        registry.last_bake_maps = bake_maps
+        registry.last_atlas = atlas
+    pending_data = {pair.game_asset.data for pair in registry.assets
+                    if pair.game_asset and (pair.needs_bake or settings_changed)}
+
+    # Meshes of game-ready objects only get their textures copied
+    plan['pass_through_data'] = {pair.game_asset.data for pair in registry.assets
+                                 if pair.game_asset and pair.game_ready}
+
+    # An atlas is baked as a whole, so when one of its objects needs baking they all do
+    atlas_candidates = []
+    candidate_data = set()
+    for obj in game_assets(registry):
+        if obj.type == 'MESH' and obj.data not in plan['pass_through_data'] and obj.data not in candidate_data:
+            candidate_data.add(obj.data)
+            atlas_candidates.append(obj)
+    for members in atlas_groups(atlas_candidates).values():
+        if any(obj.data in pending_data for obj in members):
+            pending_data.update(obj.data for obj in members)
+
+    # Registry pairs by mesh, to mark every object sharing a baked mesh as done
+    pairs_by_data = plan['pairs_by_data']
+    for i, pair in enumerate(registry.assets):
+        if pair.game_asset:
+            pairs_by_data.setdefault(pair.game_asset.data, []).append(i)
+
+    # Objects sharing mesh data share the baked material, so only bake each mesh once
+    bake_targets = plan['targets']
+    baked_data = set()
+    for obj in game_assets(registry):
+        if obj.type == 'MESH' and (obj.data in baked_data or obj.data not in pending_data):
+            debug_print(f"{obj.name} is already baked or shares its mesh with an object already queued, skipping bake.")
+            continue
+        if obj.type == 'MESH':
+            baked_data.add(obj.data)
+        bake_targets.append(obj)
+
+    # Objects baked together into atlases
+    plan['atlases'] = atlas_groups([obj for obj in bake_targets if obj.type == 'MESH'
+                                    and obj.data not in plan['pass_through_data']])
+    if not dry_run:
+        for name, members in plan['atlases'].items():
+            atlas_members.update((obj.name, name) for obj in members)
+
+    if not bake_targets:
+        plan['status'] = 'UP_TO_DATE'
+    return plan
+
+def estimate_bake(scene, workers=1):
+    """
+    Predicts a bake of the scene without baking anything: the maps to bake and the time they take on
+    the given number of workers, the disk space of the baked maps and the peak memory. Objects are
+    listed with their predicted time, longest first. An atlas is listed once, as a single bake
+    at the atlas resolution.
+    """
+    plan = plan_bake(scene, dry_run=True)
+    settings = scene.mossify_bake_settings
+    model = bake_cost_model()
+    atlas_names = plan_atlas_names(plan)
+
+    jobs = []
+    objects = []
+    for obj in plan['targets']:
+        if obj.type != 'MESH' or obj.data in plan['pass_through_data']:
+            continue
+        name = atlas_names.get(obj.name)
+        if name is None:
+            name = obj.name
+            object_jobs = [bake_job_inputs(obj, map_type, bake_type, settings.bake_resolution)
+                           for map_type, bake_type in maps_for_object(obj).items()]
+        elif obj == plan['atlases'][name][0]:
+            object_jobs = atlas_job_inputs(plan['atlases'][name], settings.atlas_resolution)
+        else:
+            continue
+        jobs.extend(object_jobs)
+        objects.append({'object': name, 'maps': len(object_jobs),
+                        'seconds': round(sum(model.predict(job) for job in object_jobs), 3)})
+
+    estimate = cost_model.estimate(jobs, model, workers)
+    estimate['status'] = plan['status']
+    estimate['objects'] = sorted(objects, key=lambda entry: entry['seconds'], reverse=True)
+    return estimate
+
+def mark_baked(registry, pairs_by_data, obj):
+    """Marks every registry pair sharing the object's mesh as baked, they all got the baked material."""
+    for i in pairs_by_data.get(obj.data, []):
+        registry.assets[i].needs_bake = False
+
+class OBJECT_OT_cancel_background_bake(bpy.types.Operator):
+    """Stop the running background bake, objects already baked keep their textures"""
+    bl_idname = "object.cancel_background_bake"
+    bl_label = "Cancel Background Bake"
 
-        # Apply the bake sample settings
-        bpy.context.scene.cycles.samples = bake_samples
+    @classmethod
+    def poll(cls, context):
+        return background_bake.is_running()
+
+    def execute(self, context):
+        background_bake.cancel()
+        return {'FINISHED'}
 
-        if not duplicated_objects:
+class OBJECT_OT_estimate_bake(bpy.types.Operator):
+    """Predict the time, disk space and memory of baking the game assets, without baking anything"""
+    bl_idname = "object.estimate_bake"
+    bl_label = "Estimate Bake"
+
+    def execute(self, context):
+        estimate = estimate_bake(context.scene)
+        if estimate['status'] == 'NO_ASSETS':
             self.report({'ERROR'}, "No objects to bake. Ensure objects are created first.")
             return {'CANCELLED'}
+        if not estimate['jobs']:
+            self.report({'INFO'}, "All game assets are already baked.")
+            return {'FINISHED'}
+
+        for entry in estimate['objects']:
+            debug_print(f"{entry['object']}: {entry['maps']} maps, about {cost_model.format_duration(entry['seconds'])}")
+        self.report({'INFO'}, f"{estimate['jobs']} maps of {len(estimate['objects'])} objects: "
+                              f"about {cost_model.format_duration(estimate['seconds'])}, "
+                              f"{cost_model.format_bytes(estimate['disk_bytes'])} on disk, "
+                              f"{cost_model.format_bytes(estimate['peak_memory_bytes'])} peak memory")
+        return {'FINISHED'}
 
-        # Set up the progress display
-        bake_progress = 0
-        total_bake_items = len([obj for obj in duplicated_objects if obj.type == 'MESH'])
-        start_bake_progress_display()
-
-        # Define the directory where you want to save the baked textures
-        save_dir = bpy.path.abspath("//baked_textures")
-        if not os.path.exists(save_dir):
-            os.makedirs(save_dir)
-
-        # Bake all the necessary maps for each duplicated object
-        for obj in duplicated_objects:
-            if obj.type == 'MESH':
-                self.report({'INFO'}, f"Baking textures for {obj.name}")
-                try:
-                    bake_all_maps_for_object(obj, bake_resolution, save_dir)
-                    self.report({'INFO'}, f"Textures baked and saved for {obj.name}")
-                except Exception as e:
-                    self.report({'ERROR'}, f"Failed to bake textures for {obj.name}: {str(e)}")
-                    stop_bake_progress_display()
-                    return {'CANCELLED'}
-            else:
-                self.report({'WARNING'}, f"Skipping non-mesh object: {obj.name}")
+class OBJECT_OT_generate_lods(bpy.types.Operator):
+    """Rebuild the decimated LODs of every game asset from its current mesh, material and UVs"""
+    bl_idname = "object.generate_lods"
+    bl_label = "Generate LODs"
+    bl_options = {'REGISTER', 'UNDO'}
 
-        # Stop the progress display once baking is done
-        stop_bake_progress_display()
+    def execute(self, context):
+        if not get_registry().assets:
+            self.report({'ERROR'}, "No game assets. Convert a collection first.")
+            return {'CANCELLED'}
 
+        count = update_lods()
+        self.report({'INFO'}, f"Generated {count} LOD objects.")
         return {'FINISHED'}
 
 class OBJECT_OT_convert_to_game_ready(bpy.types.Operator):
@@ -1081,6 +3933,11 @@ class OBJECT_OT_convert_to_game_ready(bpy.types.Operator):
 
     def execute(self, context):
         result = duplicate_mossify_collection()
+
+        # Report what the preflight check found
+        for name, severity, message in preflight_results:
+            self.report({'ERROR'} if severity == 'ERROR' else {'WARNING'}, f"{name} {message}")
+
         if result == {'FINISHED'}:
             self.report({'INFO'}, "Selected collection duplicated and objects made game-ready!")
         else:
@@ -1108,7 +3965,21 @@ class ASSETIFY_PT_tools_panel(bpy.types.Panel):
                            bpy.data, "collections", text="Select Collection")
 
         # Operator button to execute the 'convert_to_game_ready' operation
+        layout.prop(context.scene.mossify_bake_settings, "preflight_mode")
+        if context.scene.mossify_bake_settings.preflight_mode != 'OFF':
+            layout.prop(context.scene.mossify_bake_settings, "preflight_max_triangles")
+        layout.prop(context.scene.mossify_bake_settings, "share_duplicate_assets")
+        layout.prop(context.scene.mossify_bake_settings, "merge_by_collection")
+        layout.prop(context.scene.mossify_bake_settings, "suspend_source_evaluation")
+        layout.prop(context.scene.mossify_bake_settings, "pass_through_game_ready")
+        layout.prop(context.scene.mossify_bake_settings, "high_to_low")
+        if context.scene.mossify_bake_settings.high_to_low:
+            layout.prop(context.scene.mossify_bake_settings, "triangle_budget")
+        layout.prop(context.scene.mossify_bake_settings, "lod_count")
+        if context.scene.mossify_bake_settings.lod_count:
+            layout.prop(context.scene.mossify_bake_settings, "lod_ratio")
         layout.operator("object.convert_to_game_ready", text="Convert to Game Assets")
+        layout.operator("object.generate_lods", text="Generate LODs")
 
         # Bake settings (resolution and samples)
         layout.label(text="Bake Settings:")
@@ -1116,9 +3987,29 @@ class ASSETIFY_PT_tools_panel(bpy.types.Panel):
         layout.prop(context.scene.mossify_bake_settings, "bake_folder")
         layout.prop(context.scene.mossify_bake_settings, "bake_resolution")
         layout.prop(context.scene.mossify_bake_settings, "bake_samples")
+        layout.prop(context.scene.mossify_bake_settings, "bake_maps")
+        layout.prop(context.scene.mossify_bake_settings, "atlas_mode")
+        if context.scene.mossify_bake_settings.atlas_mode != 'OFF':
+            layout.prop(context.scene.mossify_bake_settings, "atlas_resolution")
+        layout.label(text="Mesh Maps:")
+        layout.prop(context.scene.mossify_bake_settings, "raster_maps")
+        layout.prop(context.scene.mossify_bake_settings, "rasterize_simple_normals")
+        layout.prop(context.scene.mossify_bake_settings, "reproject_image_textures")
+        layout.prop(context.scene.mossify_bake_settings, "use_bake_journal")
+        if context.scene.mossify_bake_settings.use_bake_journal:
+            layout.prop(context.scene.mossify_bake_settings, "retry_quarantined")
+        layout.prop(context.scene.mossify_bake_settings, "use_bake_cache")
+        if context.scene.mossify_bake_settings.use_bake_cache:
+            layout.prop(context.scene.mossify_bake_settings, "bake_cache_folder")
+            layout.prop(context.scene.mossify_bake_settings, "bake_cache_size")
 
         # Operator button to execute the 'bake_textures_for_unreal' operation
-        layout.operator("object.bake_textures_for_unreal", text="Bake Materials for Unreal Engine")
+        layout.operator("object.estimate_bake", text="Estimate Bake")
+        layout.prop(context.scene.mossify_bake_settings, "bake_in_background")
+        if background_bake.is_running():
+            layout.operator("object.cancel_background_bake", text="Cancel Background Bake")
+        else:
+            layout.operator("object.bake_textures_for_unreal", text="Bake Materials for Unreal Engine")
 
         # Operator button to swap collections
         layout.operator("object.swap_collections", text="Swap Original & Game Assets")
@@ -1133,22 +4024,54 @@ def register():
         bpy.utils.register_class(cls)
     bpy.utils.register_class(OBJECT_OT_convert_to_game_ready)
     bpy.utils.register_class(OBJECT_OT_bake_textures_for_unreal)
+    bpy.utils.register_class(OBJECT_OT_estimate_bake)
+    bpy.utils.register_class(OBJECT_OT_cancel_background_bake)
+    bpy.utils.register_class(OBJECT_OT_generate_lods)
     bpy.utils.register_class(OBJECT_OT_swap_collections)
     bpy.utils.register_class(ASSETIFY_PT_tools_panel)
     bpy.utils.register_class(AssetifyBakeSettings)
+    bpy.utils.register_class(AssetifyAssetPair)
+    bpy.utils.register_class(AssetifyCollectionPair)
+    bpy.utils.register_class(AssetifyRegistry)
 
     bpy.types.Scene.mossify_bake_settings = bpy.props.PointerProperty(type=AssetifyBakeSettings)
+    bpy.types.Scene.assetify_registry = bpy.props.PointerProperty(type=AssetifyRegistry)
+
+    bpy.app.handlers.depsgraph_update_post.append(track_dirty_ids)
+    bpy.app.handlers.save_pre.append(store_dirty_ids)
+    bpy.app.handlers.load_post.append(restore_registry_state)
+    bpy.app.handlers.load_pre.append(background_bake.cancel_on_load)
+    bpy.app.handlers.undo_post.append(reset_registry_index)
+    bpy.app.handlers.redo_post.append(reset_registry_index)
 
 def unregister():
     """Unregisters the operators and the panel."""
+    background_bake.cancel()
     addon_updater_ops.unregister()
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
     bpy.utils.unregister_class(OBJECT_OT_convert_to_game_ready)
     bpy.utils.unregister_class(OBJECT_OT_bake_textures_for_unreal)
+    bpy.utils.unregister_class(OBJECT_OT_estimate_bake)
+    bpy.utils.unregister_class(OBJECT_OT_cancel_background_bake)
+    bpy.utils.unregister_class(OBJECT_OT_generate_lods)
     bpy.utils.unregister_class(OBJECT_OT_swap_collections)
     bpy.utils.unregister_class(ASSETIFY_PT_tools_panel)
     bpy.utils.unregister_class(AssetifyBakeSettings)
+    bpy.utils.unregister_class(AssetifyRegistry)
+    bpy.utils.unregister_class(AssetifyCollectionPair)
+    bpy.utils.unregister_class(AssetifyAssetPair)
+
+    for handlers, handler in ((bpy.app.handlers.depsgraph_update_post, track_dirty_ids),
+                              (bpy.app.handlers.save_pre, store_dirty_ids),
+                              (bpy.app.handlers.load_post, restore_registry_state),
+                              (bpy.app.handlers.load_pre, background_bake.cancel_on_load),
+                              (bpy.app.handlers.undo_post, reset_registry_index),
+                              (bpy.app.handlers.redo_post, reset_registry_index)):
+        if handler in handlers:
+            handlers.remove(handler)
+
+    del bpy.types.Scene.assetify_registry
 
     del bpy.types.Scene.assetify_bake_settings
 
@@ -0,0 +1,275 @@
+"""Out-of-process bake: the bake runs in a child Blender process while the session stays interactive.
+
+The bake operator saves a snapshot of the open file and starts 'blender -b' on it with this module as
+its script. The child bakes the game assets into the bake folder like a batch bake, and prints a
+progress line as each object is done. A timer in the live session reads those lines and applies the
+finished textures to the live objects with apply_baked_textures, object by object.
+
+Objects deleted in the live session meanwhile are left out, and opening another file cancels the
+bake. Edits made to an object while it bakes are overwritten by its baked material.
+"""
+
+import argparse
+import collections
+import json
+import os
+import queue
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import bpy
+from bpy.app.handlers import persistent
+
+from . import batch
+from . import farm
+
+# Prefix of the progress lines printed by the child process
+PROGRESS_PREFIX = "ASSETIFY_PROGRESS "
+
+# Seconds between two looks at the child's progress
+POLL_INTERVAL = 0.5
+
+# The running background bake, if any
+running_bake = None
+
+
+class BackgroundBake:
+    """A child bake process and the progress lines read from it so far."""
+
+    def __init__(self, process, work_dir, save_dir):
+        self.process = process
+        self.work_dir = work_dir
+        self.save_dir = save_dir
+        self.progress = queue.Queue()
+        self.output_tail = collections.deque(maxlen=40)
+        self.summary = None
+        self.applied = []
+        self.quarantined = []
+
+        # The pipe is drained by a thread, so the child never blocks on a full pipe
+        self.reader = threading.Thread(target=self._read_output, daemon=True)
+        self.reader.start()
+
+    def _read_output(self):
+        for raw_line in self.process.stdout:
+            line = raw_line.decode(errors='replace').rstrip()
+            if line.startswith(PROGRESS_PREFIX):
+                try:
+                    self.progress.put(json.loads(line[len(PROGRESS_PREFIX):]))
+                except ValueError:
+                    self.output_tail.append(line)
+            else:
+                self.output_tail.append(line)
+        self.process.stdout.close()
+
+
+def is_running():
+    return running_bake is not None
+
+
+def child_command(snapshot_path, save_dir):
+    """Builds the command line of the child bake process."""
+    return [bpy.app.binary_path, "-b", snapshot_path, "--python-expr", batch.module_expression("background_bake"),
+            "--", "--output", save_dir]
+
+
+def start(scene, save_dir, report):
+    """
+    Starts baking the game assets of the scene into save_dir in a child process. Game-ready objects
+    are handled right away, since they only need their textures copied. Returns the operator result.
+    """
+    global running_bake
+
+    package = batch.addon()
+    if running_bake is not None:
+        report({'ERROR'}, "A background bake is already running.")
+        return {'CANCELLED'}
+
+    plan = package.plan_bake(scene)
+    if plan['status'] == 'NO_ASSETS':
+        report({'ERROR'}, "No objects to bake. Ensure objects are created first.")
+        return {'CANCELLED'}
+    if plan['status'] == 'UP_TO_DATE':
+        report({'INFO'}, "All game assets are already baked.")
+        return {'FINISHED'}
+    os.makedirs(save_dir, exist_ok=True)
+
+    # Game-ready objects are done before the snapshot, so the child leaves them out
+    registry = package.get_registry(scene)
+    bake_targets = []
+    for obj in plan['targets']:
+        if obj.type != 'MESH':
+            continue
+        if obj.data in plan['pass_through_data']:
+            package.pass_through_textures(obj, save_dir)
+            package.mark_baked(registry, plan['pairs_by_data'], obj)
+        else:
+            bake_targets.append(obj)
+    if not bake_targets:
+        report({'INFO'}, "Game-ready objects passed through, nothing else to bake.")
+        return {'FINISHED'}
+
+    # Atlases are packed here, so the live objects get the layout the child bakes
+    package.pack_atlases(plan)
+
+    work_dir = tempfile.mkdtemp(prefix="assetify_background_")
+    snapshot_path = os.path.join(work_dir, "snapshot.blend")
+    try:
+        farm.save_snapshot(snapshot_path)
+        process = subprocess.Popen(child_command(snapshot_path, save_dir),
+                                   stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    except Exception:
+        shutil.rmtree(work_dir, ignore_errors=True)
+        raise
+    running_bake = BackgroundBake(process, work_dir, save_dir)
+
+    # The progress overlay follows the child through the timer
+    model = package.bake_cost_model()
+    package.bake_progress = 0
+    package.total_bake_items = len(bake_targets)
+    package.bake_eta.start(package.predict_bake_seconds(model, plan, bake_targets), time.time())
+    package.start_bake_progress_display()
+    bpy.app.timers.register(poll, first_interval=POLL_INTERVAL, persistent=True)
+
+    report({'INFO'}, f"Baking {len(bake_targets)} objects in the background.")
+    return {'FINISHED'}
+
+
+def apply_progress(package, bake, entry):
+    """Applies one progress line of the child: an object's baked maps, its failure, or the final summary."""
+    if 'summary' in entry:
+        bake.summary = entry['summary']
+        return
+
+    name = entry['object']
+    package.bake_progress += 1
+    obj = bpy.data.objects.get(name)
+    if obj is None or package.asset_name(obj) != entry['asset']:
+        # The game asset was renamed since the bake started, e.g. to '<name>_LOD0'
+        obj = next((asset for asset in package.game_assets(package.get_registry(bpy.context.scene))
+                    if package.asset_name(asset) == entry['asset']), None)
+    if entry['status'] == 'quarantined':
+        bake.quarantined.append(name)
+    if entry['status'] != 'baked' or obj is None or obj.type != 'MESH':
+        package.bake_eta.skip(name)
+        return
+
+    for map_type, texture_path in entry['maps'].items():
+        package.baked_texture_paths[(entry['asset'], map_type)] = texture_path
+    if entry.get('atlas'):
+        package.finish_atlas_object(obj, entry['atlas'], bake.save_dir)
+    else:
+        package.finish_baked_object(obj, bake.save_dir)
+
+    # Every object sharing this mesh got the baked material too
+    for pair in package.get_registry(bpy.context.scene).assets:
+        if pair.game_asset and pair.game_asset.data == obj.data:
+            pair.needs_bake = False
+    package.bake_eta.finish(name)
+    bake.applied.append(obj.name)
+    package.debug_print(f"Applied the background bake of {name}")
+
+
+def tag_3d_views():
+    """Redraws the 3D Views so the progress overlay is up to date."""
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+
+
+def poll():
+    """Timer applying what the child finished since the last call. Unregisters itself when the child is done."""
+    bake = running_bake
+    if bake is None:
+        return None
+    package = batch.addon()
+
+    if bake.process.poll() is not None:
+        bake.reader.join()
+    while True:
+        try:
+            entry = bake.progress.get_nowait()
+        except queue.Empty:
+            break
+        apply_progress(package, bake, entry)
+    tag_3d_views()
+
+    if bake.process.poll() is None:
+        return POLL_INTERVAL
+    finish(package, bake)
+    return None
+
+
+def finish(package, bake):
+    """Reports the outcome of a finished child and cleans up after it."""
+    global running_bake
+
+    running_bake = None
+    package.bake_eta.start({}, time.time())
+    package.stop_bake_progress_display()
+    if bake.applied:
+        package.update_lods(bake.applied)
+    tag_3d_views()
+    shutil.rmtree(bake.work_dir, ignore_errors=True)
+
+    if bake.summary is None:
+        package.debug_print(f"Background bake exited with code {bake.process.returncode}:\n" +
+                            "\n".join(bake.output_tail))
+    else:
+        package.debug_print(f"Background bake finished: {len(bake.applied)} objects applied, "
+                            f"{len(bake.quarantined)} failed")
+
+
+def cancel():
+    """Stops the running background bake. Objects it already applied keep their baked material."""
+    global running_bake
+
+    bake = running_bake
+    if bake is None:
+        return
+    running_bake = None
+    bake.process.terminate()
+    try:
+        bake.process.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        bake.process.kill()
+
+    package = batch.addon()
+    package.bake_eta.start({}, time.time())
+    package.stop_bake_progress_display()
+    shutil.rmtree(bake.work_dir, ignore_errors=True)
+    if bpy.app.timers.is_registered(poll):
+        bpy.app.timers.unregister(poll)
+
+
+@persistent
+def cancel_on_load(*args):
+    """load_pre handler: the objects of another file must not get this bake's textures."""
+    cancel()
+
+
+def run(argv=None):
+    """Entry point of the child process: bakes the snapshot and prints a progress line per object."""
+    if argv is None:
+        argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(prog="assetify-background-bake")
+    parser.add_argument("--output", required=True, help="Bake folder of the live session")
+    args = parser.parse_args(argv)
+
+    package = batch.addon()
+
+    def report_object(obj, status):
+        asset = package.asset_name(obj)
+        maps = {map_type: texture_path for (name, map_type), texture_path in package.baked_texture_paths.items()
+                if name == asset}
+        print(PROGRESS_PREFIX + json.dumps({'object': obj.name, 'asset': asset, 'status': status, 'maps': maps,
+                                            'atlas': package.atlas_members.get(obj.name)}), flush=True)
+
+    summary = package.bake_game_assets(bpy.context.scene, args.output, on_object=report_object)
+    print(PROGRESS_PREFIX + json.dumps({'summary': summary}), flush=True)
+    sys.exit(1 if summary['quarantined'] else 0)
@@ -0,0 +1,124 @@
+"""Content-addressed cache of baked texture files.
+
+Entries are stored as '<cache dir>/<key[:2]>/<key>.png', where the key is a hash of everything that
+affects the bake result. The directory can live on a shared drive so several machines reuse each
+other's bakes. Entries are evicted least-recently-used once the cache grows past its size limit.
+"""
+
+import hashlib
+import os
+import shutil
+import uuid
+
+# Memoized file hashes: path -> (size, mtime, digest)
+_file_hashes = {}
+
+# Running size of each cache directory in bytes, counted once and then kept up to date by store,
+# so the directory is only walked again when it grows past its limit
+_cache_sizes = {}
+
+
+def hash_file(path):
+    """Returns the SHA-256 of a file's content, memoized on its size and modification time."""
+    stat = os.stat(path)
+    cached = _file_hashes.get(path)
+    if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+        return cached[2]
+
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    _file_hashes[path] = (stat.st_size, stat.st_mtime_ns, digest.hexdigest())
+    return digest.hexdigest()
+
+
+def link_or_copy(src_path, dest_path):
+    """Places src_path at dest_path as a hardlink when possible and a copy otherwise, replacing dest_path."""
+    if os.path.exists(dest_path):
+        os.remove(dest_path)
+    try:
+        os.link(src_path, dest_path)
+    except OSError:
+        # Different drive or a file system without hardlinks
+        shutil.copyfile(src_path, dest_path)
+
+
+class BakeCache:
+    """A directory of baked maps addressed by their cache key, with LRU size eviction."""
+
+    def __init__(self, directory, max_size_mb):
+        self.directory = directory
+        self.max_size = max_size_mb * 1024 * 1024
+
+    def entry_path(self, key):
+        return os.path.join(self.directory, key[:2], key + ".png")
+
+    def fetch(self, key, dest_path):
+        """
+        Places the cached map for key at dest_path, as a hardlink when possible and a copy otherwise.
+        Returns False on a cache miss.
+        """
+        entry = self.entry_path(key)
+        if not os.path.isfile(entry):
+            return False
+
+        link_or_copy(entry, dest_path)
+
+        # Mark the entry as recently used for eviction
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+        return True
+
+    def store(self, key, src_path):
+        """
+        Adds a baked map to the cache. Old entries are evicted once the running size of the cache
+        goes over its limit, so storing a map doesn't walk the whole cache.
+        """
+        entry = self.entry_path(key)
+        os.makedirs(os.path.dirname(entry), exist_ok=True)
+
+        # Copy to a temporary name first so other machines never see a half-written entry
+        temp_path = f"{entry}.{uuid.uuid4().hex}.tmp"
+        shutil.copyfile(src_path, temp_path)
+        replaced_size = os.path.getsize(entry) if os.path.exists(entry) else 0
+        os.replace(temp_path, entry)
+
+        if self.directory not in _cache_sizes:
+            self.evict()
+            return
+        _cache_sizes[self.directory] += os.path.getsize(entry) - replaced_size
+        if _cache_sizes[self.directory] > self.max_size:
+            self.evict()
+
+    def evict(self):
+        """
+        Removes the least recently used entries until the cache fits in its size limit, and
+        records the size left. Entries stored by other machines are counted here too.
+        """
+        entries = []
+        total_size = 0
+        for root, _dirs, files in os.walk(self.directory):
+            for name in files:
+                if not name.endswith(".png"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue  # Removed by another machine
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total_size += stat.st_size
+
+        if total_size > self.max_size:
+            for _mtime, size, path in sorted(entries):
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total_size -= size
+                if total_size <= self.max_size:
+                    break
+        _cache_sizes[self.directory] = total_size
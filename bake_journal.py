@@ -0,0 +1,111 @@
+"""Durable journal of bake jobs, so an interrupted bake resumes where it stopped.
+
+Every (object, map) job is appended to a JSON Lines file as pending, done or failed, and each record
+is flushed to disk before the bake moves on. A done record holds the output file and its content
+hash, so a resumed bake only reuses outputs that are still on disk unchanged. Records also carry
+the job key of the object, a hash of everything the bake depends on, so records of an older state of
+an object are never reused. Object-level records (map '*') mark whole objects as done or failed.
+"""
+
+import json
+import os
+import time
+import uuid
+
+from . import bake_cache
+
+# Map name of records about a whole object
+OBJECT_JOB = "*"
+
+# File name suffix of the journal, next to the bake folder
+JOURNAL_SUFFIX = "_journal.jsonl"
+
+
+def journal_path(save_dir):
+    """Returns the path of the journal belonging to a bake folder."""
+    return os.path.normpath(save_dir) + JOURNAL_SUFFIX
+
+
+class BakeJournal:
+    """An append-only journal file and the latest record of every job in it."""
+
+    def __init__(self, path):
+        self.path = path
+        self.jobs = {}
+        line_count = self._load()
+
+        # Superseded records are dropped once they make up most of the file
+        if line_count > 2 * len(self.jobs) + 1000:
+            self._compact()
+        self._file = open(self.path, 'a', encoding='utf-8')
+
+        # Terminate a record cut short by a crash, so the next record starts on its own line
+        if self._file.tell() > 0:
+            with open(self.path, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    self._file.write("\n")
+
+    def _load(self):
+        """Replays the journal file. Returns the number of records read."""
+        if not os.path.isfile(self.path):
+            return 0
+
+        line_count = 0
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # A record cut short by a crash
+                self.jobs[(entry['object'], entry['map'])] = entry
+                line_count += 1
+        return line_count
+
+    def _compact(self):
+        """Rewrites the journal with only the latest record of every job."""
+        temp_path = f"{self.path}.{uuid.uuid4().hex}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            for entry in self.jobs.values():
+                f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+
+    def record(self, object_name, map_type, status, job_key, output=None, error=None):
+        """Appends a job record and makes sure it reached the disk before returning."""
+        entry = {'object': object_name, 'map': map_type, 'status': status, 'key': job_key, 'time': time.time()}
+        if output:
+            entry['output'] = output
+            entry['hash'] = bake_cache.hash_file(output)
+        if error:
+            entry['error'] = error
+
+        self._file.write(json.dumps(entry) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.jobs[(object_name, map_type)] = entry
+
+    def done_output(self, object_name, map_type, job_key):
+        """
+        Returns the output of a job finished for the same job key: its path if the file is still
+        unchanged, '' if the job had no output, or None if the job has to run (again).
+        """
+        entry = self.jobs.get((object_name, map_type))
+        if not entry or entry['status'] != 'done' or entry['key'] != job_key:
+            return None
+
+        output = entry.get('output')
+        if not output:
+            return ''
+        if not os.path.isfile(output) or bake_cache.hash_file(output) != entry.get('hash'):
+            return None
+        return output
+
+    def is_quarantined(self, object_name, job_key):
+        """Checks whether the object failed to bake in an earlier run, in its current state."""
+        entry = self.jobs.get((object_name, OBJECT_JOB))
+        return bool(entry) and entry['status'] == 'failed' and entry['key'] == job_key
+
+    def close(self):
+        self._file.close()
@@ -0,0 +1,154 @@
+"""Headless batch entry point, for farms and the command line.
+
+Runs the conversion and the bake on a .blend file without any window or 3D View:
+
+    blender -b scene.blend --python-expr "import assetify.batch; assetify.batch.run()" -- \
+        --collection "Moss" --resolution 2048 --samples 16 --output //baked_textures \
+        --maps BaseColor,Roughness,Normal,Curvature --results result.json --save
+
+('assetify' being the folder the add-on is installed in.) Arguments after '--' belong to Assetify.
+A JSON summary is written to --results, or printed on a single line starting with 'ASSETIFY_RESULT '
+when no results file is given. The exit code is 0 when everything succeeded, 1 when objects failed
+or an error occurred, and 2 for invalid arguments or a missing collection.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import sys
+import time
+import traceback
+
+import bpy
+
+# Prefix of the results line printed when no results file is given
+RESULT_PREFIX = "ASSETIFY_RESULT "
+
+RESOLUTIONS = ['512', '1024', '2048', '4096', '8192']
+
+
+def parse_args(argv=None):
+    """Parses the Assetify arguments, by default the ones after '--' on Blender's command line."""
+    if argv is None:
+        argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+
+    parser = argparse.ArgumentParser(prog="assetify", description="Convert and bake a collection without the UI.")
+    parser.add_argument("--collection", required=True, help="Name of the collection to convert")
+    add_setting_arguments(parser)
+    parser.add_argument("--no-convert", action="store_true", help="Only bake the game assets converted earlier")
+    parser.add_argument("--no-bake", action="store_true", help="Only convert the collection")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Predict the time, disk space and memory of the bake instead of baking")
+    parser.add_argument("--results", help="Path of the JSON results file")
+    parser.add_argument("--save", action="store_true", help="Save the .blend file afterwards")
+    return parser.parse_args(argv)
+
+
+def add_setting_arguments(parser):
+    """Adds the options overriding the scene's bake settings, see apply_settings."""
+    parser.add_argument("--resolution", choices=RESOLUTIONS, help="Resolution of the baked maps")
+    parser.add_argument("--samples", type=int, help="Cycles samples for baking")
+    parser.add_argument("--output", help="Folder for the baked maps, may be relative to the .blend file ('//')")
+    parser.add_argument("--maps", help="Comma-separated maps to produce, e.g. BaseColor,Normal,Curvature")
+
+
+def module_expression(module_name):
+    """
+    Returns the Python expression, for Blender's --python-expr, that imports a module of this add-on
+    from the folder it is installed in and calls its run(), to start Assetify in another Blender process.
+    """
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    parent_dir, package_name = os.path.split(package_dir)
+    return (f"import sys; sys.path.insert(0, {parent_dir!r}); "
+            f"import {package_name}.{module_name} as {module_name}; {module_name}.run()")
+
+
+def addon():
+    """Returns the Assetify package, registering it if the add-on isn't enabled yet."""
+    package = importlib.import_module(__package__)
+    if not hasattr(bpy.types.Scene, "mossify_bake_settings"):
+        package.register()
+    return package
+
+
+def apply_settings(package, settings, args):
+    """Copies the command-line options into the scene's bake settings. Raises ValueError for unknown maps."""
+    if args.resolution:
+        settings.bake_resolution = args.resolution
+    if args.samples:
+        settings.bake_samples = args.samples
+    if args.output:
+        settings.bake_folder = args.output
+
+    if args.maps:
+        requested = {name.strip() for name in args.maps.split(",") if name.strip()}
+        bake_maps = {item[0] for item in package.BAKE_MAP_ITEMS}
+        raster_maps = {item[0] for item in package.RASTER_MAP_ITEMS}
+        unknown = requested - bake_maps - raster_maps
+        if unknown:
+            raise ValueError(f"Unknown maps: {', '.join(sorted(unknown))}")
+        settings.bake_maps = requested & bake_maps
+        settings.raster_maps = requested & raster_maps
+
+
+def write_results(results, path=None):
+    """Writes the results as JSON to a file, or prints them on one prefixed line."""
+    if path:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    else:
+        print(RESULT_PREFIX + json.dumps(results), flush=True)
+
+
+def main(argv=None):
+    """Converts and bakes one collection as described by the arguments. Returns the exit code."""
+    start_time = time.time()
+    args = parse_args(argv)
+    package = addon()
+    scene = bpy.context.scene
+    settings = scene.mossify_bake_settings
+    results = {'blend_file': bpy.data.filepath, 'collection': args.collection, 'status': 'ok'}
+
+    def finish(status, exit_code, **extra):
+        results.update(extra)
+        results['status'] = status
+        results['elapsed'] = round(time.time() - start_time, 3)
+        write_results(results, args.results)
+        return exit_code
+
+    collection = bpy.data.collections.get(args.collection)
+    if collection is None:
+        return finish('error', 2, error=f"Collection '{args.collection}' not found")
+    try:
+        apply_settings(package, settings, args)
+    except ValueError as e:
+        return finish('error', 2, error=str(e))
+    settings.target_collection = collection
+
+    try:
+        if not args.no_convert:
+            outcome = package.duplicate_mossify_collection()
+            results['converted'] = outcome == {'FINISHED'}
+            results['preflight'] = [{'object': name, 'severity': severity, 'message': message}
+                                    for name, severity, message in package.preflight_results]
+            results['game_assets'] = len(package.game_assets(package.get_registry(scene)))
+
+        if args.dry_run:
+            results['estimate'] = package.estimate_bake(scene)
+        elif not args.no_bake:
+            results['bake'] = package.bake_game_assets(scene, bpy.path.abspath(settings.bake_folder))
+
+        if args.save:
+            bpy.ops.wm.save_mainfile()
+    except Exception as e:
+        return finish('error', 1, error=str(e), traceback=traceback.format_exc())
+
+    if results.get('bake', {}).get('quarantined'):
+        return finish('partial', 1)
+    return finish('ok', 0)
+
+
+def run(argv=None):
+    """Runs main and exits Blender with its exit code."""
+    sys.exit(main(argv))
@@ -0,0 +1,232 @@
+"""Predicts how long bake jobs take, calibrated from the timings of earlier bakes.
+
+A job is described by the bake method producing the map, the triangle count of the mesh, the
+resolution, the Cycles samples and the shader node count of the materials. Its time is modelled as
+a non-negative combination of a few cost terms (a fixed setup cost, the pixels, the path-traced
+samples, the shading work and the triangles), fitted per bake method by least squares over the
+recorded timings. Built-in defaults act as a prior, so the model is usable before any bake ran and
+follows the recorded timings as they accumulate.
+"""
+
+import json
+import os
+
+import numpy as np
+
+# Cost terms of the model, see job_features
+TERMS = ('setup', 'pixels', 'samples', 'shading', 'triangles')
+
+# Starting coefficients of each bake method, in seconds per unit of the terms they depend on.
+# Terms a method doesn't list are not fitted for it.
+DEFAULT_COEFFICIENTS = {
+    'DIFFUSE': {'setup': 1.0, 'pixels': 0.5, 'samples': 0.02, 'shading': 0.01, 'triangles': 2.0},
+    'ROUGHNESS': {'setup': 1.0, 'pixels': 0.5, 'samples': 0.02, 'shading': 0.01, 'triangles': 2.0},
+    'NORMAL': {'setup': 1.0, 'pixels': 0.5, 'samples': 0.02, 'shading': 0.005, 'triangles': 2.0},
+    'EMIT': {'setup': 1.0, 'pixels': 0.5, 'samples': 0.02, 'shading': 0.01, 'triangles': 2.0},
+    'RASTER': {'setup': 0.05, 'pixels': 1.5, 'triangles': 3.0},
+    'REPROJECT': {'setup': 0.1, 'pixels': 2.0, 'triangles': 2.0},
+    'FILL': {'setup': 0.05, 'pixels': 0.3},
+}
+
+# Method whose coefficients are used for methods without any
+FALLBACK_METHOD = 'DIFFUSE'
+
+# Weight of the defaults in the fit, in timings
+PRIOR_WEIGHT = 2.0
+
+# Only the most recent timings are used
+MAX_TIMINGS = 5000
+
+# Compressed size of a PNG map relative to its raw RGBA size
+PNG_RATIOS = {'Metallic': 0.002, 'Alpha': 0.05, 'BaseColor': 0.35, 'Normal': 0.45, 'Roughness': 0.25}
+DEFAULT_PNG_RATIO = 0.3
+
+# Memory of a Cycles bake per pixel (float RGBA bake buffer, result and byte image) and per triangle
+BAKE_BYTES_PER_PIXEL = 36
+BAKE_BYTES_PER_TRIANGLE = 300
+
+
+def job_features(job):
+    """
+    Returns the cost terms of a job, a dict with the TERMS keys, computed from the job's 'resolution',
+    'samples', 'nodes' and 'triangles'.
+    """
+    megapixels = int(job['resolution']) ** 2 / 1e6
+    samples = max(int(job.get('samples', 1)), 1)
+    return {
+        'setup': 1.0,
+        'pixels': megapixels,
+        'samples': megapixels * samples,
+        'shading': megapixels * samples * job.get('nodes', 0) / 10.0,
+        'triangles': job.get('triangles', 0) / 1e6,
+    }
+
+
+class CostModel:
+    """Coefficients of the cost terms per bake method."""
+
+    def __init__(self, coefficients=None):
+        self.coefficients = {method: dict(terms) for method, terms in DEFAULT_COEFFICIENTS.items()}
+        if coefficients:
+            self.coefficients.update(coefficients)
+
+    @classmethod
+    def fit(cls, timings, prior_weight=PRIOR_WEIGHT):
+        """Fits the coefficients of every method with timings, as a regularized non-negative least squares."""
+        by_method = {}
+        for timing in timings:
+            by_method.setdefault(timing['method'], []).append(timing)
+
+        coefficients = {}
+        for method, method_timings in by_method.items():
+            prior = DEFAULT_COEFFICIENTS.get(method, DEFAULT_COEFFICIENTS[FALLBACK_METHOD])
+            terms = [term for term in TERMS if term in prior]
+            features = np.array([[job_features(timing)[term] for term in terms] for timing in method_timings])
+            seconds = np.array([float(timing['seconds']) for timing in method_timings])
+            weights = _fit_non_negative(features, seconds, np.array([prior[term] for term in terms]), prior_weight)
+            coefficients[method] = dict(zip(terms, weights.tolist()))
+        return cls(coefficients)
+
+    def predict(self, job):
+        """Predicts the seconds a job takes. The job needs a 'method' besides the job_features inputs."""
+        coefficients = self.coefficients.get(job['method'], self.coefficients[FALLBACK_METHOD])
+        features = job_features(job)
+        return sum(weight * features[term] for term, weight in coefficients.items())
+
+
+def _fit_non_negative(features, seconds, prior, prior_weight):
+    """
+    Solves min |features @ w - seconds|^2 + prior_weight * |w - prior|^2 with w >= 0, by refitting
+    with the terms that came out negative pinned to zero.
+    """
+    active = np.ones(len(prior), dtype=bool)
+    weights = np.zeros(len(prior))
+    while active.any():
+        x = features[:, active]
+        lhs = x.T @ x + prior_weight * np.eye(active.sum())
+        rhs = x.T @ seconds + prior_weight * prior[active]
+        solution = np.linalg.solve(lhs, rhs)
+        if (solution >= 0).all():
+            weights[active] = solution
+            break
+        active[np.flatnonzero(active)[solution < 0]] = False
+    return weights
+
+
+def load_timings(path, limit=MAX_TIMINGS):
+    """Reads the most recent recorded timings, skipping lines cut short by a crash."""
+    if not os.path.isfile(path):
+        return []
+    timings = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                timings.append(json.loads(line))
+            except ValueError:
+                continue
+    return timings[-limit:]
+
+
+def record_timings(path, timings):
+    """Appends timings, dicts with the job inputs, 'method' and 'seconds', to the timings file."""
+    if not timings:
+        return
+    with open(path, 'a', encoding='utf-8') as f:
+        for timing in timings:
+            f.write(json.dumps(timing) + "\n")
+
+    # Keep the file from growing without bound
+    if os.path.getsize(path) > 400 * MAX_TIMINGS:
+        recent = load_timings(path)
+        with open(path, 'w', encoding='utf-8') as f:
+            for timing in recent:
+                f.write(json.dumps(timing) + "\n")
+
+
+def longest_first(jobs, model, inputs=None):
+    """
+    Orders jobs by predicted time, longest first, so parallel bakes don't end on a long job.
+    inputs(job) returns the model inputs of a job, by default the job itself.
+    """
+    if inputs is None:
+        return sorted(jobs, key=model.predict, reverse=True)
+    return sorted(jobs, key=lambda job: model.predict(inputs(job)), reverse=True)
+
+
+def disk_bytes(job):
+    """Estimates the size of the PNG file of a job's map."""
+    return int(int(job['resolution']) ** 2 * 4 * PNG_RATIOS.get(job.get('map'), DEFAULT_PNG_RATIO))
+
+
+def memory_bytes(job):
+    """Estimates the memory a job needs while it bakes."""
+    return int(int(job['resolution']) ** 2 * BAKE_BYTES_PER_PIXEL + job.get('triangles', 0) * BAKE_BYTES_PER_TRIANGLE)
+
+
+def estimate(jobs, model, workers=1):
+    """
+    Estimates a bake: the total predicted time, the wall time on the given number of workers when
+    jobs are handed out longest first, the disk usage and the peak memory of one worker.
+    """
+    predictions = sorted((model.predict(job) for job in jobs), reverse=True)
+    loads = [0.0] * max(workers, 1)
+    for seconds in predictions:
+        loads[loads.index(min(loads))] += seconds
+    return {
+        'jobs': len(jobs),
+        'seconds': sum(predictions),
+        'wall_seconds': max(loads),
+        'disk_bytes': sum(disk_bytes(job) for job in jobs),
+        'peak_memory_bytes': max((memory_bytes(job) for job in jobs), default=0),
+    }
+
+
+class EtaTracker:
+    """
+    Estimates the time left in a running bake from the predicted time of the unfinished items,
+    scaled by how the finished items compared to their predictions.
+    """
+
+    def __init__(self, predictions=None):
+        self.start(predictions or {}, 0.0)
+
+    def start(self, predictions, now):
+        self.pending = dict(predictions)
+        self.started = now
+        self.predicted_done = 0.0
+
+    def finish(self, key):
+        """Marks an item as baked, its time counts towards the calibration."""
+        self.predicted_done += self.pending.pop(key, 0.0)
+
+    def skip(self, key):
+        """Marks an item as done without baking, e.g. reused, so it doesn't count towards the calibration."""
+        self.pending.pop(key, None)
+
+    def remaining(self, now):
+        """Returns the estimated seconds left, or None once nothing is left."""
+        if not self.pending:
+            return None
+        predicted_left = sum(self.pending.values())
+        elapsed = now - self.started
+        if self.predicted_done > 0 and elapsed > 0:
+            return predicted_left * elapsed / self.predicted_done
+        return predicted_left
+
+
+def format_duration(seconds):
+    """Formats seconds as e.g. '1h 05m', '3m 20s' or '12s'."""
+    seconds = int(round(seconds))
+    if seconds >= 3600:
+        return f"{seconds // 3600}h {seconds % 3600 // 60:02d}m"
+    if seconds >= 60:
+        return f"{seconds // 60}m {seconds % 60:02d}s"
+    return f"{seconds}s"
+
+
+def format_bytes(size):
+    """Formats a byte count as e.g. '350 MB'."""
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024.0
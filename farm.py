@@ -0,0 +1,586 @@
+"""Distributed bake farm: a coordinator hands out (object, map) bake jobs to worker Blender processes.
+
+The coordinator plans the bake of a .blend file, snapshots it, and serves the jobs over TCP. Workers
+connect, receive the snapshot, bake whatever job they are given and send back the encoded texture
+with its timing. The coordinator writes the textures into the bake folder and applies them with
+apply_baked_textures once every map of an object has arrived.
+
+    blender -b scene.blend --python-expr "import assetify.farm; assetify.farm.run()" -- \\
+        coordinator --collection "Moss" --workers 4 --port 5890 --results farm.json --save
+
+    blender -b --python-expr "import assetify.farm; assetify.farm.run()" -- \\
+        worker --connect coordinator-host:5890 --token <token printed by the coordinator>
+
+--workers starts that many local workers; others may join from any host that can reach the port.
+Image textures of the snapshot are referenced by absolute path, so remote workers need them at the
+same paths. Jobs are handed out longest first, as predicted by the cost model, and when a worker runs
+out of new jobs it duplicates the oldest job still running on another worker, so a slow object
+doesn't stall the end of the bake; the first result of a job wins. The timings of the workers
+calibrate the coordinator's cost model.
+
+Every message is a 4-byte big-endian header length, a JSON header, and 'payload_size' bytes of
+binary payload (the snapshot or a texture).
+"""
+
+import argparse
+import collections
+import hashlib
+import hmac
+import json
+import os
+import queue
+import secrets
+import shutil
+import socket
+import socketserver
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import traceback
+
+import bpy
+
+from . import batch
+from . import cost_model
+
+# Prefix of the line announcing where the coordinator listens
+LISTEN_PREFIX = "ASSETIFY_FARM "
+
+# Length prefix of every message header
+HEADER_LENGTH = struct.Struct(">I")
+
+# Largest header accepted, anything bigger is a broken or hostile peer
+MAX_HEADER_SIZE = 1 << 20
+
+# Seconds a worker waits before asking again while every job is taken
+WAIT_INTERVAL = 0.5
+
+
+def send_message(sock, header, payload=b""):
+    """Sends a JSON header and an optional binary payload."""
+    header = dict(header, payload_size=len(payload))
+    data = json.dumps(header).encode()
+    sock.sendall(HEADER_LENGTH.pack(len(data)) + data)
+    if payload:
+        sock.sendall(payload)
+
+
+def recv_exactly(sock, size):
+    """Reads exactly size bytes. Raises ConnectionError if the peer hangs up first."""
+    chunks = bytearray()
+    while len(chunks) < size:
+        chunk = sock.recv(min(size - len(chunks), 1 << 20))
+        if not chunk:
+            raise ConnectionError("Connection closed by peer")
+        chunks += chunk
+    return bytes(chunks)
+
+
+def recv_message(sock, max_payload=None):
+    """
+    Receives one message. Returns its header and payload.
+    Payloads over max_payload bytes are refused before reading them, e.g. from a peer not yet authenticated.
+    """
+    (size,) = HEADER_LENGTH.unpack(recv_exactly(sock, HEADER_LENGTH.size))
+    if size > MAX_HEADER_SIZE:
+        raise ConnectionError(f"Message header of {size} bytes is too large")
+    header = json.loads(recv_exactly(sock, size))
+    payload_size = header.get('payload_size', 0)
+    if max_payload is not None and payload_size > max_payload:
+        raise ConnectionError(f"Message payload of {payload_size} bytes is too large")
+    payload = recv_exactly(sock, payload_size)
+    return header, payload
+
+
+def parse_address(address):
+    """Splits 'host:port' into a (host, port) tuple."""
+    host, _, port = address.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+class JobBoard:
+    """
+    The jobs of a farm bake and who is working on them. Safe to use from several threads.
+    A job is pending, running on one or more workers, finished, or failed for good.
+    """
+
+    def __init__(self, jobs, max_attempts=3, max_copies=2):
+        self.jobs = {job['id']: job for job in jobs}
+        self.pending = collections.deque(job['id'] for job in jobs)
+        self.running = {}  # Job id to {worker: start time}
+        self.finished = {}
+        self.failed = {}
+        self.attempts = collections.Counter()
+        self.max_attempts = max_attempts
+        self.max_copies = max_copies
+        self.lock = threading.Lock()
+
+    def next_job(self, worker):
+        """
+        Hands a job to the worker: the next pending one, or else a copy of the oldest running job
+        the worker isn't on yet. Returns None when there is nothing to hand out right now.
+        """
+        with self.lock:
+            now = time.time()
+            if self.pending:
+                job_id = self.pending.popleft()
+                self.running.setdefault(job_id, {})[worker] = now
+                return self.jobs[job_id]
+
+            # Work stealing: idle workers race the slowest jobs instead of waiting for them
+            candidates = [(min(starts.values()), job_id) for job_id, starts in self.running.items()
+                          if worker not in starts and len(starts) < self.max_copies]
+            if not candidates:
+                return None
+            _start, job_id = min(candidates)
+            self.running[job_id][worker] = now
+            return dict(self.jobs[job_id], stolen=True)
+
+    def finish(self, job_id, worker):
+        """
+        Records a worker's result. Returns the seconds the worker took, or None if the result
+        is stale because another copy of the job finished first.
+        """
+        with self.lock:
+            starts = self.running.get(job_id, {})
+            if worker not in starts:
+                return None
+            self.finished[job_id] = worker
+            del self.running[job_id]
+            return time.time() - starts[worker]
+
+    def fail(self, job_id, worker, error):
+        """
+        Records a worker's failure. The job is retried until it failed max_attempts times.
+        Returns True if the job failed for good.
+        """
+        with self.lock:
+            starts = self.running.get(job_id, {})
+            if starts.pop(worker, None) is None:
+                return False
+            self.attempts[job_id] += 1
+            if starts:
+                return False  # Another copy is still running
+            del self.running[job_id]
+            if self.attempts[job_id] < self.max_attempts:
+                self.pending.append(job_id)
+                return False
+            self.failed[job_id] = error
+            return True
+
+    def release(self, worker):
+        """
+        Counts the jobs of a worker that went away as failed attempts: a job that crashes Blender, e.g. by
+        running out of memory, would otherwise take down every worker it is handed to.
+        Returns the ids of the jobs that failed for good.
+        """
+        with self.lock:
+            job_ids = [job_id for job_id, starts in self.running.items() if worker in starts]
+        return [job_id for job_id in job_ids if self.fail(job_id, worker, "Worker lost")]
+
+    def is_done(self):
+        with self.lock:
+            return not self.pending and not self.running
+
+
+class FarmHandler(socketserver.BaseRequestHandler):
+    """Serves one worker connection. Never touches bpy, results go to the coordinator's queue."""
+
+    def handle(self):
+        farm = self.server.farm
+        sock = self.request
+        worker = None
+        try:
+            header, _payload = recv_message(sock, max_payload=0)
+            if header.get('type') != 'hello' or not hmac.compare_digest(str(header.get('token', '')), farm.token):
+                send_message(sock, {'type': 'refused', 'error': "Invalid token"})
+                return
+            worker = f"{header.get('worker') or 'worker'}@{self.client_address[0]}:{self.client_address[1]}"
+            farm.connected(worker, +1)
+            send_message(sock, {'type': 'blend', 'sha256': farm.snapshot_hash}, farm.snapshot)
+
+            while True:
+                header, payload = recv_message(sock)
+                kind = header.get('type')
+                if kind == 'next':
+                    job = farm.board.next_job(worker)
+                    if job is not None:
+                        send_message(sock, dict(job, type='job'))
+                    elif farm.board.is_done() or farm.stopping.is_set():
+                        send_message(sock, {'type': 'done'})
+                        return
+                    else:
+                        send_message(sock, {'type': 'wait', 'seconds': WAIT_INTERVAL})
+                elif kind == 'result':
+                    seconds = farm.board.finish(header['job'], worker)
+                    if seconds is not None:
+                        farm.results.put(('result', header, payload, worker, seconds))
+                    send_message(sock, {'type': 'ack', 'stale': seconds is None})
+                elif kind == 'failed':
+                    if farm.board.fail(header['job'], worker, header.get('error', "")):
+                        farm.results.put(('failed', header, b"", worker, None))
+                    send_message(sock, {'type': 'ack'})
+                else:
+                    raise ConnectionError(f"Unexpected message '{kind}'")
+        except (ConnectionError, OSError, ValueError) as e:
+            print(f"Assetify farm: lost {worker or self.client_address}: {e}", flush=True)
+        finally:
+            if worker:
+                for job_id in farm.board.release(worker):
+                    farm.results.put(('failed', {'job': job_id, 'error': "Worker lost while baking it"},
+                                      b"", worker, None))
+                farm.connected(worker, -1)
+
+
+class FarmServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class Farm:
+    """State shared between the coordinator and its connection threads."""
+
+    def __init__(self, board, snapshot, token):
+        self.board = board
+        self.snapshot = snapshot
+        self.snapshot_hash = hashlib.sha256(snapshot).hexdigest()
+        self.token = token
+        self.results = queue.Queue()
+        self.stopping = threading.Event()
+        self.workers = collections.Counter()
+        self._lock = threading.Lock()
+
+    def connected(self, worker, change):
+        with self._lock:
+            self.workers[worker] += change
+            if self.workers[worker] <= 0:
+                del self.workers[worker]
+
+    def worker_count(self):
+        with self._lock:
+            return len(self.workers)
+
+
+def save_snapshot(path):
+    """
+    Saves a copy of the open file for the workers. Relative image paths are written as absolute
+    paths, since the workers open the copy from somewhere else.
+    """
+    relative_paths = {}
+    for image in bpy.data.images:
+        if image.filepath_raw.startswith("//") and not image.library:
+            relative_paths[image] = image.filepath_raw
+            image.filepath_raw = bpy.path.abspath(image.filepath_raw)
+    try:
+        bpy.ops.wm.save_as_mainfile(filepath=path, copy=True, relative_remap=False, compress=True)
+    finally:
+        for image, filepath in relative_paths.items():
+            image.filepath_raw = filepath
+
+
+def worker_command(address, token, name, threads=0):
+    """Builds the command line of a local worker process."""
+    command = [bpy.app.binary_path, "-b"]
+    if threads:
+        command += ["-t", str(threads)]
+    return command + ["--python-expr", batch.module_expression("farm"), "--",
+                      "worker", "--connect", f"{address[0]}:{address[1]}", "--token", token, "--name", name]
+
+
+def plan_jobs(package, scene, save_dir, summary, workers=1):
+    """
+    Plans the bake of the scene as farm jobs, one per (object, map), longest first. Game-ready objects
+    don't need any baking and get their textures right away. Returns the jobs and the plan.
+    """
+    plan = package.plan_bake(scene)
+    if plan['status'] != 'PLANNED':
+        summary['status'] = plan['status']
+        return [], plan
+
+    resolution = scene.mossify_bake_settings.bake_resolution
+    registry = package.get_registry(scene)
+
+    # Jobs are single maps of single objects, coordinate refuses atlas bakes
+    jobs = []
+    for obj in plan['targets']:
+        if obj.type != 'MESH':
+            continue
+        if obj.data in plan['pass_through_data']:
+            package.pass_through_textures(obj, save_dir)
+            package.mark_baked(registry, plan['pairs_by_data'], obj)
+            summary['passed_through'].append(obj.name)
+            continue
+        for map_type, bake_type in package.maps_for_object(obj).items():
+            jobs.append({'object': obj.name, 'asset': package.asset_name(obj), 'map': map_type,
+                         'bake_type': bake_type, 'resolution': resolution,
+                         'cost': package.bake_job_inputs(obj, map_type, bake_type, resolution)})
+
+    model = package.bake_cost_model()
+    jobs = cost_model.longest_first(jobs, model, inputs=lambda job: job['cost'])
+    for job_id, job in enumerate(jobs):
+        job['id'] = job_id
+    summary['estimate'] = cost_model.estimate([job['cost'] for job in jobs], model, workers)
+    return jobs, plan
+
+
+def store_texture(package, job, payload, save_dir, written):
+    """Writes a texture received from a worker into the bake folder, sharing files with identical content."""
+    digest = hashlib.sha256(payload).hexdigest()
+    stored_path = written.get(digest)
+    if stored_path is None:
+        stored_path = os.path.join(save_dir, f"{job['asset']}_{job['map']}.png")
+        # The old file may be a hardlink into the bake cache, so never write through it
+        if os.path.exists(stored_path):
+            os.remove(stored_path)
+        with open(stored_path, 'wb') as f:
+            f.write(payload)
+        written[digest] = stored_path
+    package.baked_texture_paths[(job['asset'], job['map'])] = stored_path
+
+
+def coordinate(args):
+    """Converts and plans the bake, serves the jobs and applies the results. Returns the exit code."""
+    start_time = time.time()
+    package = batch.addon()
+    scene = bpy.context.scene
+    settings = scene.mossify_bake_settings
+    summary = {'blend_file': bpy.data.filepath, 'status': 'FINISHED', 'baked': [], 'passed_through': [],
+               'quarantined': [], 'jobs': [], 'stolen_jobs': 0}
+
+    def finish(exit_code, **extra):
+        summary.update(extra)
+        summary['elapsed'] = round(time.time() - start_time, 3)
+        batch.write_results(summary, args.results)
+        return exit_code
+
+    try:
+        batch.apply_settings(package, settings, args)
+    except ValueError as e:
+        return finish(2, status='ERROR', error=str(e))
+
+    # Jobs are single maps of single objects. Planning an atlas bake would record the atlas setting
+    # and mark its objects baked without any atlas being built
+    if settings.atlas_mode != 'OFF':
+        return finish(2, status='ERROR', error="The farm can't bake atlases, turn the Atlas setting off "
+                                               "or bake the file locally")
+    if args.collection:
+        collection = bpy.data.collections.get(args.collection)
+        if collection is None:
+            return finish(2, status='ERROR', error=f"Collection '{args.collection}' not found")
+        settings.target_collection = collection
+        package.duplicate_mossify_collection()
+
+    save_dir = bpy.path.abspath(settings.bake_folder)
+    os.makedirs(save_dir, exist_ok=True)
+    jobs, plan = plan_jobs(package, scene, save_dir, summary, max(args.workers, 1))
+    if not jobs:
+        if args.save:
+            bpy.ops.wm.save_mainfile()
+        return finish(0)
+
+    # Maps still missing per object, and objects with a map that failed for good
+    remaining = collections.Counter(job['object'] for job in jobs)
+    failed_objects = {}
+
+    work_dir = tempfile.mkdtemp(prefix="assetify_farm_")
+    processes = []
+    server = None
+    try:
+        snapshot_path = os.path.join(work_dir, "snapshot.blend")
+        save_snapshot(snapshot_path)
+        with open(snapshot_path, 'rb') as f:
+            farm = Farm(JobBoard(jobs, args.max_attempts, args.max_copies), f.read(), args.token or secrets.token_hex(16))
+
+        server = FarmServer((args.host, args.port), FarmHandler)
+        server.farm = farm
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        address = server.server_address[:2]
+        print(f"{LISTEN_PREFIX}{json.dumps({'host': address[0], 'port': address[1], 'token': farm.token})}", flush=True)
+
+        for i in range(args.workers):
+            processes.append(subprocess.Popen(worker_command(address, farm.token, f"local{i}", args.threads)))
+
+        # Results are applied here, on the main thread, since bpy is not thread safe
+        written = {}
+        timings = []
+        respawns = 0
+        registry = package.get_registry(scene)
+        while not (farm.board.is_done() and farm.results.empty()):
+            try:
+                kind, header, payload, worker, seconds = farm.results.get(timeout=0.5)
+            except queue.Empty:
+                # Local workers killed by a job are replaced, the job itself counts a failed attempt
+                for i, process in enumerate(processes):
+                    if (process.poll() not in (None, 0) and respawns < args.max_attempts * args.workers
+                            and not farm.board.is_done()):
+                        respawns += 1
+                        processes[i] = subprocess.Popen(worker_command(address, farm.token, f"local{i}",
+                                                                       args.threads))
+
+                # Give up when the local workers died and nobody else is connected
+                if (processes and all(process.poll() is not None for process in processes)
+                        and not farm.worker_count()):
+                    return finish(1, status='ERROR', error="All workers exited before the bake finished")
+                continue
+
+            job = farm.board.jobs[header['job']]
+            name = job['object']
+            if kind == 'failed':
+                print(f"Assetify farm: {job['map']} of {name} failed: {header.get('error')}", flush=True)
+                failed_objects.setdefault(name, header.get('error'))
+            else:
+                if header.get('has_output'):
+                    store_texture(package, job, payload, save_dir, written)
+                summary['jobs'].append({'object': name, 'map': job['map'], 'worker': worker,
+                                        'seconds': header.get('seconds'), 'wall_seconds': round(seconds, 3),
+                                        'stolen': bool(header.get('stolen'))})
+                summary['stolen_jobs'] += bool(header.get('stolen'))
+                if header.get('method') not in (None, 'CACHED'):
+                    timings.append(dict(job['cost'], method=header['method'], seconds=header.get('seconds')))
+
+            remaining[name] -= 1
+            if remaining[name]:
+                continue
+
+            # Every map of the object is in, give it the baked material
+            obj = bpy.data.objects.get(name)
+            if name in failed_objects or obj is None:
+                summary['quarantined'].append(name)
+                continue
+            package.finish_baked_object(obj, save_dir)
+            package.mark_baked(registry, plan['pairs_by_data'], obj)
+            summary['baked'].append(name)
+
+        farm.stopping.set()
+        package.record_bake_timings(timings)
+        if summary['baked']:
+            package.update_lods(summary['baked'])
+        if args.save:
+            bpy.ops.wm.save_mainfile()
+    except Exception as e:
+        return finish(1, status='ERROR', error=str(e), traceback=traceback.format_exc())
+    finally:
+        if server:
+            server.shutdown()
+            server.server_close()
+        for process in processes:
+            try:
+                process.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    summary['workers'] = sorted({entry['worker'] for entry in summary['jobs']})
+    return finish(1 if summary['quarantined'] else 0)
+
+
+def bake_job(package, job, out_dir):
+    """
+    Bakes one job in the worker. Returns how the map was made, see bake_map, and the encoded texture,
+    or None if the map has no output.
+    """
+    obj = bpy.data.objects[job['object']]
+    for other in bpy.context.selected_objects:
+        other.select_set(False)
+    bpy.context.view_layer.objects.active = obj
+    obj.select_set(True)
+
+    package.baked_texture_paths.pop((job['asset'], job['map']), None)
+    method = package.bake_map(obj, job['map'], job['bake_type'], job['resolution'], out_dir)
+    texture_path = package.baked_texture_paths.get((job['asset'], job['map']))
+    if not texture_path:
+        return method, None
+    with open(texture_path, 'rb') as f:
+        return method, f.read()
+
+
+def work(args):
+    """Bakes jobs from a coordinator until it has none left. Returns the exit code."""
+    package = batch.addon()
+    work_dir = tempfile.mkdtemp(prefix="assetify_worker_")
+    try:
+        with socket.create_connection(parse_address(args.connect)) as sock:
+            send_message(sock, {'type': 'hello', 'token': args.token, 'worker': args.name or socket.gethostname()})
+            header, payload = recv_message(sock)
+            if header.get('type') != 'blend':
+                print(f"Assetify farm: refused by the coordinator: {header.get('error')}", flush=True)
+                return 2
+            if hashlib.sha256(payload).hexdigest() != header.get('sha256'):
+                print("Assetify farm: the received .blend file is corrupt", flush=True)
+                return 1
+
+            snapshot_path = os.path.join(work_dir, "snapshot.blend")
+            with open(snapshot_path, 'wb') as f:
+                f.write(payload)
+            bpy.ops.wm.open_mainfile(filepath=snapshot_path)
+            out_dir = os.path.join(work_dir, "maps")
+            os.makedirs(out_dir)
+
+            while True:
+                send_message(sock, {'type': 'next'})
+                header, _payload = recv_message(sock)
+                if header['type'] == 'done':
+                    return 0
+                if header['type'] == 'wait':
+                    time.sleep(header.get('seconds', WAIT_INTERVAL))
+                    continue
+
+                start_time = time.perf_counter()
+                try:
+                    method, texture = bake_job(package, header, out_dir)
+                except Exception as e:
+                    traceback.print_exc()
+                    send_message(sock, {'type': 'failed', 'job': header['id'], 'error': str(e)})
+                else:
+                    send_message(sock, {'type': 'result', 'job': header['id'], 'has_output': texture is not None,
+                                        'method': method, 'seconds': round(time.perf_counter() - start_time, 3),
+                                        'stolen': header.get('stolen', False)}, texture or b"")
+                recv_message(sock)
+    except (ConnectionError, OSError) as e:
+        print(f"Assetify farm: lost the coordinator: {e}", flush=True)
+        return 1
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def parse_args(argv=None):
+    """Parses the farm arguments, by default the ones after '--' on Blender's command line."""
+    if argv is None:
+        argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+
+    parser = argparse.ArgumentParser(prog="assetify-farm", description="Bake game assets on several Blender processes.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    coordinator = commands.add_parser("coordinator", help="Serve the bake jobs of the open .blend file")
+    coordinator.add_argument("--collection", help="Convert this collection before baking")
+    batch.add_setting_arguments(coordinator)
+    coordinator.add_argument("--host", default="127.0.0.1", help="Address to listen on, 0.0.0.0 for other hosts")
+    coordinator.add_argument("--port", type=int, default=0, help="Port to listen on, by default any free port")
+    coordinator.add_argument("--token", help="Shared secret of the workers, generated if not given")
+    coordinator.add_argument("--workers", type=int, default=0, help="Local worker processes to start")
+    coordinator.add_argument("--threads", type=int, default=0, help="Threads per local worker")
+    coordinator.add_argument("--max-attempts", type=int, default=3, help="Failures before a job is given up on")
+    coordinator.add_argument("--max-copies", type=int, default=2, help="Workers that may run the same job at once")
+    coordinator.add_argument("--results", help="Path of the JSON results file")
+    coordinator.add_argument("--save", action="store_true", help="Save the .blend file afterwards")
+
+    worker = commands.add_parser("worker", help="Bake jobs served by a coordinator")
+    worker.add_argument("--connect", required=True, help="Address of the coordinator, as host:port")
+    worker.add_argument("--token", required=True, help="Shared secret printed by the coordinator")
+    worker.add_argument("--name", help="Name of this worker in the results")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.command == "coordinator":
+        return coordinate(args)
+    return work(args)
+
+
+def run(argv=None):
+    """Runs main and exits Blender with its exit code."""
+    sys.exit(main(argv))
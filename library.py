@@ -0,0 +1,174 @@
+"""Asset library driver: runs the Assetify pipeline on every .blend file of a directory.
+
+Runs outside Blender, with a plain Python interpreter, and starts one headless Blender process per
+file through the batch entry point, several at a time:
+
+    python library.py /path/to/library --blender /path/to/blender --collection "Moss" \
+        --resolution 2048 --maps BaseColor,Roughness,Normal --summary library_results.json
+
+Results are streamed as each file finishes, one JSON line per file on stdout (and in --stream if
+given), and a summary of the whole run is written to --summary at the end.
+"""
+
+import argparse
+import concurrent.futures
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+
+# Prefix of the results line printed by the batch entry point, see batch.RESULT_PREFIX
+RESULT_PREFIX = "ASSETIFY_RESULT "
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Convert and bake every .blend file of an asset library.")
+    parser.add_argument("library", help="Directory holding the .blend files, searched recursively")
+    parser.add_argument("--blender", default="blender", help="Blender executable")
+    parser.add_argument("--collection", required=True, help="Name of the collection to convert in each file")
+    parser.add_argument("--resolution", help="Resolution of the baked maps")
+    parser.add_argument("--samples", type=int, help="Cycles samples for baking")
+    parser.add_argument("--output", help="Bake folder, relative to each .blend file when it starts with '//'")
+    parser.add_argument("--maps", help="Comma-separated maps to produce")
+    parser.add_argument("--save", action="store_true", help="Save every .blend file after processing it")
+    parser.add_argument("--threads", type=int, default=4, help="Threads per Blender process")
+    parser.add_argument("--jobs", type=int, default=0,
+                        help="Blender processes running at once, by default the cores divided by --threads")
+    parser.add_argument("--timeout", type=float, default=0, help="Seconds before a file is given up on, 0 for none")
+    parser.add_argument("--logs", help="Folder for the console output of every Blender process")
+    parser.add_argument("--stream", help="JSON Lines file receiving each file's result as it finishes")
+    parser.add_argument("--summary", help="JSON file receiving the summary of the whole run")
+    return parser.parse_args(argv)
+
+
+def find_blend_files(library):
+    """Returns every .blend file below a directory, skipping Blender's numbered backups."""
+    blend_files = []
+    for root, dirs, files in os.walk(library):
+        dirs.sort()
+        for name in sorted(files):
+            if name.lower().endswith(".blend"):
+                blend_files.append(os.path.join(root, name))
+    return blend_files
+
+
+def batch_expression():
+    """
+    Python expression making Blender import this add-on's batch module and run it.
+    Same as batch.module_expression("batch"), which can't be imported here since this driver runs without bpy.
+    """
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    parent_dir, package_name = os.path.split(package_dir)
+    return (f"import sys; sys.path.insert(0, {parent_dir!r}); "
+            f"import {package_name}.batch as batch; batch.run()")
+
+
+def blender_command(args, blend_file, results_path):
+    """Builds the command line running the batch entry point on one .blend file."""
+    command = [args.blender, "-b", blend_file, "-t", str(args.threads), "--python-expr", batch_expression(),
+               "--", "--collection", args.collection, "--results", results_path]
+    for option in ("resolution", "samples", "output", "maps"):
+        value = getattr(args, option)
+        if value:
+            command += [f"--{option}", str(value)]
+    if args.save:
+        command.append("--save")
+    return command
+
+
+def process_file(args, blend_file, work_dir):
+    """Runs Blender on one file and returns its result, including crashes and timeouts."""
+    start_time = time.time()
+    results_path = os.path.join(work_dir, f"{uuid.uuid4().hex}.json")
+    command = blender_command(args, blend_file, results_path)
+
+    result = {'blend_file': blend_file}
+    try:
+        completed = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                   timeout=args.timeout or None)
+        output = completed.stdout.decode(errors='replace')
+        exit_code = completed.returncode
+    except subprocess.TimeoutExpired as e:
+        output = (e.stdout or b"").decode(errors='replace')
+        exit_code = None
+        result.update(status='timeout', error=f"No result after {args.timeout} seconds")
+    except OSError as e:
+        output = ""
+        exit_code = None
+        result.update(status='error', error=f"Could not start Blender: {e}")
+
+    if args.logs:
+        log_name = os.path.relpath(blend_file, args.library).replace(os.sep, "__") + ".log"
+        with open(os.path.join(args.logs, log_name), 'w', encoding='utf-8') as f:
+            f.write(output)
+
+    if os.path.isfile(results_path):
+        with open(results_path, encoding='utf-8') as f:
+            result.update(json.load(f))
+        os.remove(results_path)
+    else:
+        # Fall back to the results line, e.g. when the results file couldn't be written
+        for line in output.splitlines():
+            if line.startswith(RESULT_PREFIX):
+                result.update(json.loads(line[len(RESULT_PREFIX):]))
+        if 'status' not in result:
+            result.update(status='crashed', error=f"Blender exited with code {exit_code} without results",
+                          output_tail=output[-2000:])
+
+    result['exit_code'] = exit_code
+    result['wall_time'] = round(time.time() - start_time, 3)
+    return result
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    blend_files = find_blend_files(args.library)
+    jobs = args.jobs or max(1, (os.cpu_count() or 1) // max(args.threads, 1))
+    if args.logs:
+        os.makedirs(args.logs, exist_ok=True)
+
+    start_time = time.time()
+    counts = {}
+    failures = []
+    stream = open(args.stream, 'a', encoding='utf-8') if args.stream else None
+    try:
+        with tempfile.TemporaryDirectory(prefix="assetify_library_") as work_dir, \
+                concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as pool:
+            futures = [pool.submit(process_file, args, blend_file, work_dir) for blend_file in blend_files]
+            for future in concurrent.futures.as_completed(futures):
+                result = future.result()
+                status = result.get('status', 'error')
+                counts[status] = counts.get(status, 0) + 1
+                if status != 'ok':
+                    failures.append({key: result.get(key) for key in ('blend_file', 'status', 'error', 'exit_code')})
+
+                # Stream every result as soon as its file is done
+                line = json.dumps(result)
+                print(line, flush=True)
+                if stream:
+                    stream.write(line + "\n")
+                    stream.flush()
+    finally:
+        if stream:
+            stream.close()
+
+    summary = {
+        'library': os.path.abspath(args.library),
+        'files': len(blend_files),
+        'jobs': jobs,
+        'statuses': counts,
+        'failures': failures,
+        'elapsed': round(time.time() - start_time, 3),
+    }
+    if args.summary:
+        with open(args.summary, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2)
+    print(json.dumps(summary), file=sys.stderr)
+    return 0 if not failures else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
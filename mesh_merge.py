@@ -0,0 +1,76 @@
+"""Vectorized merging of meshes into one, for the merge-by-collection conversion mode.
+
+Meshes are handled as flat arrays, as read with foreach_get. Every part is moved into the space of
+the merged object and the arrays are concatenated with index offsets, so merging thousands of
+objects costs a few NumPy operations per object instead of an operator call.
+
+A part is a dict of arrays:
+    positions (V, 3), normals (L, 3) corner normals, loop_vertices (L,) vertex of each loop,
+    loop_starts (P,) and loop_totals (P,) of the polygons, material_indices (P,), smooth (P,),
+    uvs {name: (L, 2)}, point_colors {name: (V, 4)}, corner_colors {name: (L, 4)}.
+Every part of a merge has the same UV and color layer names.
+"""
+
+import numpy as np
+
+
+def reversed_loop_order(loop_starts, loop_totals):
+    """Returns the loop permutation that reverses the winding of every polygon."""
+    loop_starts = np.asarray(loop_starts, dtype=np.int64)
+    loop_totals = np.asarray(loop_totals, dtype=np.int64)
+    polygons = np.repeat(np.arange(len(loop_starts)), loop_totals)
+    first_loops = loop_starts[polygons]
+    return first_loops + loop_totals[polygons] - 1 - (np.arange(len(polygons)) - first_loops)
+
+
+def transform_part(part, matrix):
+    """
+    Returns a part moved by a 4x4 matrix. Normals follow the inverse transpose, and mirroring
+    matrices also reverse the winding, so faces keep facing outwards.
+    """
+    matrix = np.asarray(matrix, dtype=np.float64)
+    linear = matrix[:3, :3]
+    part = dict(part)
+    part['positions'] = np.asarray(part['positions'], dtype=np.float64) @ linear.T + matrix[:3, 3]
+
+    normals = np.asarray(part['normals'], dtype=np.float64) @ np.linalg.pinv(linear)
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    part['normals'] = normals / np.where(lengths > 0, lengths, 1.0)
+
+    if np.linalg.det(linear) < 0:
+        order = reversed_loop_order(part['loop_starts'], part['loop_totals'])
+        part['loop_vertices'] = np.asarray(part['loop_vertices'])[order]
+        part['normals'] = part['normals'][order]
+        part['uvs'] = {name: np.asarray(uvs)[order] for name, uvs in part['uvs'].items()}
+        part['corner_colors'] = {name: np.asarray(colors)[order] for name, colors in part['corner_colors'].items()}
+    return part
+
+
+def concatenate(parts):
+    """Merges parts into one, offsetting the vertex indices of the loops and the loop starts of the polygons."""
+    vertex_counts = np.array([len(part['positions']) for part in parts], dtype=np.int64)
+    loop_counts = np.array([len(part['loop_vertices']) for part in parts], dtype=np.int64)
+    vertex_offsets = np.cumsum(vertex_counts) - vertex_counts
+    loop_offsets = np.cumsum(loop_counts) - loop_counts
+
+    def joined(key, dtype):
+        return np.concatenate([np.asarray(part[key], dtype=dtype) for part in parts])
+
+    def joined_layers(key):
+        return {name: np.concatenate([np.asarray(part[key][name], dtype=np.float32) for part in parts])
+                for name in parts[0][key]}
+
+    return {
+        'positions': joined('positions', np.float64).reshape(-1, 3),
+        'normals': joined('normals', np.float64).reshape(-1, 3),
+        'loop_vertices': np.concatenate([np.asarray(part['loop_vertices'], dtype=np.int64) + offset
+                                         for part, offset in zip(parts, vertex_offsets)]),
+        'loop_starts': np.concatenate([np.asarray(part['loop_starts'], dtype=np.int64) + offset
+                                       for part, offset in zip(parts, loop_offsets)]),
+        'loop_totals': joined('loop_totals', np.int64),
+        'material_indices': joined('material_indices', np.int64),
+        'smooth': joined('smooth', bool),
+        'uvs': joined_layers('uvs'),
+        'point_colors': joined_layers('point_colors'),
+        'corner_colors': joined_layers('corner_colors'),
+    }
@@ -0,0 +1,111 @@
+"""Bulk mesh validation run before converting and baking.
+
+Statistics are computed from flat arrays pulled out of a mesh with foreach_get, so a whole object
+is checked with a handful of NumPy operations regardless of its size.
+"""
+
+import numpy as np
+
+from . import uv_raster
+
+# Resolution of the coverage grid used to estimate UV overlap
+UV_OVERLAP_RESOLUTION = 256
+
+# Share of the UV area that may overlap before it is reported
+UV_OVERLAP_LIMIT = 0.1
+
+
+def fan_triangles(loop_starts, loop_totals):
+    """
+    Splits every polygon into a fan of triangles. Returns the (T, 3) loop indices of the triangles
+    and the polygon index of each triangle.
+    """
+    loop_starts = np.asarray(loop_starts, dtype=np.int64)
+    tri_counts = np.maximum(np.asarray(loop_totals, dtype=np.int64) - 2, 0)
+    polygons = np.repeat(np.arange(len(loop_starts)), tri_counts)
+    if len(polygons) == 0:
+        return np.empty((0, 3), dtype=np.int64), polygons
+
+    # Position of each triangle within its polygon's fan
+    first_tri = np.cumsum(tri_counts) - tri_counts
+    fan_index = np.arange(len(polygons)) - first_tri[polygons]
+    starts = loop_starts[polygons]
+    triangles = np.stack([starts, starts + fan_index + 1, starts + fan_index + 2], axis=1)
+    return triangles, polygons
+
+
+def mesh_stats(positions, loop_starts, loop_totals, loop_edges, edge_count, polygon_areas, uvs=None):
+    """
+    Computes the preflight statistics of one mesh from its flat arrays: (V, 3) positions, per polygon
+    loop starts, loop totals and areas, per loop edge indices, and optional (L, 2) UVs.
+    """
+    positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+    loop_totals = np.asarray(loop_totals, dtype=np.int64)
+    polygon_areas = np.asarray(polygon_areas, dtype=np.float64)
+
+    stats = {
+        'faces': len(loop_totals),
+        'triangles': int(np.maximum(loop_totals - 2, 0).sum()),
+        'non_finite': bool(len(positions) and not np.isfinite(positions).all()),
+    }
+
+    # Faces without area, relative to the size of the object
+    if len(positions):
+        size = np.linalg.norm(np.nanmax(positions, axis=0) - np.nanmin(positions, axis=0))
+    else:
+        size = 0.0
+    stats['degenerate_faces'] = int((polygon_areas <= max(size * size * 1e-12, 1e-20)).sum())
+
+    # Loose edges belong to no face, non-manifold edges to more than two
+    edge_faces = np.bincount(np.asarray(loop_edges, dtype=np.int64), minlength=edge_count)
+    stats['wire_edges'] = int((edge_faces == 0).sum())
+    stats['non_manifold_edges'] = int((edge_faces > 2).sum())
+
+    stats['degenerate_uv_faces'] = 0
+    stats['uv_overlap'] = 0.0
+    if uvs is not None and stats['faces']:
+        uvs = np.asarray(uvs, dtype=np.float64).reshape(-1, 2)
+        triangles, polygons = fan_triangles(loop_starts, loop_totals)
+        corners = uvs[triangles]
+        edge_a = corners[:, 1] - corners[:, 0]
+        edge_b = corners[:, 2] - corners[:, 0]
+        tri_areas = 0.5 * np.abs(edge_a[:, 0] * edge_b[:, 1] - edge_a[:, 1] * edge_b[:, 0])
+        uv_areas = np.bincount(polygons, tri_areas, minlength=stats['faces'])
+        stats['degenerate_uv_faces'] = int((uv_areas <= 1e-12).sum())
+
+        # Compare the summed triangle area with the area they cover together on a coarse grid
+        total_area = tri_areas.sum()
+        if total_area > 0:
+            # Triangles on other UDIM-style tiles are moved into the unit square
+            corners = corners - np.floor(corners.min(axis=1, keepdims=True))
+            tri_ids, _weights = uv_raster.rasterize_barycentric(corners, UV_OVERLAP_RESOLUTION, UV_OVERLAP_RESOLUTION)
+            covered = (tri_ids >= 0).sum() / float(UV_OVERLAP_RESOLUTION * UV_OVERLAP_RESOLUTION)
+            stats['uv_overlap'] = float(max(0.0, 1.0 - covered / total_area))
+    return stats
+
+
+def mesh_issues(stats, max_triangles):
+    """
+    Turns mesh statistics into problems, as (severity, message) tuples.
+    'ERROR' problems break conversion or baking, 'WARNING' problems only degrade the result.
+    """
+    issues = []
+    if stats['faces'] == 0:
+        issues.append(('ERROR', "has no faces"))
+    if stats['non_finite']:
+        issues.append(('ERROR', "has non-finite vertex coordinates"))
+    if stats['triangles'] > max_triangles:
+        issues.append(('ERROR', f"has {stats['triangles']} triangles, more than the limit of {max_triangles}"))
+    if stats['faces'] and stats['degenerate_faces'] == stats['faces']:
+        issues.append(('ERROR', "only has zero-area faces"))
+    elif stats['degenerate_faces']:
+        issues.append(('WARNING', f"has {stats['degenerate_faces']} zero-area faces"))
+    if stats['wire_edges']:
+        issues.append(('WARNING', f"has {stats['wire_edges']} loose edges"))
+    if stats['non_manifold_edges']:
+        issues.append(('WARNING', f"has {stats['non_manifold_edges']} edges shared by more than two faces"))
+    if stats['degenerate_uv_faces']:
+        issues.append(('WARNING', f"has {stats['degenerate_uv_faces']} faces with zero UV area"))
+    if stats['uv_overlap'] > UV_OVERLAP_LIMIT:
+        issues.append(('WARNING', f"has about {stats['uv_overlap']:.0%} overlapping UV area"))
+    return issues
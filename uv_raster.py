@@ -0,0 +1,306 @@
+"""Vectorized UV-space triangle rasterizer for maps derived from the mesh alone.
+
+Triangles are given by their UV corners and per-corner values, and are drawn into an image whose
+rows run bottom to top, like Blender's image pixels. Triangles are grouped by the size of their
+pixel bounding box, so every group is rasterized with a single set of NumPy operations over a
+fixed-size pixel grid instead of a Python loop per triangle.
+"""
+
+import numpy as np
+
+# Upper bound on pixels tested at once, to keep the temporary arrays small: about 100 MB at 1 << 20
+MAX_BATCH_PIXELS = 1 << 20
+
+# Barycentric tolerance, so pixel centers on a shared edge are covered by at least one triangle
+EDGE_EPSILON = 1e-6
+
+
+def _bucket_size(extent):
+    """Rounds bounding box extents up to a power of two, so triangles of similar size share a batch."""
+    return 1 << np.ceil(np.log2(np.maximum(extent, 1))).astype(np.int64)
+
+
+def rasterize_barycentric(uvs, width, height):
+    """
+    Finds the triangle covering each pixel of a (height, width) image.
+    uvs is (T, 3, 2) UV corners. Returns the index of the covering triangle per pixel, -1 where no
+    triangle covers it, and the (height, width, 3) barycentric weights of the pixel center in it.
+    """
+    uvs = np.asarray(uvs, dtype=np.float64).reshape(-1, 3, 2)
+    tri_ids = np.full((height, width), -1, dtype=np.int32)
+    weights = np.zeros((height, width, 3), dtype=np.float32)
+    if len(uvs) == 0:
+        return tri_ids, weights
+
+    # Triangle corners in pixel units, pixel (x, y) has its center at (x + 0.5, y + 0.5)
+    corners = uvs * np.array([width, height], dtype=np.float64) - 0.5
+
+    # Barycentric setup, degenerate triangles in UV space cover no pixels
+    a, b, c = corners[:, 0], corners[:, 1], corners[:, 2]
+    area = (b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1]) - (c[:, 0] - a[:, 0]) * (b[:, 1] - a[:, 1])
+    valid = np.abs(area) > 1e-12
+
+    # Pixel bounding boxes clipped to the image
+    low = np.clip(np.ceil(corners.min(axis=1)), 0, [width - 1, height - 1]).astype(np.int64)
+    high = np.clip(np.floor(corners.max(axis=1)), -1, [width - 1, height - 1]).astype(np.int64)
+    valid &= np.all(high >= low, axis=1)
+
+    indices = np.nonzero(valid)[0]
+    if len(indices) == 0:
+        return tri_ids, weights
+
+    bucket = _bucket_size(high[indices] - low[indices] + 1)
+    bucket_keys = bucket[:, 0] * (1 << 32) + bucket[:, 1]
+    order = np.argsort(bucket_keys, kind='stable')
+    indices, bucket, bucket_keys = indices[order], bucket[order], bucket_keys[order]
+    starts = np.flatnonzero(np.r_[True, bucket_keys[1:] != bucket_keys[:-1]])
+    ends = np.r_[starts[1:], len(indices)]
+
+    for start, end in zip(starts, ends):
+        box_width, box_height = bucket[start]
+        bucket_tris = indices[start:end]
+
+        # Grids larger than a batch are tested one tile of rows and columns at a time, so a triangle
+        # covering the whole image never needs temporary arrays the size of the image
+        tile_width = min(box_width, MAX_BATCH_PIXELS)
+        tile_height = min(box_height, max(1, MAX_BATCH_PIXELS // tile_width))
+        offsets_y, offsets_x = np.mgrid[0:tile_height, 0:tile_width]
+        offsets_x = offsets_x.ravel()
+        offsets_y = offsets_y.ravel()
+
+        # Triangles with small grids are tested together, as many as fit in a batch
+        step = max(1, MAX_BATCH_PIXELS // (tile_width * tile_height))
+        for tile_y in range(0, box_height, tile_height):
+            for tile_x in range(0, box_width, tile_width):
+                # Tiles past a triangle's own bounding box have nothing to test
+                tile_low = low[bucket_tris] + [tile_x, tile_y]
+                in_tile = np.all(tile_low <= high[bucket_tris], axis=1)
+                tile_tris, tile_low = bucket_tris[in_tile], tile_low[in_tile]
+                for batch_start in range(0, len(tile_tris), step):
+                    batch = slice(batch_start, batch_start + step)
+                    _rasterize_batch(tile_tris[batch], tile_low[batch, 0][:, None] + offsets_x[None, :],
+                                     tile_low[batch, 1][:, None] + offsets_y[None, :],
+                                     a, b, c, area, high, tri_ids, weights)
+
+    return tri_ids, weights
+
+
+def _rasterize_batch(tris, px, py, a, b, c, area, high, tri_ids, weights):
+    """Writes the triangle index and barycentric weights of the pixels (px, py) each triangle covers."""
+    ta, tb, tc = a[tris], b[tris], c[tris]
+    inv_area = 1.0 / area[tris][:, None]
+    w1 = ((px - ta[:, 0:1]) * (tc[:, 1:2] - ta[:, 1:2]) -
+          (tc[:, 0:1] - ta[:, 0:1]) * (py - ta[:, 1:2])) * inv_area
+    w2 = ((tb[:, 0:1] - ta[:, 0:1]) * (py - ta[:, 1:2]) -
+          (px - ta[:, 0:1]) * (tb[:, 1:2] - ta[:, 1:2])) * inv_area
+    w0 = 1.0 - w1 - w2
+
+    inside = ((w0 >= -EDGE_EPSILON) & (w1 >= -EDGE_EPSILON) & (w2 >= -EDGE_EPSILON) &
+              (px <= high[tris, 0][:, None]) & (py <= high[tris, 1][:, None]))
+    tri_index, pixel_index = np.nonzero(inside)
+    if len(tri_index) == 0:
+        return
+
+    target_y = py[tri_index, pixel_index]
+    target_x = px[tri_index, pixel_index]
+    tri_ids[target_y, target_x] = tris[tri_index]
+    weights[target_y, target_x] = np.stack([w0[tri_index, pixel_index], w1[tri_index, pixel_index],
+                                            w2[tri_index, pixel_index]], axis=1)
+
+
+def interpolate(corner_values, tris, weights):
+    """
+    Interpolates per-corner values (T, 3, channels) at a set of pixels, given the triangle index and
+    barycentric weights of each pixel. Returns a (pixels, channels) float32 array.
+    """
+    corner_values = np.asarray(corner_values, dtype=np.float32)
+    result = np.empty((len(tris), corner_values.shape[2]), dtype=np.float32)
+    step = max(1, MAX_BATCH_PIXELS // 4)
+    for start in range(0, len(tris), step):
+        chunk = slice(start, start + step)
+        result[chunk] = np.einsum('nk,nkc->nc', weights[chunk], corner_values[tris[chunk]])
+    return result
+
+
+def rasterize(uvs, values, width, height, background=(0.0, 0.0, 0.0, 1.0)):
+    """
+    Draws triangles into a (height, width, channels) float32 image.
+    uvs is (T, 3, 2) UV corners, values is (T, 3, channels) corner values, interpolated barycentrically.
+    Returns the image and a (height, width) mask of the pixels covered by a triangle.
+    """
+    values = np.asarray(values, dtype=np.float32)
+    channels = values.shape[2]
+
+    image = np.empty((height, width, channels), dtype=np.float32)
+    image[:] = np.asarray(background, dtype=np.float32)[:channels]
+
+    tri_ids, weights = rasterize_barycentric(uvs, width, height)
+    mask = tri_ids >= 0
+    image[mask] = interpolate(values, tri_ids[mask], weights[mask])
+    return image, mask
+
+
+def dilate(image, mask, margin):
+    """
+    Extends the covered pixels outwards by up to margin pixels, averaging the covered neighbours of
+    each newly filled pixel, so mipmaps and filtering don't bleed the background into UV islands.
+    Only the ring of pixels around the covered area is touched on each step.
+    Works in place and returns the image.
+    """
+    height, width = mask.shape
+    padded_mask = np.pad(mask, 1)
+    padded_image = np.pad(image, ((1, 1), (1, 1), (0, 0)))
+    neighbours = [(dy, dx) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dy or dx]
+
+    for _ in range(margin):
+        inner = padded_mask[1:-1, 1:-1]
+        touched = np.zeros_like(inner)
+        for dy, dx in neighbours:
+            touched |= padded_mask[1 + dy:1 + dy + height, 1 + dx:1 + dx + width]
+        ys, xs = np.nonzero(touched & ~inner)
+        if len(ys) == 0:
+            break
+
+        # Coordinates in the padded arrays
+        ys += 1
+        xs += 1
+        total = np.zeros((len(ys), image.shape[2]), dtype=np.float32)
+        count = np.zeros(len(ys), dtype=np.float32)
+        for dy, dx in neighbours:
+            covered = padded_mask[ys + dy, xs + dx]
+            total[covered] += padded_image[ys[covered] + dy, xs[covered] + dx]
+            count += covered
+
+        padded_image[ys, xs] = total / count[:, None]
+        padded_mask[ys, xs] = True
+
+    image[:] = padded_image[1:-1, 1:-1]
+    return image
+
+
+def vertex_curvature(positions, normals, edges):
+    """
+    Estimates a signed curvature per vertex from its edges: positive where neighbours fall below the
+    tangent plane (convex), negative where they rise above it (concave).
+    Returns values remapped to 0..1 with 0.5 meaning flat.
+    """
+    positions = np.asarray(positions, dtype=np.float64)
+    normals = np.asarray(normals, dtype=np.float64)
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    vertex_count = len(positions)
+    if len(edges) == 0:
+        return np.full(vertex_count, 0.5, dtype=np.float32)
+
+    v0, v1 = edges[:, 0], edges[:, 1]
+    delta = positions[v1] - positions[v0]
+    length_sq = np.maximum(np.einsum('ij,ij->i', delta, delta), 1e-12)
+
+    # Each edge contributes to both of its vertices
+    c0 = -np.einsum('ij,ij->i', normals[v0], delta) / length_sq
+    c1 = np.einsum('ij,ij->i', normals[v1], delta) / length_sq
+    total = np.bincount(v0, c0, vertex_count) + np.bincount(v1, c1, vertex_count)
+    count = np.bincount(v0, minlength=vertex_count) + np.bincount(v1, minlength=vertex_count)
+    curvature = total / np.maximum(count, 1)
+
+    # Normalize by a high percentile so a few sharp spikes don't flatten the rest of the map
+    scale = np.percentile(np.abs(curvature), 98) if vertex_count else 0.0
+    if scale <= 1e-12:
+        return np.full(vertex_count, 0.5, dtype=np.float32)
+    return (0.5 + 0.5 * np.clip(curvature / scale, -1.0, 1.0)).astype(np.float32)
+
+
+def id_colors(count):
+    """Returns count distinct RGB colors, spread around the hue circle by the golden ratio."""
+    hue = (np.arange(count) * 0.618033988749895) % 1.0
+    saturation, value = 0.75, 0.9
+    sector = np.floor(hue * 6.0).astype(np.int64) % 6
+    fraction = hue * 6.0 - np.floor(hue * 6.0)
+    p = np.full(count, value * (1.0 - saturation))
+    q = value * (1.0 - saturation * fraction)
+    t = value * (1.0 - saturation * (1.0 - fraction))
+    v = np.full(count, value)
+    choices = [
+        np.stack([v, t, p], axis=1), np.stack([q, v, p], axis=1), np.stack([p, v, t], axis=1),
+        np.stack([p, q, v], axis=1), np.stack([t, p, v], axis=1), np.stack([v, p, q], axis=1),
+    ]
+    colors = np.zeros((count, 3))
+    for i, choice in enumerate(choices):
+        colors[sector == i] = choice[sector == i]
+    return colors.astype(np.float32)
+
+
+def srgb_to_linear(values):
+    """Decodes sRGB encoded values to linear."""
+    values = np.asarray(values, dtype=np.float32)
+    return np.where(values <= 0.04045, values / 12.92,
+                    ((np.maximum(values, 0.0) + 0.055) / 1.055) ** 2.4).astype(np.float32)
+
+
+def linear_to_srgb(values):
+    """Encodes linear values as sRGB."""
+    values = np.maximum(np.asarray(values, dtype=np.float32), 0.0)
+    return np.where(values <= 0.0031308, values * 12.92,
+                    1.055 * values ** (1.0 / 2.4) - 0.055).astype(np.float32)
+
+
+def sample_texture(texture, uvs, interpolation='Linear', extension='REPEAT'):
+    """
+    Samples a (height, width, channels) texture at (N, 2) UV coordinates, with nearest ('Closest')
+    or bilinear filtering (every other interpolation), and REPEAT or EXTEND wrapping.
+    """
+    height, width = texture.shape[:2]
+    x = uvs[:, 0].astype(np.float64) * width - 0.5
+    y = uvs[:, 1].astype(np.float64) * height - 0.5
+
+    if extension == 'REPEAT':
+        def wrap(index, size):
+            return np.mod(index, size)
+    else:
+        def wrap(index, size):
+            return np.clip(index, 0, size - 1)
+
+    if interpolation == 'Closest':
+        return texture[wrap(np.floor(y + 0.5).astype(np.int64), height),
+                       wrap(np.floor(x + 0.5).astype(np.int64), width)]
+
+    x0 = np.floor(x)
+    y0 = np.floor(y)
+    fx = (x - x0).astype(np.float32)[:, None]
+    fy = (y - y0).astype(np.float32)[:, None]
+    x0 = x0.astype(np.int64)
+    y0 = y0.astype(np.int64)
+    x1, y1 = wrap(x0 + 1, width), wrap(y0 + 1, height)
+    x0, y0 = wrap(x0, width), wrap(y0, height)
+
+    return ((texture[y0, x0] * (1.0 - fx) + texture[y0, x1] * fx) * (1.0 - fy) +
+            (texture[y1, x0] * (1.0 - fx) + texture[y1, x1] * fx) * fy)
+
+
+def _normalized(vectors):
+    length = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.maximum(length, 1e-12)
+
+
+def retarget_normals(colors, normals, source_tangents, source_signs, target_tangents, target_signs):
+    """
+    Converts tangent-space normal map colors (N, 3+) from one tangent frame to another.
+    Both frames share the interpolated surface normals; tangents are (N, 3) and bitangent signs (N,).
+    Returns the colors in the target frame, encoded as 0..1 like a baked normal map.
+    """
+    normals = _normalized(np.asarray(normals, dtype=np.float64))
+
+    def frame(tangents, signs):
+        tangents = np.asarray(tangents, dtype=np.float64)
+        tangents = _normalized(tangents - normals * np.einsum('ij,ij->i', normals, tangents)[:, None])
+        bitangents = np.asarray(signs, dtype=np.float64)[:, None] * np.cross(normals, tangents)
+        return tangents, bitangents
+
+    source_t, source_b = frame(source_tangents, source_signs)
+    target_t, target_b = frame(target_tangents, target_signs)
+
+    vectors = np.asarray(colors, dtype=np.float64)[:, :3] * 2.0 - 1.0
+    surface = _normalized(source_t * vectors[:, 0:1] + source_b * vectors[:, 1:2] + normals * vectors[:, 2:3])
+    retargeted = np.stack([np.einsum('ij,ij->i', surface, target_t),
+                           np.einsum('ij,ij->i', surface, target_b),
+                           np.einsum('ij,ij->i', surface, normals)], axis=1)
+    return (retargeted * 0.5 + 0.5).astype(np.float32)